@@ -1,12 +1,57 @@
 """AI utilities for planning sequential moves."""
 
+from .anytime import AnytimeDecisionMaker
+from .budget import CancellationToken, SearchBudget
 from .decision_maker import NormalDecisionMaker
-from .planner import PlanResult, PlanningAI, PlanningBoardState, create_plan
+from .mcts import MCTSDecisionMaker, MCTSNode
+from .negamax import NegamaxDecisionMaker
+from .plan_cache import PlanCache
+from .parallel import ParallelRolloutExecutor, RootActionStats
+from .planner import (
+    CandidateAI,
+    PlanResult,
+    PlanningAI,
+    PlanningBoardState,
+    ReversibleBoardState,
+    create_plan,
+    create_plan_beam,
+    evaluator_scorer,
+    supports_undo,
+)
+from .service import PlanningService, ServiceStopped
+from .transposition import (
+    HashableBoardState,
+    TranspositionTable,
+    TTEntry,
+    ZobristHasher,
+    state_hash,
+)
 
 __all__ = [
+    "AnytimeDecisionMaker",
+    "CancellationToken",
+    "CandidateAI",
+    "HashableBoardState",
+    "MCTSDecisionMaker",
+    "MCTSNode",
+    "NegamaxDecisionMaker",
     "NormalDecisionMaker",
+    "ParallelRolloutExecutor",
+    "PlanCache",
     "PlanResult",
     "PlanningAI",
     "PlanningBoardState",
+    "PlanningService",
+    "ReversibleBoardState",
+    "RootActionStats",
+    "SearchBudget",
+    "ServiceStopped",
+    "TTEntry",
+    "TranspositionTable",
+    "ZobristHasher",
     "create_plan",
+    "create_plan_beam",
+    "evaluator_scorer",
+    "state_hash",
+    "supports_undo",
 ]
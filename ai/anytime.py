@@ -0,0 +1,115 @@
+"""Deadline-driven planning that always has a best plan ready."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import Callable, Generic, Optional, TypeVar
+
+from .budget import CancellationToken, SearchBudget
+from .planner import (
+    ActionScorer,
+    PlanResult,
+    PlanningAI,
+    PlanningBoardState,
+    _beam_levels,
+)
+from .transposition import TranspositionTable
+
+ActionT = TypeVar("ActionT")
+BoardStateT = TypeVar("BoardStateT", bound="PlanningBoardState[ActionT]")
+
+
+@dataclass
+class AnytimeDecisionMaker(Generic[ActionT, BoardStateT]):
+    """Decision maker that deepens its plan until a deadline or cancellation.
+
+    Each iteration extends the beam search of :func:`ai.planner.create_plan_beam`
+    one step deeper, resuming from the previous iteration's beam (a beam's depths do
+    not depend on the final depth, so nothing is scored twice). A plan is available
+    as soon as the first iteration finishes, and the deadline and cancellation
+    token are checked before every scored action, so the latency is bounded by
+    ``time_budget`` plus one scorer call however wide the board is.
+
+    Attributes:
+        ai: The AI supplying candidate actions.
+        scorer: Callable valuing an action in a state; defaults to the evaluator.
+        beam_width: Beam width of every iteration.
+        table: Optional transposition table caching action scores of hashable
+            board states, e.g. shared across turns.
+    """
+
+    ai: PlanningAI[ActionT, BoardStateT]
+    scorer: Optional[ActionScorer] = None
+    beam_width: int = 4
+    table: Optional[TranspositionTable] = None
+
+    def make_plan(
+        self,
+        board_state: BoardStateT,
+        max_steps: int,
+        time_budget: Optional[float] = None,
+        cancel: Optional[CancellationToken] = None,
+        node_budget: Optional[int] = None,
+        on_improvement: Optional[Callable[[PlanResult[ActionT, BoardStateT]], None]] = None,
+    ) -> PlanResult[ActionT, BoardStateT]:
+        """Deepen the plan one step at a time and return the deepest complete plan.
+
+        Args:
+            board_state: The starting board state; it is never mutated.
+            max_steps: Depth at which to stop deepening.
+            time_budget: Wall-clock limit in seconds.
+            cancel: Token another thread (or coroutine) may cancel to stop early.
+            node_budget: Maximum number of actions scored over all iterations.
+            on_improvement: Called with each new best plan as it is found.
+
+        Returns:
+            The plan of the deepest iteration that reached its full length. If not
+            even the first step finished, an empty plan on a clone of the board.
+        """
+
+        budget = SearchBudget(node_budget=node_budget, time_budget=time_budget, cancel=cancel)
+        best: Optional[PlanResult[ActionT, BoardStateT]] = None
+
+        beam = [(0.0, [], board_state.clone())]
+        levels = _beam_levels(
+            self.ai, beam, max_steps, self.beam_width, self.scorer, None, self.table, budget
+        )
+        for beam, complete in levels:
+            if not complete and best is not None:
+                break  # the budget cut this depth short; keep the deepest complete plan
+            total, actions, state = beam[0]
+            best = PlanResult(actions=list(actions), resulting_state=state.clone(), score=total)
+            if not complete:
+                break
+            if on_improvement is not None:
+                on_improvement(best)
+
+        if best is None:
+            return PlanResult(actions=[], resulting_state=board_state.clone())
+        return best
+
+    async def make_plan_async(
+        self,
+        board_state: BoardStateT,
+        max_steps: int,
+        time_budget: Optional[float] = None,
+        cancel: Optional[CancellationToken] = None,
+        node_budget: Optional[int] = None,
+    ) -> PlanResult[ActionT, BoardStateT]:
+        """Run :meth:`make_plan` in the loop's default executor.
+
+        Cancelling the awaiting task cancels the search too (the worker thread stops
+        at its next budget check) and re-raises :class:`asyncio.CancelledError`.
+        """
+
+        token = cancel or CancellationToken()
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(
+            None, self.make_plan, board_state, max_steps, time_budget, token, node_budget
+        )
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            token.cancel()
+            raise
@@ -0,0 +1,77 @@
+"""Node and wall-clock budgets shared by the search-based planners."""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+class CancellationToken:
+    """Thread-safe flag a caller sets to stop a running search early."""
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        """Ask every search watching this token to return its best result now."""
+
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether :meth:`cancel` has been called."""
+
+        return self._event.is_set()
+
+
+@dataclass
+class SearchBudget:
+    """Caps the work a search may do before it must return its best result.
+
+    Attributes:
+        node_budget: Maximum number of nodes (scored or simulated actions) to
+            visit, or ``None`` for no limit.
+        time_budget: Wall-clock limit in seconds measured from construction (or
+            the last :meth:`restart`), or ``None`` for no limit.
+        cancel: Optional token that exhausts the budget as soon as it is cancelled.
+    """
+
+    node_budget: Optional[int] = None
+    time_budget: Optional[float] = None
+    cancel: Optional[CancellationToken] = None
+    nodes: int = field(default=0, init=False)
+    _deadline: Optional[float] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.restart()
+
+    def restart(self) -> None:
+        """Reset the node counter and start the clock again."""
+
+        self.nodes = 0
+        self._deadline = (
+            None if self.time_budget is None else time.monotonic() + self.time_budget
+        )
+
+    def charge(self, nodes: int = 1) -> None:
+        """Record that ``nodes`` more nodes have been visited."""
+
+        self.nodes += nodes
+
+    def remaining_time(self) -> Optional[float]:
+        """Seconds left before the deadline, or ``None`` when there is no deadline."""
+
+        if self._deadline is None:
+            return None
+        return max(0.0, self._deadline - time.monotonic())
+
+    def exhausted(self) -> bool:
+        """Return ``True`` once the node or time budget is used up or the search is cancelled."""
+
+        if self.cancel is not None and self.cancel.cancelled:
+            return True
+        if self.node_budget is not None and self.nodes >= self.node_budget:
+            return True
+        return self._deadline is not None and time.monotonic() >= self._deadline
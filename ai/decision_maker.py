@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Generic, TypeVar
+from typing import Generic, Optional, TypeVar
 
+from .plan_cache import PlanCache
 from .planner import PlanResult, PlanningAI, PlanningBoardState, create_plan
 
 ActionT = TypeVar("ActionT")
@@ -13,13 +14,27 @@ BoardStateT = TypeVar("BoardStateT", bound="PlanningBoardState[ActionT]")
 
 @dataclass
 class NormalDecisionMaker(Generic[ActionT, BoardStateT]):
-    """Decision maker that relies on :func:`ai.planner.create_plan` for planning."""
+    """Decision maker that relies on :func:`ai.planner.create_plan` for planning.
+
+    Attributes:
+        ai: The AI choosing every action of the plan.
+        plan_cache: Optional :class:`ai.plan_cache.PlanCache`; when given, last
+            turn's plan is continued while the live game follows it. Boards
+            without ``state_hash()``/``fingerprint()`` are always replanned unless
+            the cache tracks actions and every played action is passed to
+            :meth:`ai.plan_cache.PlanCache.observe`.
+    """
 
     ai: PlanningAI[ActionT, BoardStateT]
+    plan_cache: Optional[PlanCache[ActionT, BoardStateT]] = None
 
     def make_plan(
         self, board_state: BoardStateT, steps: int
     ) -> PlanResult[ActionT, BoardStateT]:
         """Produce a plan while keeping a cloned board state updated step-by-step."""
 
+        if self.plan_cache is not None:
+            return self.plan_cache.plan(
+                board_state, steps, lambda state, n: create_plan(self.ai, state, n)
+            )
         return create_plan(self.ai, board_state, steps)
@@ -0,0 +1,280 @@
+"""Monte Carlo Tree Search decision maker built on the planning protocols."""
+
+from __future__ import annotations
+
+import math
+import random
+from dataclasses import dataclass, field
+from typing import Any, Generic, List, Optional, TypeVar
+
+from .budget import SearchBudget
+from .transposition import TranspositionTable, cached_score, state_hash
+from .planner import (
+    ActionScorer,
+    PlanResult,
+    PlanningAI,
+    PlanningBoardState,
+    candidate_actions,
+    evaluator_scorer,
+    supports_undo,
+)
+
+ActionT = TypeVar("ActionT")
+BoardStateT = TypeVar("BoardStateT", bound="PlanningBoardState[ActionT]")
+
+
+@dataclass(eq=False)
+class MCTSNode(Generic[ActionT]):
+    """A node of the search tree, reached by playing ``action`` from its parent.
+
+    ``low`` and ``high`` bound the returns of the simulations through the node.
+    """
+
+    action: Optional[ActionT] = None
+    reward: float = 0.0
+    parent: Optional["MCTSNode[ActionT]"] = None
+    children: List["MCTSNode[ActionT]"] = field(default_factory=list)
+    untried: Optional[List[ActionT]] = None
+    visits: int = 0
+    value_sum: float = 0.0
+    low: float = math.inf
+    high: float = -math.inf
+    key: Any = None
+
+    @property
+    def mean_value(self) -> float:
+        """Average return of the simulations that went through this node."""
+
+        return self.value_sum / self.visits if self.visits else 0.0
+
+    def child_for(self, action: ActionT) -> Optional["MCTSNode[ActionT]"]:
+        """Return the child reached by ``action``, if it has been expanded."""
+
+        for child in self.children:
+            if child.action == action:
+                return child
+        return None
+
+
+def state_key(board_state: Any) -> Any:
+    """Return the state's hash or ``fingerprint()`` when available, used to validate tree reuse."""
+
+    position = state_hash(board_state)
+    if position is not None:
+        return position
+    fingerprint = getattr(board_state, "fingerprint", None)
+    return fingerprint() if callable(fingerprint) else None
+
+
+@dataclass
+class MCTSDecisionMaker(Generic[ActionT, BoardStateT]):
+    """Decision maker that plans with UCT Monte Carlo Tree Search.
+
+    Tree nodes expand the candidates of :func:`ai.planner.candidate_actions`; leaves
+    are completed to the planning horizon by ``rollout_policy`` (the planning AI by
+    default). Every simulated action is valued with ``scorer`` (the phase-aware
+    evaluator by default) and a simulation's return is the sum of those values.
+
+    Attributes:
+        ai: The AI supplying candidate actions.
+        rollout_policy: Policy used to play out simulations past the tree.
+        scorer: Callable valuing an action in a state.
+        iterations: Maximum number of simulations per search, or ``None``.
+        time_budget: Wall-clock limit in seconds per search, or ``None``.
+        exploration: UCT exploration constant applied to normalized values.
+        reuse_tree: Keep the subtree of the played action between turns.
+        seed: Seed for the candidate expansion order.
+        table: Optional transposition table caching action scores of hashable
+            board states across simulations and turns.
+    """
+
+    ai: PlanningAI[ActionT, BoardStateT]
+    rollout_policy: Optional[PlanningAI[ActionT, BoardStateT]] = None
+    scorer: ActionScorer = evaluator_scorer
+    iterations: Optional[int] = 200
+    time_budget: Optional[float] = None
+    exploration: float = math.sqrt(2.0)
+    reuse_tree: bool = True
+    seed: Optional[int] = None
+    table: Optional[TranspositionTable] = None
+    root: Optional[MCTSNode[ActionT]] = field(default=None, init=False, repr=False)
+    _root_key: Any = field(default=None, init=False, repr=False)
+    _advanced: bool = field(default=False, init=False, repr=False)
+    _rng: random.Random = field(init=False, repr=False)
+    _low: float = field(default=math.inf, init=False, repr=False)
+    _high: float = field(default=-math.inf, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.iterations is None and self.time_budget is None:
+            raise ValueError("MCTS needs an iteration or a time budget")
+        self._rng = random.Random(self.seed)
+
+    def _normalized(self, value: float) -> float:
+        if self._high <= self._low:
+            return 0.5
+        return (value - self._low) / (self._high - self._low)
+
+    def _select_child(self, node: MCTSNode[ActionT]) -> MCTSNode[ActionT]:
+        log_visits = math.log(max(1, node.visits))
+        return max(
+            node.children,
+            key=lambda child: self._normalized(child.mean_value)
+            + self.exploration * math.sqrt(log_visits / child.visits),
+        )
+
+    def _simulate(self, state: BoardStateT, steps: int, tokens: Optional[List[Any]]) -> None:
+        """Run one simulation on ``state``, recording undo tokens when ``tokens`` is a list."""
+
+        node = self.root
+        assert node is not None
+        path = [node]
+        total = 0.0
+        depth = 0
+
+        def play(action: ActionT) -> None:
+            token = state.apply_action(action)
+            if tokens is not None:
+                tokens.append(token)
+
+        # Selection: descend through fully expanded nodes.
+        while depth < steps and node.untried == [] and node.children:
+            node = self._select_child(node)
+            play(node.action)
+            total += node.reward
+            path.append(node)
+            depth += 1
+
+        # Expansion: add one untried candidate.
+        if depth < steps:
+            if node.untried is None:
+                node.untried = candidate_actions(self.ai, state)
+                self._rng.shuffle(node.untried)
+            if node.untried:
+                action = node.untried.pop()
+                reward = cached_score(self.table, self.scorer, state, action)
+                play(action)
+                child = MCTSNode(action=action, reward=reward, parent=node)
+                if self._root_key is not None:
+                    child.key = state_key(state)
+                node.children.append(child)
+                node = child
+                total += reward
+                path.append(node)
+                depth += 1
+
+        # Rollout: play out to the horizon with the rollout policy.
+        policy = self.rollout_policy or self.ai
+        while depth < steps:
+            action = policy.choose_action(state)
+            total += cached_score(self.table, self.scorer, state, action)
+            play(action)
+            depth += 1
+
+        # Backpropagation: every node on the path shares the simulation return.
+        self._low = min(self._low, total)
+        self._high = max(self._high, total)
+        for visited in path:
+            visited.visits += 1
+            visited.value_sum += total
+            visited.low = min(visited.low, total)
+            visited.high = max(visited.high, total)
+
+    def search(self, board_state: BoardStateT, steps: int) -> MCTSNode[ActionT]:
+        """Run simulations from ``board_state`` over a ``steps``-action horizon.
+
+        Reversible board states (see :class:`ai.planner.ReversibleBoardState`) are
+        cloned once and every simulation is undone in place; other states are cloned
+        per simulation.
+
+        Returns:
+            The root of the search tree.
+        """
+
+        key = state_key(board_state)
+        # Hashable boards must match the root's recorded key; keyless boards can
+        # only be trusted right after advance() re-rooted the tree.
+        reusable = key == self._root_key if key is not None else self._advanced
+        if self.root is None or not self.reuse_tree or not reusable:
+            self.root = MCTSNode()
+            self._low, self._high = math.inf, -math.inf
+        self._root_key = key
+        self._advanced = False
+
+        budget = SearchBudget(node_budget=self.iterations, time_budget=self.time_budget)
+        if supports_undo(board_state):
+            work = board_state.clone()
+            tokens: List[Any] = []
+            while not budget.exhausted():
+                self._simulate(work, steps, tokens)
+                while tokens:
+                    work.undo_action(tokens.pop())
+                budget.charge()
+        else:
+            while not budget.exhausted():
+                self._simulate(board_state.clone(), steps, None)
+                budget.charge()
+        return self.root
+
+    def advance(self, action: ActionT) -> None:
+        """Re-root the tree at the child reached by ``action`` once it has been played."""
+
+        child = self.root.child_for(action) if self.root is not None else None
+        if child is None:
+            self.root = None
+            self._root_key, self._advanced = None, False
+            return
+        child.parent = None
+        self.root = child
+        self._root_key = child.key
+        self._advanced = True
+        self._rebase(child)
+
+    def _rebase(self, root: MCTSNode[ActionT]) -> None:
+        """Drop the played action's reward from the subtree's returns and bounds.
+
+        Every simulation through ``root`` counted ``root.reward`` in its return; once
+        the action is played that value is sunk, so it is removed from the value sums
+        and return bounds. The normalization bounds become the new root's bounds: the
+        raw returns of exactly the simulations that survive, as backups compare them.
+        """
+
+        played = root.reward
+        root.reward = 0.0
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            node.value_sum -= played * node.visits
+            node.low -= played
+            node.high -= played
+            stack.extend(node.children)
+        self._low, self._high = root.low, root.high
+
+    def choose_action(self, board_state: BoardStateT) -> ActionT:
+        """Return the most visited root action for a one-step horizon search."""
+
+        return self.make_plan(board_state, steps=1).actions[0]
+
+    def make_plan(
+        self, board_state: BoardStateT, steps: int
+    ) -> PlanResult[ActionT, BoardStateT]:
+        """Search and return the most visited line, completed by the rollout policy."""
+
+        node = self.search(board_state, steps)
+        simulated_state = board_state.clone()
+        actions: List[ActionT] = []
+        score = 0.0
+
+        while len(actions) < steps and node.children:
+            node = max(node.children, key=lambda child: (child.visits, child.mean_value))
+            simulated_state.apply_action(node.action)
+            actions.append(node.action)
+            score += node.reward
+
+        policy = self.rollout_policy or self.ai
+        while len(actions) < steps:
+            action = policy.choose_action(simulated_state)
+            score += cached_score(self.table, self.scorer, simulated_state, action)
+            simulated_state.apply_action(action)
+            actions.append(action)
+
+        return PlanResult(actions=actions, resulting_state=simulated_state, score=score)
@@ -0,0 +1,223 @@
+"""Negamax alpha-beta lookahead for two-player (combat and positioning) decisions."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import Any, Dict, Generic, Hashable, List, Optional, Tuple, TypeVar
+
+from .budget import CancellationToken, SearchBudget
+from .transposition import TranspositionTable, state_hash
+from .planner import (
+    ActionScorer,
+    PlanResult,
+    PlanningAI,
+    PlanningBoardState,
+    candidate_actions,
+    evaluator_scorer,
+    supports_undo,
+)
+
+ActionT = TypeVar("ActionT")
+BoardStateT = TypeVar("BoardStateT", bound="PlanningBoardState[ActionT]")
+
+EXACT, LOWER, UPPER = "exact", "lower", "upper"
+
+
+class _SearchAborted(Exception):
+    """Raised inside the recursion when the budget runs out mid-iteration."""
+
+
+def _hashable(action: Any) -> Hashable:
+    try:
+        hash(action)
+        return action
+    except TypeError:
+        return repr(action)
+
+
+@dataclass
+class NegamaxDecisionMaker(Generic[ActionT, BoardStateT]):
+    """Adversarial lookahead with negamax, alpha-beta pruning and move ordering.
+
+    The board state is expected to pass the move to the other side after every
+    applied action (as a two-player combat or positioning exchange does), and
+    ``scorer`` values an action for the side making it. A line is worth the sum
+    of the mover's action values minus the opponent's, so each side maximizes
+    its own margin.
+
+    Candidates are ordered before expansion: the transposition table's best move
+    first, then the killer moves of the ply, then by the cheap ``scorer`` value
+    (which the search needs anyway) with history counts breaking ties. Search is
+    iteratively deepened up to ``max_depth``; when the node or time budget runs out
+    the result of the deepest completed iteration is returned.
+
+    Attributes:
+        ai: The AI supplying candidate actions for either side.
+        scorer: Callable valuing an action for the side to move.
+        max_depth: Maximum lookahead in plies.
+        node_budget: Maximum number of scored actions per search, or ``None``.
+        time_budget: Wall-clock limit in seconds per search, or ``None``.
+        ordering: Order moves before expanding them (disable to compare against
+            plain alpha-beta).
+        killers_per_ply: Number of killer moves remembered for every ply.
+        table: Optional transposition table caching searched positions of
+            hashable board states between iterations and turns.
+    """
+
+    ai: PlanningAI[ActionT, BoardStateT]
+    scorer: ActionScorer = evaluator_scorer
+    max_depth: int = 4
+    node_budget: Optional[int] = None
+    time_budget: Optional[float] = None
+    ordering: bool = True
+    killers_per_ply: int = 2
+    table: Optional[TranspositionTable] = None
+    nodes: int = field(default=0, init=False)
+    depth_reached: int = field(default=0, init=False)
+    _killers: List[List[Hashable]] = field(default_factory=list, init=False, repr=False)
+    _history: Dict[Hashable, int] = field(default_factory=dict, init=False, repr=False)
+    _budget: SearchBudget = field(default_factory=SearchBudget, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.max_depth < 1:
+            raise ValueError("max_depth must be at least 1")
+
+    def _ordered(
+        self, state: BoardStateT, ply: int, tt_move: Optional[Hashable]
+    ) -> List[Tuple[float, ActionT]]:
+        scored = []
+        for action in candidate_actions(self.ai, state):
+            if self._budget.exhausted():
+                raise _SearchAborted
+            self._budget.charge()
+            scored.append((float(self.scorer(state, action)), action))
+        if not self.ordering:
+            return scored
+        killers = self._killers[ply] if ply < len(self._killers) else []
+
+        def priority(item: Tuple[float, ActionT]) -> Tuple[bool, bool, float, int]:
+            key = _hashable(item[1])
+            return (key == tt_move, key in killers, item[0], self._history.get(key, 0))
+
+        return sorted(scored, key=priority, reverse=True)
+
+    def _remember_cutoff(self, action: ActionT, ply: int, depth: int) -> None:
+        key = _hashable(action)
+        self._history[key] = self._history.get(key, 0) + depth * depth
+        while len(self._killers) <= ply:
+            self._killers.append([])
+        killers = self._killers[ply]
+        if key not in killers:
+            killers.insert(0, key)
+            del killers[self.killers_per_ply:]
+
+    def _negamax(
+        self, state: BoardStateT, depth: int, alpha: float, beta: float, ply: int
+    ) -> Tuple[float, List[ActionT]]:
+        if depth == 0:
+            return 0.0, []
+
+        position = state_hash(state) if self.table is not None else None
+        tt_key = ("negamax", position) if position is not None else None
+        tt_move = None
+        if tt_key is not None:
+            entry = self.table.probe(tt_key)
+            if entry is not None:
+                tt_move = entry.best_action
+                if entry.depth >= depth and entry.data is not None:
+                    bound, line = entry.data
+                    if (
+                        bound == EXACT
+                        or (bound == LOWER and entry.score >= beta)
+                        or (bound == UPPER and entry.score <= alpha)
+                    ):
+                        return entry.score, list(line)
+
+        moves = self._ordered(state, ply, tt_move)
+        if not moves:
+            return 0.0, []
+
+        alpha_in = alpha
+        best, best_line = -math.inf, []
+        reversible = supports_undo(state)
+        for reward, action in moves:
+            if reversible:
+                token = state.apply_action(action)
+                try:
+                    child, line = self._negamax(state, depth - 1, reward - beta, reward - alpha, ply + 1)
+                finally:
+                    state.undo_action(token)
+            else:
+                child_state = state.clone()
+                child_state.apply_action(action)
+                child, line = self._negamax(child_state, depth - 1, reward - beta, reward - alpha, ply + 1)
+            value = reward - child
+            if value > best:
+                best, best_line = value, [action] + line
+            alpha = max(alpha, value)
+            if alpha >= beta:
+                self._remember_cutoff(action, ply, depth)
+                break
+
+        if tt_key is not None:
+            bound = UPPER if best <= alpha_in else LOWER if best >= beta else EXACT
+            self.table.store(
+                tt_key, best, depth, best_action=_hashable(best_line[0]), data=(bound, tuple(best_line))
+            )
+        return best, best_line
+
+    def search(
+        self, board_state: BoardStateT, cancel: Optional[CancellationToken] = None
+    ) -> Tuple[float, List[ActionT]]:
+        """Iteratively deepen from ``board_state`` and return (value, principal variation).
+
+        Reversible board states are cloned once and searched in place; others are
+        cloned per expanded action. The live board is never modified.
+        """
+
+        self._budget = SearchBudget(self.node_budget, self.time_budget, cancel)
+        self._killers = []
+        self.depth_reached = 0
+        value, line = 0.0, []
+        work = board_state.clone() if supports_undo(board_state) else board_state
+        for depth in range(1, self.max_depth + 1):
+            try:
+                value, line = self._negamax(work, depth, -math.inf, math.inf, 0)
+            except _SearchAborted:
+                break
+            self.depth_reached = depth
+            if not line:
+                break  # no moves: deeper searches cannot differ
+        self.nodes = self._budget.nodes
+        return value, line
+
+    def choose_action(self, board_state: BoardStateT) -> ActionT:
+        """Return the first move of the principal variation.
+
+        Falls back to the AI's own choice when not even a one-ply search fit in
+        the budget.
+        """
+
+        line = self.search(board_state)[1]
+        return line[0] if line else self.ai.choose_action(board_state)
+
+    def make_plan(
+        self,
+        board_state: BoardStateT,
+        steps: Optional[int] = None,
+        cancel: Optional[CancellationToken] = None,
+    ) -> PlanResult[ActionT, BoardStateT]:
+        """Search and return the principal variation (both sides' moves, alternating).
+
+        ``steps`` caps the returned line (the search depth is ``max_depth``). The
+        plan's ``score`` is the negamax value of the position for the side to move.
+        """
+
+        value, line = self.search(board_state, cancel)
+        if steps is not None:
+            line = line[:steps]
+        simulated_state = board_state.clone()
+        for action in line:
+            simulated_state.apply_action(action)
+        return PlanResult(actions=line, resulting_state=simulated_state, score=value)
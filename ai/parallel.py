@@ -0,0 +1,161 @@
+"""Process-parallel rollouts and root-parallel tree search."""
+
+from __future__ import annotations
+
+import dataclasses
+import os
+import pickle
+import random
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Generic, List, Optional, Sequence, TypeVar
+
+from .mcts import MCTSDecisionMaker
+
+ActionT = TypeVar("ActionT")
+ResultT = TypeVar("ResultT")
+
+RolloutFn = Callable[[Any, int], Any]
+
+
+def _run_rollouts(fn: RolloutFn, payload: bytes, seeds: Sequence[int]) -> List[Any]:
+    """Worker entry point: unpickle the state once and run one rollout per seed."""
+
+    state = pickle.loads(payload)
+    clone = getattr(state, "clone", None)
+    results = []
+    for seed in seeds:
+        random.seed(seed)
+        simulated = clone() if callable(clone) else pickle.loads(payload)
+        results.append(fn(simulated, seed))
+    return results
+
+
+def _search_tree(
+    template: MCTSDecisionMaker[Any, Any], payload: bytes, steps: int, seed: int
+) -> List[Any]:
+    """Worker entry point: grow one MCTS tree and return its root child statistics."""
+
+    random.seed(seed)
+    mcts = dataclasses.replace(template, seed=seed)
+    root = mcts.search(pickle.loads(payload), steps)
+    return [(child.action, child.visits, child.value_sum, child.reward) for child in root.children]
+
+
+@dataclass
+class RootActionStats(Generic[ActionT]):
+    """Root action statistics merged across independently searched trees."""
+
+    action: ActionT
+    visits: int = 0
+    value_sum: float = 0.0
+    reward: float = 0.0
+
+    @property
+    def mean_value(self) -> float:
+        """Average simulation return through this action over all trees."""
+
+        return self.value_sum / self.visits if self.visits else 0.0
+
+
+def _chunks(items: Sequence[int], count: int) -> List[Sequence[int]]:
+    size = max(1, -(-len(items) // max(1, count)))
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+class ParallelRolloutExecutor:
+    """Spread independent rollouts or MCTS trees over a pool of worker processes.
+
+    The board state is pickled once per call and shipped to each worker once with
+    its whole share of the work; workers clone it for every rollout. Rollout ``i``
+    always runs with seed ``base_seed + i`` (and tree ``i`` with the same seed), so
+    results do not depend on the number of workers.
+
+    Args:
+        max_workers: Number of worker processes. Defaults to ``os.cpu_count()``.
+        base_seed: Seed of the first rollout or tree.
+        mp_context: Optional :mod:`multiprocessing` context for the pool.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        base_seed: int = 0,
+        mp_context: Any = None,
+    ) -> None:
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.base_seed = base_seed
+        self._mp_context = mp_context
+        self._pool: Optional[Executor] = None
+
+    def _executor(self) -> Executor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers, mp_context=self._mp_context
+            )
+        return self._pool
+
+    def close(self) -> None:
+        """Shut the worker pool down."""
+
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self) -> "ParallelRolloutExecutor":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def map_rollouts(self, fn: RolloutFn, board_state: Any, count: int) -> List[Any]:
+        """Run ``fn(state_copy, seed)`` ``count`` times across the workers.
+
+        ``fn`` must be picklable (a module-level function). Results are returned in
+        seed order.
+        """
+
+        payload = pickle.dumps(board_state, protocol=pickle.HIGHEST_PROTOCOL)
+        seeds = list(range(self.base_seed, self.base_seed + count))
+        futures = [
+            self._executor().submit(_run_rollouts, fn, payload, chunk)
+            for chunk in _chunks(seeds, self.max_workers)
+        ]
+        results: List[Any] = []
+        for future in futures:
+            results.extend(future.result())
+        return results
+
+    def root_parallel_search(
+        self,
+        template: MCTSDecisionMaker[ActionT, Any],
+        board_state: Any,
+        steps: int,
+        trees: Optional[int] = None,
+    ) -> List[RootActionStats[ActionT]]:
+        """Grow ``trees`` independent MCTS trees and merge their root statistics.
+
+        Each tree is a copy of ``template`` (same budgets, scorer and policies) with
+        its own seed. Returns the merged root actions, most visited first.
+        """
+
+        payload = pickle.dumps(board_state, protocol=pickle.HIGHEST_PROTOCOL)
+        template = dataclasses.replace(template)  # drop any tree the template holds
+        futures = [
+            self._executor().submit(_search_tree, template, payload, steps, self.base_seed + i)
+            for i in range(trees or self.max_workers)
+        ]
+
+        merged: List[RootActionStats[ActionT]] = []
+        for future in futures:
+            for action, visits, value_sum, reward in future.result():
+                for stats in merged:
+                    if stats.action == action:
+                        break
+                else:
+                    stats = RootActionStats(action=action, reward=reward)
+                    merged.append(stats)
+                stats.visits += visits
+                stats.value_sum += value_sum
+        merged.sort(key=lambda stats: (stats.visits, stats.mean_value), reverse=True)
+        return merged
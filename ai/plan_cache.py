@@ -0,0 +1,192 @@
+"""Plan cache that reuses last turn's plan and replans only the invalidated suffix."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Generic, List, Optional, TypeVar
+
+from .mcts import state_key
+from .planner import PlanResult, PlanningBoardState
+
+ActionT = TypeVar("ActionT")
+BoardStateT = TypeVar("BoardStateT", bound="PlanningBoardState[ActionT]")
+
+Planner = Callable[[Any, int], PlanResult]
+
+
+@dataclass
+class _CachedPlan(Generic[ActionT, BoardStateT]):
+    actions: List[ActionT]
+    resulting_state: BoardStateT
+    keys: Optional[List[Any]]  # state key before every action and after the last
+    score: float
+
+
+@dataclass
+class PlanCache(Generic[ActionT, BoardStateT]):
+    """Keeps the last plan and continues it while the live game follows it.
+
+    Before planning, the live board is located on the cached plan: by state key
+    (``state_hash()`` or ``fingerprint()``) when the board exposes one. Boards
+    without a key are only matched when ``track_actions`` is set, by the actions
+    reported through :meth:`observe` since the plan was made; otherwise every
+    request on such a board is a full replan. The
+    still-valid remainder is reused and only the missing tail is planned, starting
+    from the cached ``resulting_state``. A full replan runs when the live game left
+    the plan, or when fewer than ``min_reuse`` cached actions would survive.
+    Every reuse rebases the cache at the live position, so observed actions and
+    state keys are matched from there on the next request.
+
+    The score of a partially reused plan covers only the replanned tail (per-step
+    scores of the cached part are not known).
+
+    Attributes:
+        min_reuse: Minimum number of reusable cached actions; below it the cache
+            falls back to a full replan.
+        track_actions: The caller reports every live action through
+            :meth:`observe`, so boards without a state key can be matched by the
+            played prefix. Leave unset unless every action is observed.
+    """
+
+    min_reuse: int = 1
+    track_actions: bool = False
+    requests: int = field(default=0, init=False)
+    full_replans: int = field(default=0, init=False)
+    partial_reuses: int = field(default=0, init=False)
+    reused_actions: int = field(default=0, init=False)
+    planned_actions: int = field(default=0, init=False)
+    planning_seconds: float = field(default=0.0, init=False)
+    _entry: Optional[_CachedPlan[ActionT, BoardStateT]] = field(default=None, init=False, repr=False)
+    _played: List[ActionT] = field(default_factory=list, init=False, repr=False)
+
+    def observe(self, action: ActionT) -> None:
+        """Report an action played in the live game (see ``track_actions``)."""
+
+        self._played.append(action)
+
+    def invalidate(self) -> None:
+        """Forget the cached plan; the next request replans fully."""
+
+        self._entry = None
+        self._played = []
+
+    def _position(self, board_state: BoardStateT) -> Optional[int]:
+        """Index into the cached plan matching the live board, or ``None`` when diverged."""
+
+        entry = self._entry
+        if entry is None:
+            return None
+        if entry.keys is not None:
+            key = state_key(board_state)
+            if key is not None:
+                try:
+                    return entry.keys.index(key)
+                except ValueError:
+                    return None
+        if not self.track_actions:
+            return None
+        played = self._played
+        if played == entry.actions[: len(played)]:
+            return len(played)
+        return None
+
+    def _run(self, planner: Planner, board_state: BoardStateT, steps: int) -> PlanResult:
+        start = time.perf_counter()
+        result = planner(board_state, steps)
+        self.planning_seconds += time.perf_counter() - start
+        self.planned_actions += len(result.actions)
+        return result
+
+    def _store(self, board_state: BoardStateT, result: PlanResult) -> None:
+        keys: Optional[List[Any]] = None
+        if state_key(board_state) is not None:
+            replay = board_state.clone()
+            keys = [state_key(replay)]
+            for action in result.actions:
+                replay.apply_action(action)
+                keys.append(state_key(replay))
+        self._entry = _CachedPlan(list(result.actions), result.resulting_state.clone(), keys, result.score)
+        self._played = []
+
+    def plan(
+        self, board_state: BoardStateT, steps: int, planner: Planner
+    ) -> PlanResult[ActionT, BoardStateT]:
+        """Return a ``steps``-action plan from ``board_state``, reusing the cached one if valid.
+
+        Args:
+            board_state: The live board (not modified).
+            steps: Number of actions in the returned plan.
+            planner: ``planner(board_state, steps) -> PlanResult`` used for full
+                replans and for extending a reused plan, e.g.
+                ``lambda state, n: create_plan(ai, state, n)``.
+        """
+
+        self.requests += 1
+        entry = self._entry
+        index = self._position(board_state)
+        remaining = len(entry.actions) - index if index is not None else 0
+        if index is None or min(remaining, steps) < self.min_reuse:
+            self.full_replans += 1
+            result = self._run(planner, board_state, steps)
+            self._store(board_state, result)
+            return result
+
+        self.partial_reuses += 1
+        reused = entry.actions[index : index + steps]
+        self.reused_actions += len(reused)
+        tail_steps = steps - len(reused)
+        if tail_steps:
+            # The whole remainder is reused: extend it from the cached resulting state.
+            tail = self._run(planner, entry.resulting_state, tail_steps)
+            actions = reused + list(tail.actions)
+            resulting_state, score = tail.resulting_state, tail.score
+            keys = None
+            if entry.keys is not None:
+                keys = entry.keys[index:] + self._tail_keys(entry.resulting_state, tail.actions)
+            # Rebase the cache at the live position so the next turn continues this line.
+            self._entry = _CachedPlan(actions, resulting_state.clone(), keys, score)
+        else:
+            score = entry.score if index == 0 else 0.0
+            if len(reused) == remaining:
+                resulting_state = entry.resulting_state.clone()
+            else:
+                resulting_state = board_state.clone()
+                for action in reused:
+                    resulting_state.apply_action(action)
+            actions = reused
+            if index:
+                keys = entry.keys[index:] if entry.keys is not None else None
+                self._entry = _CachedPlan(entry.actions[index:], entry.resulting_state, keys, score)
+        self._played = []
+        return PlanResult(actions=actions, resulting_state=resulting_state, score=score)
+
+    @staticmethod
+    def _tail_keys(state: Any, actions: List[Any]) -> List[Any]:
+        replay = state.clone()
+        keys = []
+        for action in actions:
+            replay.apply_action(action)
+            keys.append(state_key(replay))
+        return keys
+
+    @property
+    def reuse_rate(self) -> float:
+        """Share of requests served (at least partly) from the cached plan."""
+
+        return self.partial_reuses / self.requests if self.requests else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters plus an estimate of the planning time saved by reused actions."""
+
+        per_action = self.planning_seconds / self.planned_actions if self.planned_actions else 0.0
+        return {
+            "requests": self.requests,
+            "full_replans": self.full_replans,
+            "partial_reuses": self.partial_reuses,
+            "reuse_rate": self.reuse_rate,
+            "reused_actions": self.reused_actions,
+            "planned_actions": self.planned_actions,
+            "planning_seconds": self.planning_seconds,
+            "estimated_seconds_saved": per_action * self.reused_actions,
+        }
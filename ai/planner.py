@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Generic, List, Protocol, TypeVar
+from typing import Any, Callable, Generic, Iterator, List, Optional, Protocol, Sequence, Tuple, TypeVar
+
+from .budget import SearchBudget
+from .transposition import TranspositionTable, cached_score
 
 ActionT = TypeVar("ActionT")
 BoardStateT = TypeVar("BoardStateT", bound="PlanningBoardState[ActionT]")
@@ -19,6 +22,27 @@ class PlanningBoardState(Protocol[ActionT]):
         """Apply an action to mutate the board state."""
 
 
+class ReversibleBoardState(PlanningBoardState[ActionT], Protocol):
+    """Optional make/unmake extension of :class:`PlanningBoardState`.
+
+    ``apply_action`` returns an undo token and :meth:`undo_action` restores the state
+    it was applied to, so deep searches can walk one state in place instead of
+    cloning it for every simulated step.
+    """
+
+    def apply_action(self, action: ActionT) -> Any:
+        """Apply an action and return a token that can revert it."""
+
+    def undo_action(self, token: Any) -> None:
+        """Revert the action that produced ``token`` (tokens are undone LIFO)."""
+
+
+def supports_undo(board_state: Any) -> bool:
+    """Return ``True`` when the board state implements :class:`ReversibleBoardState`."""
+
+    return callable(getattr(board_state, "undo_action", None))
+
+
 class PlanningAI(Protocol[ActionT, BoardStateT]):
     """Protocol for AIs that pick actions based on a board state."""
 
@@ -26,12 +50,23 @@ class PlanningAI(Protocol[ActionT, BoardStateT]):
         """Return the next action to execute given the supplied board state."""
 
 
+class CandidateAI(PlanningAI[ActionT, BoardStateT], Protocol):
+    """Protocol for AIs that can also enumerate the actions worth considering."""
+
+    def candidate_actions(self, board_state: BoardStateT) -> Sequence[ActionT]:
+        """Return the candidate actions available in the supplied board state."""
+
+
+ActionScorer = Callable[[Any, Any], float]
+
+
 @dataclass
 class PlanResult(Generic[ActionT, BoardStateT]):
     """Result of creating a plan with an AI."""
 
     actions: List[ActionT]
     resulting_state: BoardStateT
+    score: float = 0.0
 
 
 def create_plan(
@@ -66,3 +101,147 @@ def create_plan(
 
     return PlanResult(actions=actions, resulting_state=simulated_state)
 
+
+def evaluator_scorer(board_state: Any, action: Any) -> float:
+    """Score an action with the phase-aware :func:`eclipse_ai.evaluator.evaluate_action`.
+
+    Only the expected VP is used, so the ``Score.details`` breakdown is skipped.
+    """
+
+    from eclipse_ai.evaluator import evaluate_action
+    from eclipse_ai.valuation.explain import explain_disabled
+
+    with explain_disabled():
+        return float(evaluate_action(board_state, action).expected_vp)
+
+
+def candidate_actions(ai: PlanningAI[ActionT, BoardStateT], board_state: BoardStateT) -> List[ActionT]:
+    """Return the AI's candidate actions, or just its chosen action if it cannot enumerate."""
+
+    enumerate_candidates = getattr(ai, "candidate_actions", None)
+    if callable(enumerate_candidates):
+        return list(enumerate_candidates(board_state))
+    return [ai.choose_action(board_state)]
+
+
+_Beam = List[Tuple[float, List[Any], Any]]
+
+
+def _beam_levels(
+    ai: PlanningAI[ActionT, BoardStateT],
+    beam: _Beam,
+    steps: int,
+    beam_width: int,
+    scorer: Optional[ActionScorer],
+    top_k: Optional[int],
+    table: Optional[TranspositionTable],
+    budget: SearchBudget,
+) -> Iterator[Tuple[_Beam, bool]]:
+    """Advance ``beam`` one depth at a time, yielding it with whether the depth finished.
+
+    The beam of a depth does not depend on the final depth, so iterative deepening
+    resumes from the last yielded beam instead of searching again from the root.
+    Yielded board states are advanced in place by the next depth; clone them to
+    keep them. Stops after ``steps`` depths, when no plan can be extended, or after
+    the depth during which the budget ran out (yielded as unfinished).
+    """
+
+    score_action = scorer or evaluator_scorer
+    expand = max(1, top_k if top_k is not None else beam_width)
+
+    for _ in range(steps):
+        # (total, actions, parent, expanded): finished plans are carried over as is.
+        expansions: List[Tuple[float, List[ActionT], int, bool]] = []
+        for parent, (total, actions, state) in enumerate(beam):
+            if budget.exhausted():
+                break
+            candidates = candidate_actions(ai, state)
+            if not candidates:
+                expansions.append((total, actions, parent, False))
+                continue
+            scored = []
+            for action in candidates:
+                if budget.exhausted():
+                    break
+                scored.append((cached_score(table, score_action, state, action), action))
+                budget.charge()
+            scored.sort(key=lambda item: item[0], reverse=True)
+            for value, action in scored[:expand]:
+                expansions.append((total + value, actions + [action], parent, True))
+        if not any(expanded for _, _, _, expanded in expansions):
+            break
+        expansions.sort(key=lambda item: item[0], reverse=True)
+
+        next_beam: List[Tuple[float, List[ActionT], BoardStateT, bool]] = []
+        claimed = set()
+        for total, actions, parent, expanded in expansions[: max(1, beam_width)]:
+            parent_state = beam[parent][2]
+            if parent in claimed:
+                child = parent_state.clone()
+            else:
+                claimed.add(parent)
+                child = parent_state
+            next_beam.append((total, actions, child, expanded))
+        # Parents handed over in place must be applied after their clones are taken.
+        for _, actions, child, expanded in next_beam:
+            if expanded:
+                child.apply_action(actions[-1])
+        beam = [(total, actions, child) for total, actions, child, _ in next_beam]
+        complete = not budget.exhausted()
+        yield beam, complete
+        if not complete:
+            break
+
+
+def create_plan_beam(
+    ai: PlanningAI[ActionT, BoardStateT],
+    board_state: BoardStateT,
+    steps: int,
+    beam_width: int = 4,
+    scorer: Optional[ActionScorer] = None,
+    *,
+    top_k: Optional[int] = None,
+    node_budget: Optional[int] = None,
+    time_budget: Optional[float] = None,
+    table: Optional[TranspositionTable] = None,
+    budget: Optional[SearchBudget] = None,
+) -> PlanResult[ActionT, BoardStateT]:
+    """Create a plan with a beam search over the AI's candidate actions.
+
+    At every depth each plan in the beam scores its candidate actions, expands the
+    ``top_k`` best of them on cloned board states, and the expansions are pruned back
+    to the ``beam_width`` plans with the highest cumulative score. Only surviving
+    plans are simulated, and the first survivor of each plan takes over its parent's
+    board state instead of cloning it. AIs that do not
+    implement :class:`CandidateAI` contribute a single candidate per state, which
+    reduces the search to :func:`create_plan` with scoring.
+
+    Args:
+        ai: The AI supplying candidate actions.
+        board_state: The starting board state; it is never mutated.
+        steps: The maximum number of actions in the plan.
+        beam_width: The number of partial plans kept after each depth.
+        scorer: Callable returning the value of applying an action in a state.
+            Defaults to :func:`evaluator_scorer`.
+        top_k: Candidates expanded per plan and depth. Defaults to ``beam_width``.
+        node_budget: Maximum number of actions scored before returning early.
+        time_budget: Wall-clock limit in seconds before returning early.
+        table: Optional transposition table caching action scores of hashable
+            board states, so transposed positions are not scored twice.
+        budget: A running :class:`SearchBudget` to charge instead of one built from
+            ``node_budget`` and ``time_budget``, e.g. shared across iterations.
+
+    Returns:
+        The :class:`PlanResult` with the highest cumulative score among the deepest
+        plans found within the budget. Plans reaching a state without candidates
+        stay in the beam, so a finished plan competes with longer ones.
+    """
+
+    if budget is None:
+        budget = SearchBudget(node_budget=node_budget, time_budget=time_budget)
+    beam: _Beam = [(0.0, [], board_state.clone())]
+    for beam, _ in _beam_levels(ai, beam, steps, beam_width, scorer, top_k, table, budget):
+        pass
+
+    total, actions, state = beam[0]
+    return PlanResult(actions=actions, resulting_state=state, score=total)
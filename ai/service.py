@@ -0,0 +1,312 @@
+"""Asyncio front end serving plans to many concurrent games."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional, Sequence, Set, Tuple
+
+from .planner import PlanResult
+
+PlanFn = Callable[[Any, int], PlanResult[Any, Any]]
+
+
+class ServiceStopped(RuntimeError):
+    """Raised to plan requests still queued when :meth:`PlanningService.stop` runs."""
+
+
+@dataclass
+class _PlanJob:
+    game_id: Hashable
+    board_state: Any
+    steps: int
+    future: "asyncio.Future[PlanResult[Any, Any]]"
+    submitted: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class _ScoreJob:
+    state: Any
+    actions: Sequence[Any]
+    base_scores: Sequence[Any]
+    future: "asyncio.Future[List[Any]]"
+
+
+class PlanningService:
+    """Serve plan requests from many games on a bounded worker pool.
+
+    * Backpressure: at most ``max_pending`` plan requests are admitted at once,
+      and at most ``max_pending_per_game`` from any one game; further
+      :meth:`request_plan` calls wait for a slot, so a busy game cannot take every
+      admission slot from the others.
+    * Fairness: admitted requests are queued per game and dispatched round-robin
+      across games, so a chatty table cannot starve the others.
+    * Batching: :meth:`score_actions` calls arriving within ``batch_window`` seconds
+      are valued together with
+      :func:`eclipse_ai.valuation.batch.apply_phase_valuation_many`, which scores
+      games sharing a round against one weight vector in a single pass.
+
+    Args:
+        planner: CPU-bound callable ``(board_state, steps) -> PlanResult``, e.g. a
+            decision maker's ``make_plan``. It runs on the worker pool.
+        max_workers: Number of plans computed concurrently.
+        max_pending: Maximum number of admitted (queued or running) plan requests.
+        max_pending_per_game: Maximum number of admitted plan requests per game;
+            defaults to half of ``max_pending`` (at least one).
+        executor: Worker pool to use; defaults to a thread pool of ``max_workers``.
+            A process pool works when the planner and states are picklable.
+        batch_window: Seconds to collect :meth:`score_actions` calls into a batch.
+        max_batch: Flush a valuation batch early once it holds this many calls.
+    """
+
+    def __init__(
+        self,
+        planner: PlanFn,
+        max_workers: int = 4,
+        max_pending: int = 256,
+        executor: Optional[Executor] = None,
+        batch_window: float = 0.002,
+        max_batch: int = 64,
+        max_pending_per_game: Optional[int] = None,
+    ) -> None:
+        self._planner = planner
+        self._max_workers = max_workers
+        self._max_pending = max_pending
+        self._max_pending_per_game = max_pending_per_game or max(1, max_pending // 2)
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(max_workers=max_workers)
+        self._batch_window = batch_window
+        self._max_batch = max_batch
+
+        self._queues: "OrderedDict[Hashable, Deque[_PlanJob]]" = OrderedDict()
+        self._pending_scores: List[_ScoreJob] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._dispatcher: Optional["asyncio.Task[None]"] = None
+        self._capacity: Optional[asyncio.Semaphore] = None
+        # Per-game admission slots; an entry lives while the game holds or awaits one.
+        self._game_slots: Dict[Hashable, Tuple[asyncio.Semaphore, int]] = {}
+        self._workers: Optional[asyncio.Semaphore] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._in_flight: Set["asyncio.Future[Any]"] = set()
+        self._stopping = False
+
+        self._started_at = 0.0
+        self._completed = 0
+        self._failed = 0
+        self._latency_total = 0.0
+        self._latency_max = 0.0
+        self._per_game: Dict[Hashable, int] = {}
+        self._batches = 0
+        self._batched_calls = 0
+
+    async def start(self) -> None:
+        """Start the dispatcher on the running event loop."""
+
+        if self._dispatcher is not None:
+            return
+        self._capacity = asyncio.Semaphore(self._max_pending)
+        self._workers = asyncio.Semaphore(self._max_workers)
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        self._started_at = time.monotonic()
+        self._dispatcher = asyncio.ensure_future(self._dispatch())
+
+    async def stop(self) -> None:
+        """Stop dispatching and release the worker pool if the service owns it.
+
+        Plans already running and valuation batches already collected are
+        completed; plan requests still queued or waiting for admission fail with
+        :class:`ServiceStopped`.
+        """
+
+        self._stopping = True
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            try:
+                await self._dispatcher
+            except asyncio.CancelledError:
+                pass
+            self._dispatcher = None
+        self._fail_queued()
+        if self._pending_scores:
+            self._flush_scores()
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+        if self._owns_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _fail_queued(self) -> None:
+        queues, self._queues = self._queues, OrderedDict()
+        for queue in queues.values():
+            for job in queue:
+                if not job.future.done():
+                    job.future.set_exception(ServiceStopped("planning service stopped"))
+                self._release(job.game_id)
+
+    async def __aenter__(self) -> "PlanningService":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.stop()
+
+    async def request_plan(
+        self, game_id: Hashable, board_state: Any, steps: int
+    ) -> PlanResult[Any, Any]:
+        """Queue a plan request for ``game_id`` and wait for its result."""
+
+        if self._dispatcher is None:
+            raise RuntimeError("PlanningService.start() has not been called")
+        assert self._wakeup is not None
+        await self._admit(game_id)
+        if self._stopping:
+            self._release(game_id)
+            raise ServiceStopped("planning service stopped")
+        job = _PlanJob(game_id, board_state, steps, asyncio.get_running_loop().create_future())
+        self._queues.setdefault(game_id, deque()).append(job)
+        self._wakeup.set()
+        return await job.future
+
+    async def _admit(self, game_id: Hashable) -> None:
+        assert self._capacity is not None
+        slots, users = self._game_slots.get(game_id) or (
+            asyncio.Semaphore(self._max_pending_per_game), 0
+        )
+        self._game_slots[game_id] = (slots, users + 1)
+        try:
+            await slots.acquire()
+        except BaseException:
+            self._drop_slot(game_id)
+            raise
+        try:
+            await self._capacity.acquire()
+        except BaseException:
+            slots.release()
+            self._drop_slot(game_id)
+            raise
+
+    def _release(self, game_id: Hashable) -> None:
+        if self._capacity is not None:
+            self._capacity.release()
+        self._game_slots[game_id][0].release()
+        self._drop_slot(game_id)
+
+    def _drop_slot(self, game_id: Hashable) -> None:
+        slots, users = self._game_slots[game_id]
+        if users > 1:
+            self._game_slots[game_id] = (slots, users - 1)
+        else:
+            del self._game_slots[game_id]
+
+    async def score_actions(
+        self, state: Any, actions: Sequence[Any], base_scores: Sequence[Any]
+    ) -> List[Any]:
+        """Value candidate actions with the phase-aware engine, batched across games."""
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending_scores.append(_ScoreJob(state, actions, base_scores, future))
+        if len(self._pending_scores) >= self._max_batch:
+            self._flush_scores()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                self._batch_window, self._flush_scores
+            )
+        return await future
+
+    def _flush_scores(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        jobs, self._pending_scores = self._pending_scores, []
+        if not jobs:
+            return
+        self._batches += 1
+        self._batched_calls += len(jobs)
+        loop = asyncio.get_running_loop()
+        requests = [(job.state, job.actions, job.base_scores) for job in jobs]
+        task = loop.run_in_executor(self._executor, _value_many, requests)
+        task.add_done_callback(lambda done: _resolve_scores(jobs, done))
+        self._track(task)
+
+    def _track(self, task: "asyncio.Future[Any]") -> None:
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    async def _next_job(self) -> _PlanJob:
+        assert self._wakeup is not None
+        while not self._queues:
+            self._wakeup.clear()
+            await self._wakeup.wait()
+        game_id, queue = next(iter(self._queues.items()))
+        job = queue.popleft()
+        del self._queues[game_id]
+        if queue:
+            self._queues[game_id] = queue  # back of the rotation
+        return job
+
+    async def _dispatch(self) -> None:
+        assert self._workers is not None
+        while True:
+            await self._workers.acquire()
+            job = await self._next_job()
+            self._track(asyncio.ensure_future(self._run(job)))
+
+    async def _run(self, job: _PlanJob) -> None:
+        assert self._workers is not None
+        loop = asyncio.get_running_loop()
+        try:
+            result = await loop.run_in_executor(
+                self._executor, self._planner, job.board_state, job.steps
+            )
+        except Exception as exc:  # surfaced to the requesting game
+            self._failed += 1
+            if not job.future.done():
+                job.future.set_exception(exc)
+        else:
+            latency = time.monotonic() - job.submitted
+            self._completed += 1
+            self._latency_total += latency
+            self._latency_max = max(self._latency_max, latency)
+            self._per_game[job.game_id] = self._per_game.get(job.game_id, 0) + 1
+            if not job.future.done():
+                job.future.set_result(result)
+        finally:
+            self._workers.release()
+            self._release(job.game_id)
+
+    def stats(self) -> Dict[str, Any]:
+        """Throughput (decisions per second), latency, queue and batching counters."""
+
+        elapsed = time.monotonic() - self._started_at if self._started_at else 0.0
+        return {
+            "decisions": self._completed,
+            "failed": self._failed,
+            "decisions_per_second": self._completed / elapsed if elapsed > 0 else 0.0,
+            "mean_latency_s": self._latency_total / self._completed if self._completed else 0.0,
+            "max_latency_s": self._latency_max,
+            "queued": sum(len(q) for q in self._queues.values()),
+            "per_game": dict(self._per_game),
+            "valuation_batches": self._batches,
+            "mean_batch_size": self._batched_calls / self._batches if self._batches else 0.0,
+        }
+
+
+def _value_many(requests: Sequence[Tuple[Any, Sequence[Any], Sequence[Any]]]) -> List[List[Any]]:
+    from eclipse_ai.valuation.batch import apply_phase_valuation_many
+
+    return apply_phase_valuation_many(requests)
+
+
+def _resolve_scores(jobs: Sequence[_ScoreJob], done: "asyncio.Future[List[List[Any]]]") -> None:
+    error = asyncio.CancelledError() if done.cancelled() else done.exception()
+    if error is not None:
+        for job in jobs:
+            if not job.future.done():
+                job.future.set_exception(error)
+        return
+    for job, scores in zip(jobs, done.result()):
+        if not job.future.done():
+            job.future.set_result(scores)
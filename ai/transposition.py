@@ -0,0 +1,189 @@
+"""Zobrist hashing support and a bounded transposition table for searches."""
+
+from __future__ import annotations
+
+import random
+import sys
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Protocol
+
+_MASK64 = (1 << 64) - 1
+
+
+class HashableBoardState(Protocol):
+    """Optional board-state hook exposing a position hash.
+
+    Implementations should keep the hash up to date incrementally inside
+    ``apply_action`` (for example by XOR-ing :class:`ZobristHasher` keys), so reading
+    it is O(1). Equal positions must hash equally regardless of move order.
+    """
+
+    def state_hash(self) -> int:
+        """Return the hash of the current position."""
+
+
+def state_hash(board_state: Any) -> Optional[int]:
+    """Return ``board_state.state_hash()`` or ``None`` if the state does not provide it."""
+
+    hasher = getattr(board_state, "state_hash", None)
+    return hasher() if callable(hasher) else None
+
+
+class ZobristHasher:
+    """Deterministic 64-bit random keys for board features.
+
+    A position hash is the XOR of the keys of every feature present, so applying or
+    removing a feature is a single :meth:`toggle`. Features are any hashable
+    description such as ``("ships", hex_id, owner, count)``.
+
+    Args:
+        seed: Seed of the key generator; equal seeds give equal keys.
+    """
+
+    def __init__(self, seed: int = 0) -> None:
+        self._rng = random.Random(seed)
+        self._keys: Dict[Hashable, int] = {}
+
+    def key(self, feature: Hashable) -> int:
+        """Return the random key of ``feature``, drawing it on first use."""
+
+        value = self._keys.get(feature)
+        if value is None:
+            value = self._keys[feature] = self._rng.getrandbits(64)
+        return value
+
+    def toggle(self, current: int, feature: Hashable) -> int:
+        """Add ``feature`` to, or remove it from, the hash ``current``."""
+
+        return (current ^ self.key(feature)) & _MASK64
+
+
+class TTEntry:
+    """A transposition table entry."""
+
+    __slots__ = ("score", "depth", "best_action", "data")
+
+    def __init__(self, score: float, depth: int, best_action: Any = None, data: Any = None) -> None:
+        self.score = score
+        self.depth = depth
+        self.best_action = best_action
+        self.data = data
+
+
+class TranspositionTable:
+    """Bounded table of evaluated positions, evicting the least recently used.
+
+    Entries hold a score, the depth it was searched to and the best action found.
+    A store only replaces an existing entry when it was searched at least as deep.
+
+    Args:
+        max_entries: Maximum number of entries kept.
+    """
+
+    def __init__(self, max_entries: int = 100_000) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self._entries: "OrderedDict[Hashable, TTEntry]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def probe(self, key: Hashable, min_depth: int = 0) -> Optional[TTEntry]:
+        """Return the entry for ``key`` if it was searched to at least ``min_depth``."""
+
+        entry = self._entries.get(key)
+        if entry is None or entry.depth < min_depth:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def store(
+        self,
+        key: Hashable,
+        score: float,
+        depth: int = 0,
+        best_action: Any = None,
+        data: Any = None,
+    ) -> None:
+        """Record the result of searching ``key`` to ``depth``."""
+
+        entry = self._entries.get(key)
+        if entry is not None and entry.depth > depth:
+            return
+        self._entries[key] = TTEntry(score, depth, best_action, data)
+        self._entries.move_to_end(key)
+        self.stores += 1
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+
+        self._entries.clear()
+        self.hits = self.misses = self.stores = self.evictions = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of probes that found a usable entry."""
+
+        probes = self.hits + self.misses
+        return self.hits / probes if probes else 0.0
+
+    def memory_bytes(self) -> int:
+        """Approximate memory held by the table (container, keys and entries)."""
+
+        entry_size = sys.getsizeof(TTEntry(0.0, 0))
+        keys = sum(sys.getsizeof(key) for key in self._entries)
+        return sys.getsizeof(self._entries) + keys + entry_size * len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return counters, hit rate and memory use as a dictionary."""
+
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+            "memory_bytes": self.memory_bytes(),
+        }
+
+
+def action_key(board_state: Any, action: Any) -> Optional[Hashable]:
+    """Key for caching the value of ``action`` in ``board_state``, if both are hashable."""
+
+    position = state_hash(board_state)
+    if position is None:
+        return None
+    try:
+        hash(action)
+    except TypeError:
+        return None
+    return (position, action)
+
+
+def cached_score(
+    table: Optional[TranspositionTable],
+    scorer: Callable[[Any, Any], float],
+    board_state: Any,
+    action: Any,
+) -> float:
+    """Return ``scorer(board_state, action)``, consulting ``table`` first when given."""
+
+    key = action_key(board_state, action) if table is not None else None
+    if key is None:
+        return float(scorer(board_state, action))
+    entry = table.probe(key)
+    if entry is not None:
+        return entry.score
+    score = float(scorer(board_state, action))
+    table.store(key, score)
+    return score
@@ -0,0 +1 @@
+"""Performance benchmarks for the valuation engine and planners."""
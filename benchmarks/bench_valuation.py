@@ -0,0 +1,240 @@
+"""Micro/macro benchmarks of the valuation engine and planners.
+
+Run ``python -m benchmarks.bench_valuation --out results.json`` to time every
+benchmark at every scale, and add ``--baseline previous.json`` to fail (exit code 1)
+when a benchmark got slower than the baseline by more than ``--threshold``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import platform
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from ai import create_plan
+from eclipse_ai.board import ArrayBoardState
+from eclipse_ai.evaluator import evaluate_action
+from eclipse_ai.valuation import STATE_CACHE, apply_phase_valuation, apply_phase_valuation_batch
+from eclipse_ai.valuation.opponent import opponent_pressure_proxy
+from eclipse_ai.valuation.spatial import HexOccupancyIndex
+
+from .synthetic import SCALES, SyntheticAI, make_scenario
+
+# A benchmark takes a scenario and returns a zero-argument callable plus the number
+# of operations one call of it performs.
+Benchmark = Callable[[Dict[str, Any]], "tuple[Callable[[], Any], int]"]
+
+PLAN_STEPS = 6
+
+
+def _bench_evaluate_action(scenario: Dict[str, Any]):
+    state, actions = scenario["state"], scenario["actions"]
+
+    def run() -> None:
+        for action in actions:
+            evaluate_action(state, action)
+
+    return run, len(actions)
+
+
+def _bench_apply_phase_valuation(scenario: Dict[str, Any]):
+    state, actions, scores = scenario["state"], scenario["actions"], scenario["scores"]
+
+    def run() -> None:
+        for action, score in zip(actions, scores):
+            apply_phase_valuation(state, action, copy.copy(score))
+
+    return run, len(actions)
+
+
+def _bench_apply_phase_valuation_batch(scenario: Dict[str, Any]):
+    state, actions, scores = scenario["state"], scenario["actions"], scenario["scores"]
+
+    def run() -> None:
+        apply_phase_valuation_batch(state, actions, [copy.copy(s) for s in scores])
+
+    return run, len(actions)
+
+
+def _bench_opponent_pressure_proxy(scenario: Dict[str, Any]):
+    state = scenario["state"]
+
+    def run() -> None:
+        opponent_pressure_proxy(state, None)
+
+    return run, 1
+
+
+def _bench_opponent_pressure_indexed(scenario: Dict[str, Any]):
+    state = scenario["state"]
+    state.occupancy_index = HexOccupancyIndex.from_map(state.map)
+
+    def run() -> None:
+        opponent_pressure_proxy(state, None)
+
+    return run, 1
+
+
+def _bench_create_plan(scenario: Dict[str, Any]):
+    state = scenario["state"]
+    ai = SyntheticAI()
+
+    def run() -> None:
+        create_plan(ai, state, PLAN_STEPS)
+
+    return run, 1
+
+
+def _bench_clone_state(scenario: Dict[str, Any]):
+    state = scenario["state"]
+
+    def run() -> None:
+        state.clone()
+
+    return run, 1
+
+
+def _bench_clone_array_board(scenario: Dict[str, Any]):
+    board = ArrayBoardState.from_state(scenario["state"])
+
+    def run() -> None:
+        board.clone()
+
+    return run, 1
+
+
+BENCHMARKS: Dict[str, Benchmark] = {
+    "evaluate_action": _bench_evaluate_action,
+    "apply_phase_valuation": _bench_apply_phase_valuation,
+    "apply_phase_valuation_batch": _bench_apply_phase_valuation_batch,
+    "opponent_pressure_proxy": _bench_opponent_pressure_proxy,
+    "opponent_pressure_indexed": _bench_opponent_pressure_indexed,
+    "create_plan": _bench_create_plan,
+    "clone_state": _bench_clone_state,
+    "clone_array_board": _bench_clone_array_board,
+}
+
+
+def _time_per_op(run: Callable[[], Any], ops: int, repeat: int, min_time: float) -> float:
+    """Best-of-``repeat`` mean seconds per operation, each sample lasting ``min_time``."""
+
+    best = float("inf")
+    for _ in range(repeat):
+        loops = 0
+        start = time.perf_counter()
+        elapsed = 0.0
+        while elapsed < min_time or loops == 0:
+            run()
+            loops += 1
+            elapsed = time.perf_counter() - start
+        best = min(best, elapsed / (loops * ops))
+    return best
+
+
+def run_suite(
+    scales: Sequence[str] = tuple(SCALES),
+    benchmarks: Optional[Sequence[str]] = None,
+    repeat: int = 5,
+    min_time: float = 0.05,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """Time the selected benchmarks at the selected scales.
+
+    Returns:
+        A JSON-serializable report: environment metadata and, per
+        ``"<benchmark>[<scale>]"`` key, the best mean time per operation in
+        microseconds.
+    """
+
+    results: Dict[str, Dict[str, Any]] = {}
+    for scale in scales:
+        for name in benchmarks or BENCHMARKS:
+            STATE_CACHE.clear()
+            run, ops = BENCHMARKS[name](make_scenario(scale, seed=seed))
+            per_op = _time_per_op(run, ops, repeat, min_time)
+            results[f"{name}[{scale}]"] = {
+                "benchmark": name,
+                "scale": scale,
+                "ops_per_call": ops,
+                "us_per_op": per_op * 1e6,
+            }
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.time(),
+            "repeat": repeat,
+            "seed": seed,
+        },
+        "results": results,
+    }
+
+
+def find_regressions(
+    current: Dict[str, Any], baseline: Dict[str, Any], threshold: float = 0.2
+) -> List[Dict[str, Any]]:
+    """Return the benchmarks that are more than ``threshold`` slower than ``baseline``."""
+
+    regressions = []
+    for key, now in current["results"].items():
+        before = baseline.get("results", {}).get(key)
+        if not before or before["us_per_op"] <= 0:
+            continue
+        ratio = now["us_per_op"] / before["us_per_op"]
+        if ratio > 1.0 + threshold:
+            regressions.append({
+                "key": key,
+                "baseline_us": before["us_per_op"],
+                "current_us": now["us_per_op"],
+                "ratio": ratio,
+            })
+    return regressions
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command-line entry point; returns the process exit code."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", default=",".join(SCALES), help="comma-separated scales")
+    parser.add_argument("--benchmarks", default=None, help="comma-separated benchmark names")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.05, help="seconds per sample")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default=None, help="write the JSON report here")
+    parser.add_argument("--baseline", default=None, help="JSON report to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    report = run_suite(
+        scales=args.scales.split(","),
+        benchmarks=args.benchmarks.split(",") if args.benchmarks else None,
+        repeat=args.repeat,
+        min_time=args.min_time,
+        seed=args.seed,
+    )
+    for key, row in report["results"].items():
+        print(f"{key:45s} {row['us_per_op']:12.2f} us/op")
+    if args.out:
+        with open(args.out, "w") as fh:
+            json.dump(report, fh, indent=2, sort_keys=True)
+
+    if args.baseline:
+        with open(args.baseline) as fh:
+            regressions = find_regressions(report, json.load(fh), args.threshold)
+        for reg in regressions:
+            print(
+                f"REGRESSION {reg['key']}: {reg['baseline_us']:.2f} -> "
+                f"{reg['current_us']:.2f} us/op (x{reg['ratio']:.2f})",
+                file=sys.stderr,
+            )
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
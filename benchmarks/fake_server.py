@@ -0,0 +1,93 @@
+"""In-process fake game server driving :class:`ai.service.PlanningService`.
+
+Run ``python -m benchmarks.fake_server --games 32 --turns 5`` to print the service's
+headline throughput in decisions per second.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+from typing import Any, Dict, Optional, Sequence
+
+from ai import NormalDecisionMaker, PlanningService
+
+from .synthetic import SyntheticAI, make_actions, make_scores, make_state
+
+
+class FakeGameServer:
+    """Simulate many tables that each score candidates and request a plan per turn.
+
+    Every game owns a live synthetic state. On each turn it asks the service to
+    value a handful of candidate actions (batched across games), requests a plan,
+    and applies the plan's first action to its live state.
+
+    Args:
+        service: A started planning service.
+        n_games: Number of concurrent games.
+        turns: Turns played per game.
+        steps: Plan length requested per turn.
+        n_candidates: Candidate actions valued per turn.
+        n_hexes: Map size of every game.
+    """
+
+    def __init__(
+        self,
+        service: PlanningService,
+        n_games: int = 8,
+        turns: int = 3,
+        steps: int = 3,
+        n_candidates: int = 12,
+        n_hexes: int = 20,
+    ) -> None:
+        self.service = service
+        self.n_games = n_games
+        self.turns = turns
+        self.steps = steps
+        self.n_candidates = n_candidates
+        self.states = [make_state(n_hexes=n_hexes, round_idx=1 + g % 9, seed=g) for g in range(n_games)]
+        self.plans_received: Dict[int, int] = {g: 0 for g in range(n_games)}
+
+    async def _play(self, game_id: int) -> None:
+        state = self.states[game_id]
+        for turn in range(self.turns):
+            actions = make_actions(self.n_candidates, seed=game_id * 1000 + turn)
+            await self.service.score_actions(state, actions, make_scores(actions, seed=turn))
+            plan = await self.service.request_plan(game_id, state, self.steps)
+            self.plans_received[game_id] += 1
+            state.apply_action(plan.actions[0])
+
+    async def run(self) -> Dict[str, Any]:
+        """Play every game to completion and return the service statistics."""
+
+        await asyncio.gather(*(self._play(g) for g in range(self.n_games)))
+        return self.service.stats()
+
+
+async def _main(args: argparse.Namespace) -> Dict[str, Any]:
+    planner = NormalDecisionMaker(ai=SyntheticAI()).make_plan
+    async with PlanningService(planner, max_workers=args.workers) as service:
+        server = FakeGameServer(service, n_games=args.games, turns=args.turns, steps=args.steps)
+        return await server.run()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command-line entry point; returns the process exit code."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=32)
+    parser.add_argument("--turns", type=int, default=5)
+    parser.add_argument("--steps", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args(argv)
+
+    stats = asyncio.run(_main(args))
+    print(f"decisions/s: {stats['decisions_per_second']:.1f}")
+    print(f"decisions: {stats['decisions']}  mean latency: {stats['mean_latency_s'] * 1e3:.2f} ms"
+          f"  valuation batches: {stats['valuation_batches']} (mean size {stats['mean_batch_size']:.1f})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
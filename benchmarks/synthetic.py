@@ -0,0 +1,230 @@
+"""Synthetic Eclipse states, actions and AIs for benchmarking.
+
+The objects expose the duck-typed schema the valuation engine reads
+(``state.players``, ``state.map.hexes[...].pieces[...].ships``, ``state.round``) and
+implement the :class:`ai.planner.PlanningBoardState` protocol so planners can run
+on them.
+"""
+
+from __future__ import annotations
+
+import copy
+import random
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from eclipse_ai.evaluator import Score
+from eclipse_ai.game_models import ActionType
+from eclipse_ai.valuation.spatial import HexOccupancyIndex
+
+SHIP_TYPES = ("interceptor", "cruiser", "dreadnought")
+TECH_NAMES = (
+    "Plasma Cannon",
+    "Positron Computer",
+    "Gauss Shield",
+    "Fusion Drive",
+    "Improved Hull",
+    "Starbase",
+    "Advanced Mining",
+    "Advanced Labs",
+    "Nanorobots",
+    "Quantum Grid",
+)
+
+
+@dataclass
+class SyntheticPlayer:
+    """A player's banked resources."""
+
+    materials: int = 0
+    science: int = 0
+    money: int = 0
+
+
+@dataclass
+class SyntheticPieces:
+    """One owner's pieces on a hex."""
+
+    ships: Dict[str, int] = field(default_factory=dict)
+    starbase: int = 0
+
+
+@dataclass
+class SyntheticHex:
+    """A map hex with pieces per owner."""
+
+    hex_id: int
+    pieces: Dict[str, SyntheticPieces] = field(default_factory=dict)
+
+
+@dataclass
+class SyntheticMap:
+    """The galaxy: hexes by id."""
+
+    hexes: Dict[int, SyntheticHex] = field(default_factory=dict)
+
+
+@dataclass
+class SyntheticAction:
+    """An action with a :class:`ActionType` and payload."""
+
+    type: ActionType
+    payload: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class SyntheticState:
+    """Board state implementing the planning protocol over the synthetic schema."""
+
+    round: int
+    players: Dict[str, SyntheticPlayer]
+    map: SyntheticMap
+    active_player: str = "p0"
+    version: int = 0
+    occupancy_index: Optional[HexOccupancyIndex] = None
+
+    def clone(self) -> "SyntheticState":
+        """Return an independent deep copy."""
+
+        return copy.deepcopy(self)
+
+    def apply_action(self, action: SyntheticAction) -> None:
+        """Apply a coarse resource/map effect of ``action`` for the active player."""
+
+        me = self.players[self.active_player]
+        if action.type == ActionType.EXPLORE:
+            hex_id = len(self.map.hexes)
+            self.map.hexes[hex_id] = SyntheticHex(
+                hex_id, {self.active_player: SyntheticPieces(ships={"interceptor": 1})}
+            )
+            if self.occupancy_index is not None:
+                self.occupancy_index.build_ships(hex_id, self.active_player, 1)
+        elif action.type == ActionType.RESEARCH:
+            me.science = max(0, me.science - 4)
+        elif action.type in (ActionType.BUILD, ActionType.UPGRADE):
+            me.materials = max(0, me.materials - 3)
+        else:
+            me.money = max(0, me.money - 1)
+        self.version += 1
+
+
+def make_state(
+    n_hexes: int = 20,
+    n_players: int = 4,
+    resource_level: int = 10,
+    round_idx: int = 3,
+    seed: int = 0,
+    indexed: bool = False,
+) -> SyntheticState:
+    """Build a random state.
+
+    Args:
+        n_hexes: Number of explored hexes on the map.
+        n_players: Number of players (``p0`` is active).
+        resource_level: Mean of each banked resource.
+        round_idx: Current round.
+        seed: Random seed.
+        indexed: Maintain a :class:`HexOccupancyIndex` alongside the map.
+    """
+
+    rng = random.Random(seed)
+    owners = [f"p{i}" for i in range(n_players)]
+    players = {
+        pid: SyntheticPlayer(
+            materials=rng.randint(0, 2 * resource_level),
+            science=rng.randint(0, 2 * resource_level),
+            money=rng.randint(0, 2 * resource_level),
+        )
+        for pid in owners
+    }
+    hexes: Dict[int, SyntheticHex] = {}
+    for hex_id in range(n_hexes):
+        hx = SyntheticHex(hex_id)
+        for pid in rng.sample(owners, k=rng.randint(0, min(2, n_players))):
+            hx.pieces[pid] = SyntheticPieces(
+                ships={ship: rng.randint(0, 2) for ship in SHIP_TYPES},
+                starbase=int(rng.random() < 0.1),
+            )
+        hexes[hex_id] = hx
+    state = SyntheticState(round=round_idx, players=players, map=SyntheticMap(hexes))
+    if indexed:
+        state.occupancy_index = HexOccupancyIndex.from_map(state.map)
+    return state
+
+
+def make_action(action_type: ActionType, rng: random.Random) -> SyntheticAction:
+    """Build an action of ``action_type`` with a plausible random payload."""
+
+    if action_type == ActionType.RESEARCH:
+        return SyntheticAction(action_type, {"tech": rng.choice(TECH_NAMES)})
+    if action_type == ActionType.BUILD:
+        return SyntheticAction(action_type, {"ships": {rng.choice(SHIP_TYPES): rng.randint(1, 2)}})
+    return SyntheticAction(action_type)
+
+
+def make_actions(n_actions: int, seed: int = 0) -> List[SyntheticAction]:
+    """Build ``n_actions`` actions cycling through every :class:`ActionType`."""
+
+    rng = random.Random(seed)
+    kinds = list(ActionType)
+    return [make_action(kinds[i % len(kinds)], rng) for i in range(n_actions)]
+
+
+def make_scores(actions: List[SyntheticAction], seed: int = 0) -> List[Score]:
+    """Baseline scores for ``actions``; MOVE actions carry combat details."""
+
+    rng = random.Random(seed)
+    scores = []
+    for action in actions:
+        details: Dict[str, Any] = {}
+        if action.type == ActionType.MOVE:
+            details = {
+                "positional": rng.random() < 0.5,
+                "territory_ev": rng.random(),
+                "combat_win_prob": rng.random(),
+            }
+        scores.append(Score(expected_vp=rng.uniform(0.0, 3.0), risk=rng.random(), details=details))
+    return scores
+
+
+class SyntheticAI:
+    """Planning AI cycling through the action types, with one candidate per type."""
+
+    def __init__(self, seed: int = 0) -> None:
+        self._rng = random.Random(seed)
+
+    def candidate_actions(self, board_state: SyntheticState) -> List[SyntheticAction]:
+        """Return one action of every type."""
+
+        return [make_action(kind, self._rng) for kind in ActionType]
+
+    def choose_action(self, board_state: SyntheticState) -> SyntheticAction:
+        """Pick the action type indexed by the state's version."""
+
+        kinds = list(ActionType)
+        return make_action(kinds[board_state.version % len(kinds)], self._rng)
+
+
+# Named benchmark scales: map size, player count and candidate action count.
+SCALES: Dict[str, Dict[str, int]] = {
+    "small": {"n_hexes": 12, "n_players": 2, "n_actions": 24},
+    "medium": {"n_hexes": 40, "n_players": 4, "n_actions": 120},
+    "large": {"n_hexes": 120, "n_players": 6, "n_actions": 480},
+}
+
+
+def make_scenario(
+    name: str, seed: int = 0, round_idx: Optional[int] = None, indexed: bool = False
+) -> Dict[str, Any]:
+    """State, candidate actions and baseline scores for a named scale."""
+
+    params = SCALES[name]
+    state = make_state(
+        n_hexes=params["n_hexes"],
+        n_players=params["n_players"],
+        round_idx=round_idx if round_idx is not None else 3,
+        seed=seed,
+        indexed=indexed,
+    )
+    actions = make_actions(params["n_actions"], seed=seed)
+    return {"state": state, "actions": actions, "scores": make_scores(actions, seed=seed)}
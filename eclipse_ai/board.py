@@ -0,0 +1,300 @@
+# SPDX-License-Identifier: MIT
+"""
+Reference Eclipse board state backed by one flat NumPy buffer.
+
+Everything mutable lives in a single int32 array, viewed as
+  header     [round, active player, explored hexes, alternate turns]
+  resources  (players, 3)            materials, science, money
+  ships      (hexes, players, 3)     interceptor, cruiser, dreadnought
+  starbases  (hexes, players)
+  owner      (hexes,)                influence disc owner, -1 for none
+so clone() is one buffer copy, undo tokens hold only the cells an action
+changed, and state_hash() is a Zobrist-style key (the sum of per-cell random
+keys times cell values, mod 2**64) updated from those cells. Code writing the
+arrays directly must call rehash() afterwards. It implements ai.planner.PlanningBoardState (and the
+reversible and hashable extensions), and registers accessors with
+valuation.adapters plus an array-backed occupancy_index, so the valuation engine
+reads it without attribute probing or map scans.
+"""
+from __future__ import annotations
+from functools import lru_cache
+from typing import Any, Dict, Iterator, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .game_models import ActionType
+from .valuation.adapters import StateAdapter, register_adapter
+from .valuation.spatial import pressure_from_counts
+
+SHIP_TYPES = ("interceptor", "cruiser", "dreadnought")
+SHIP_COST = np.array([3, 5, 8], dtype=np.int32)   # materials per ship
+RESEARCH_COST = 4                                  # science, unless payload["cost"]
+UPGRADE_COST = 2                                   # materials
+INFLUENCE_COST = 1                                 # money
+_ROUND, _ACTIVE, _EXPLORED, _ALTERNATE = range(4)
+_MASK64 = (1 << 64) - 1
+
+class _Layout(NamedTuple):
+    n_players: int
+    max_hexes: int
+    resources: slice
+    ships: slice
+    starbases: slice
+    owner: slice
+    size: int
+
+@lru_cache(maxsize=None)
+def _layout(n_players: int, max_hexes: int) -> _Layout:
+    sizes = (4, n_players * 3, max_hexes * n_players * len(SHIP_TYPES), max_hexes * n_players, max_hexes)
+    ends = np.cumsum(sizes).tolist()
+    cuts = [slice(a, b) for a, b in zip([0] + ends[:-1], ends)]
+    return _Layout(n_players, max_hexes, cuts[1], cuts[2], cuts[3], cuts[4], ends[-1])
+
+@lru_cache(maxsize=None)
+def _zobrist(size: int) -> np.ndarray:
+    return np.random.default_rng(0x5EED).integers(0, 2**64, size, dtype=np.uint64, endpoint=False)
+
+def _key_of(cells: np.ndarray, keys: np.ndarray) -> int:
+    return int(keys @ cells.astype(np.uint64))  # wraps mod 2**64
+
+class _Undo(NamedTuple):
+    key: Optional[int]
+    cells: Tuple[Tuple[int, np.ndarray], ...]   # (buffer offset, old values)
+
+class PlayerResources(NamedTuple):
+    materials: int
+    science: int
+    money: int
+
+class HexPieces(NamedTuple):
+    ships: Dict[str, int]
+    starbase: int
+
+class HexView(NamedTuple):
+    """Read-only snapshot of one hex in the duck-typed map schema."""
+    hex_id: int
+    pieces: Dict[str, HexPieces]
+
+class ArrayBoardState:
+    """Array-backed board state; build one with new() or from_state()."""
+    __slots__ = ("player_ids", "_index", "_layout", "buf", "header", "resources",
+                 "ships", "starbases", "owner", "_key")
+
+    def __init__(self, player_ids: Sequence[str], max_hexes: int, buf: Optional[np.ndarray] = None):
+        self.player_ids = tuple(player_ids)
+        self._index = {pid: i for i, pid in enumerate(self.player_ids)}
+        self._layout = L = _layout(len(self.player_ids), int(max_hexes))
+        self.buf = np.zeros(L.size, dtype=np.int32) if buf is None else buf
+        self.header = self.buf[:4]
+        self.resources = self.buf[L.resources].reshape(L.n_players, 3)
+        self.ships = self.buf[L.ships].reshape(L.max_hexes, L.n_players, len(SHIP_TYPES))
+        self.starbases = self.buf[L.starbases].reshape(L.max_hexes, L.n_players)
+        self.owner = self.buf[L.owner]
+        self._key: Optional[int] = None   # computed on first state_hash()
+        if buf is None:
+            self.owner[:] = -1
+
+    @classmethod
+    def new(cls, player_ids: Sequence[str], max_hexes: int = 64, round_idx: int = 1,
+            alternate: bool = False) -> "ArrayBoardState":
+        """
+        Empty board. With `alternate`, the move passes to the next player after every
+        action (two-player lookahead, e.g. ai.negamax); otherwise the active player
+        keeps planning (beam search, MCTS).
+        """
+        state = cls(player_ids, max_hexes)
+        state.header[_ROUND] = round_idx
+        state.header[_ALTERNATE] = int(alternate)
+        return state
+
+    @classmethod
+    def from_state(cls, state: Any, max_hexes: Optional[int] = None,
+                   alternate: bool = False) -> "ArrayBoardState":
+        """Copy a duck-typed state (players, map.hexes[].pieces[], round, active_player)."""
+        players = dict(getattr(state, "players", {}) or {})
+        hexes = list(getattr(getattr(state, "map", None), "hexes", {}).values())
+        out = cls.new(list(players), max_hexes or max(64, 2 * len(hexes)),
+                      int(getattr(state, "round", 1) or 1), alternate)
+        out.header[_ACTIVE] = out._index.get(getattr(state, "active_player", None), 0)
+        for i, p in enumerate(players.values()):
+            out.resources[i] = [int(getattr(p, name, 0) or 0) for name in PlayerResources._fields]
+        for h, hx in enumerate(hexes[:out._layout.max_hexes]):
+            for owner, pieces in (getattr(hx, "pieces", {}) or {}).items():
+                p = out._index.get(owner)
+                if p is None:
+                    continue
+                ships = getattr(pieces, "ships", {}) or {}
+                out.ships[h, p] = [int(ships.get(name, 0)) for name in SHIP_TYPES]
+                out.starbases[h, p] = int(getattr(pieces, "starbase", 0) or 0)
+        out.header[_EXPLORED] = min(len(hexes), out._layout.max_hexes)
+        return out
+
+    # --- PlanningBoardState --------------------------------------------------
+    def clone(self) -> "ArrayBoardState":
+        out = ArrayBoardState(self.player_ids, self._layout.max_hexes, self.buf.copy())
+        out._key = self._key
+        return out
+
+    def apply_action(self, action: Any) -> _Undo:
+        """Apply `action` for the active player; returns an undo token of the changed cells."""
+        t = getattr(action, "type", None)
+        payload = getattr(action, "payload", None) or {}
+        p = int(self.header[_ACTIVE])
+        res = self.resources[p]
+        L = self._layout
+        cells = [(0, 4), (L.resources.start + 3 * p, 3)]
+        if t == ActionType.EXPLORE:
+            h = int(self.header[_EXPLORED])
+            if h < L.max_hexes:
+                cells += [self._ship_cells(h, p), (L.owner.start + h, 1)]
+        elif t == ActionType.INFLUENCE:
+            h = self._hex(payload.get("hex"))
+            if h is not None:
+                cells.append((L.owner.start + h, 1))
+        elif t == ActionType.BUILD:
+            h = self._hex(payload.get("hex"), default=self._home(p))
+            if h is not None:
+                cells.append(self._ship_cells(h, p))
+        elif t == ActionType.MOVE:
+            src, dst = self._hex(payload.get("from")), self._hex(payload.get("hex", payload.get("to")))
+            if src is not None and dst is not None:
+                cells += {self._ship_cells(src, p), self._ship_cells(dst, p)}
+        token = _Undo(self._key, tuple((a, self.buf[a:a + n].copy()) for a, n in cells))
+        if t == ActionType.EXPLORE:
+            h = int(self.header[_EXPLORED])
+            if h < L.max_hexes:
+                self.ships[h, p, 0] += 1
+                self.owner[h] = p
+                self.header[_EXPLORED] = h + 1
+        elif t == ActionType.INFLUENCE:
+            h = self._hex(payload.get("hex"))
+            if h is not None:
+                self.owner[h] = p
+            res[2] = max(0, res[2] - INFLUENCE_COST)
+        elif t == ActionType.RESEARCH:
+            res[1] = max(0, res[1] - int(payload.get("cost", RESEARCH_COST)))
+        elif t == ActionType.BUILD:
+            counts = self._fleet(payload.get("ships", {}))
+            h = self._hex(payload.get("hex"), default=self._home(p))
+            if h is not None:
+                self.ships[h, p] += counts
+            res[0] = max(0, res[0] - int(counts @ SHIP_COST))
+        elif t == ActionType.UPGRADE:
+            res[0] = max(0, res[0] - UPGRADE_COST)
+        elif t == ActionType.MOVE:
+            src, dst = self._hex(payload.get("from")), self._hex(payload.get("hex", payload.get("to")))
+            if src is not None and dst is not None:
+                moved = np.minimum(self._fleet(payload.get("ships", {})), self.ships[src, p])
+                self.ships[src, p] -= moved
+                self.ships[dst, p] += moved
+        if self.header[_ALTERNATE]:
+            self.header[_ACTIVE] = (p + 1) % self._layout.n_players
+        if self._key is not None:
+            keys = _zobrist(L.size)
+            for a, old in token.cells:
+                new, k = self.buf[a:a + len(old)], keys[a:a + len(old)]
+                self._key = (self._key + _key_of(new, k) - _key_of(old, k)) & _MASK64
+        return token
+
+    def with_active_player(self, pid: str) -> "ArrayBoardState":
+        """Clone with `pid` to move (e.g. to score a rival's options)."""
+        out = self.clone()
+        out.header[_ACTIVE] = self._index[pid]
+        out.rehash()
+        return out
+
+    def undo_action(self, token: _Undo) -> None:
+        for a, old in reversed(token.cells):
+            self.buf[a:a + len(old)] = old
+        self._key = token.key
+
+    def state_hash(self) -> int:
+        if self._key is None:
+            self._key = _key_of(self.buf, _zobrist(self._layout.size))
+        return self._key
+
+    def rehash(self) -> None:
+        """Drop the cached hash after writing the arrays directly."""
+        self._key = None
+
+    # --- accessors -----------------------------------------------------------
+    @property
+    def round(self) -> int:
+        return int(self.header[_ROUND])
+
+    @property
+    def active_player(self) -> str:
+        return self.player_ids[int(self.header[_ACTIVE])]
+
+    @property
+    def n_hexes(self) -> int:
+        return int(self.header[_EXPLORED])
+
+    @property
+    def occupancy_index(self) -> "ArrayOccupancy":
+        return ArrayOccupancy(self)
+
+    def player(self, pid: Optional[str]) -> Optional[PlayerResources]:
+        i = self._index.get(pid)
+        return None if i is None else PlayerResources(*self.resources[i].tolist())
+
+    def hexes(self) -> Iterator[HexView]:
+        """Explored hexes in the duck-typed schema (for code without array accessors)."""
+        for h in range(self.n_hexes):
+            pieces = {}
+            for p, pid in enumerate(self.player_ids):
+                ships, base = self.ships[h, p], int(self.starbases[h, p])
+                if ships.any() or base:
+                    pieces[pid] = HexPieces(dict(zip(SHIP_TYPES, ships.tolist())), base)
+            yield HexView(h, pieces)
+
+    def _hex(self, hex_id: Any, default: Optional[int] = None) -> Optional[int]:
+        try:
+            h = int(hex_id)
+        except (TypeError, ValueError):
+            return default
+        return h if 0 <= h < self.n_hexes else default
+
+    def _ship_cells(self, h: int, p: int) -> Tuple[int, int]:
+        return self._layout.ships.start + (h * self._layout.n_players + p) * len(SHIP_TYPES), len(SHIP_TYPES)
+
+    def _home(self, p: int) -> Optional[int]:
+        mine = np.flatnonzero(self.owner[:self.n_hexes] == p)
+        return int(mine[0]) if mine.size else None
+
+    @staticmethod
+    def _fleet(ships: Any) -> np.ndarray:
+        try:
+            return np.array([max(0, int(ships.get(name, 0))) for name in SHIP_TYPES], dtype=np.int32)
+        except Exception:
+            return np.zeros(len(SHIP_TYPES), dtype=np.int32)
+
+class ArrayOccupancy:
+    """occupancy_index view for ArrayBoardState: pressure(pid) straight from the arrays."""
+    __slots__ = ("state",)
+
+    def __init__(self, state: ArrayBoardState):
+        self.state = state
+
+    def counts(self, pid: Optional[str]) -> Tuple[int, int]:
+        """(hexes where `pid` has ships, of those hexes with hostile ships or starbases)."""
+        s = self.state
+        p = s._index.get(pid)
+        if p is None:
+            return 0, 0
+        n = s.n_hexes
+        ships = s.ships[:n].sum(axis=2)                  # (hexes, players)
+        strength = ships + s.starbases[:n]
+        mine = ships[:, p] > 0
+        hostile = (strength.sum(axis=1) - strength[:, p]) > 0
+        return int(mine.sum()), int((mine & hostile).sum())
+
+    def pressure(self, pid: Optional[str]) -> float:
+        return pressure_from_counts(*self.counts(pid))
+
+register_adapter(ArrayBoardState, StateAdapter(
+    active_player=lambda s: s.active_player,
+    player=lambda s, pid: s.player(pid),
+    round_idx=lambda s: s.round if s.round >= 1 else None,
+    hexes=lambda s: s.hexes(),
+))
@@ -0,0 +1,193 @@
+# SPDX-License-Identifier: MIT
+"""
+Vectorized Monte Carlo combat: thousands of battles simulated at once with NumPy.
+
+Fleets are {ship type: count} dicts in the BUILD payload vocabulary (interceptor,
+cruiser, dreadnought, plus starbase). Every battle is one row of the simulation
+arrays; each ship is one column holding its remaining hit points. Rules follow the
+Eclipse base game closely enough for valuation: ship types fire in initiative order
+(defender first on ties), each cannon rolls a d6, a 6 always hits and a 1 always
+misses, otherwise roll + computers - target shields >= 6 hits. Hits go to the
+ship at the front of the target fleet (biggest hulls first). Battles that are
+still undecided after `max_rounds` count as an attacker retreat.
+
+Results are cached by fleet composition (plus sample count and seed), so repeated
+matchups cost a dict lookup.
+"""
+from __future__ import annotations
+from functools import lru_cache
+from typing import Any, Dict, Mapping, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from .valuation.opponent import _iter_hexes
+from .valuation.resource_prices import _get_active_player
+
+class ShipStats(NamedTuple):
+    hull: int        # extra hit points beyond the first
+    shields: int     # subtracted from the attacker's rolls
+    computers: int   # added to this ship's rolls
+    cannons: int     # dice per volley
+    damage: int      # damage per hit
+    initiative: int  # higher fires first
+
+# Default (Terran-like) blueprints
+SHIP_STATS: Dict[str, ShipStats] = {
+    "interceptor": ShipStats(hull=0, shields=0, computers=0, cannons=1, damage=1, initiative=3),
+    "cruiser":     ShipStats(hull=1, shields=0, computers=1, cannons=1, damage=1, initiative=2),
+    "dreadnought": ShipStats(hull=2, shields=0, computers=1, cannons=2, damage=1, initiative=1),
+    "starbase":    ShipStats(hull=2, shields=0, computers=1, cannons=1, damage=1, initiative=4),
+}
+IMMOBILE = frozenset({"starbase"})
+
+FleetKey = Tuple[Tuple[str, int], ...]
+
+class CombatResult(NamedTuple):
+    win_prob: float                        # attacker destroys the defender and survives
+    loss_prob: float                       # attacker is destroyed
+    attacker_losses: Dict[str, float]      # expected ships lost, per type
+    defender_losses: Dict[str, float]
+
+    @property
+    def expected_attacker_losses(self) -> float:
+        return float(sum(self.attacker_losses.values()))
+
+    @property
+    def expected_defender_losses(self) -> float:
+        return float(sum(self.defender_losses.values()))
+
+def fleet_key(fleet: Mapping[str, Any]) -> FleetKey:
+    """Canonical, hashable fleet composition (known ship types with a positive count)."""
+    out = []
+    for name, count in (fleet or {}).items():
+        try:
+            n = int(count)
+        except Exception:
+            continue
+        if n > 0 and name in SHIP_STATS:
+            out.append((name, n))
+    return tuple(sorted(out))
+
+def _columns(key: FleetKey) -> Tuple[Tuple[str, ...], np.ndarray]:
+    # One column per ship, biggest hulls first (the order hits are assigned in).
+    names = sorted((name for name, n in key for _ in range(n)),
+                   key=lambda name: -SHIP_STATS[name].hull)
+    stats = np.array([SHIP_STATS[name] for name in names], dtype=np.int64).reshape(len(names), len(ShipStats._fields))
+    return tuple(names), stats
+
+def _volley(rng: np.random.Generator, hp: np.ndarray, shooters_alive: np.ndarray,
+            stats: ShipStats, target_shields: np.ndarray) -> None:
+    """One ship type fires: `shooters_alive` (n,) ships of that type per battle, into `hp` (n, m)."""
+    dice = shooters_alive * stats.cannons
+    rows = np.arange(hp.shape[0])
+    for d in range(int(dice.max(initial=0))):
+        alive = hp > 0
+        has_target = alive.any(axis=1)
+        target = np.argmax(alive, axis=1)  # first live ship in column order
+        roll = rng.integers(1, 7, size=hp.shape[0])
+        hit = (roll == 6) | ((roll != 1) & (roll + stats.computers - target_shields[target] >= 6))
+        hit &= has_target & (d < dice)
+        hp[rows, target] -= np.where(hit, stats.damage, 0)
+
+@lru_cache(maxsize=4096)
+def _simulate(attacker: FleetKey, defender: FleetKey, n: int, seed: int, max_rounds: int) -> CombatResult:
+    a_names, a_stats = _columns(attacker)
+    d_names, d_stats = _columns(defender)
+    if not a_names or not d_names:
+        return CombatResult(float(bool(a_names)), float(not a_names and bool(d_names)),
+                            {k: 0.0 for k, _ in attacker}, {k: 0.0 for k, _ in defender})
+
+    rng = np.random.default_rng(seed)
+    hp = {"a": np.repeat(a_stats[None, :, 0] + 1, n, axis=0),
+          "d": np.repeat(d_stats[None, :, 0] + 1, n, axis=0)}
+    shields = {"a": a_stats[:, 1], "d": d_stats[:, 1]}
+    names = {"a": np.array(a_names), "d": np.array(d_names)}
+    # Firing order: (initiative desc, defender first on ties)
+    order = sorted(
+        [("a", t) for t in set(a_names)] + [("d", t) for t in set(d_names)],
+        key=lambda st: (-SHIP_STATS[st[1]].initiative, st[0] != "d"),
+    )
+    for _ in range(max_rounds):
+        fighting = (hp["a"] > 0).any(axis=1) & (hp["d"] > 0).any(axis=1)
+        if not fighting.any():
+            break
+        for side, ship in order:
+            other = "d" if side == "a" else "a"
+            mask = names[side] == ship
+            alive = ((hp[side][:, mask] > 0).sum(axis=1)) * fighting
+            _volley(rng, hp[other], alive, SHIP_STATS[ship], shields[other])
+            fighting &= (hp[other] > 0).any(axis=1)
+
+    a_alive = (hp["a"] > 0).any(axis=1)
+    d_alive = (hp["d"] > 0).any(axis=1)
+
+    def losses(side: str, key: FleetKey) -> Dict[str, float]:
+        dead = hp[side] <= 0
+        return {name: float(dead[:, names[side] == name].sum(axis=1).mean()) for name, _ in key}
+
+    return CombatResult(float(np.mean(a_alive & ~d_alive)), float(np.mean(~a_alive)),
+                        losses("a", attacker), losses("d", defender))
+
+def simulate_combat(attacker: Mapping[str, Any], defender: Mapping[str, Any], n: int = 2000,
+                    seed: int = 0, max_rounds: int = 20) -> CombatResult:
+    """Monte Carlo estimate of a battle between two fleets ({ship type: count})."""
+    return _simulate(fleet_key(attacker), fleet_key(defender), int(n), int(seed), int(max_rounds))
+
+def cache_info() -> Any:
+    return _simulate.cache_info()
+
+def clear_cache() -> None:
+    _simulate.cache_clear()
+
+def _find_hex(state: Any, hex_id: Any) -> Any:
+    # Through the state's adapter/hexes() accessor first (e.g. ArrayBoardState),
+    # then the keyed map for hex objects that do not carry their id.
+    for hx in _iter_hexes(state):
+        if getattr(hx, "hex_id", getattr(hx, "id", None)) == hex_id:
+            return hx
+    hexes = getattr(getattr(state, "map", None), "hexes", None)
+    if hasattr(hexes, "get"):
+        return hexes.get(hex_id)
+    return None
+
+def _defending_fleet(state: Any, hex_id: Any, pid: Optional[str]) -> Dict[str, int]:
+    fleet: Dict[str, int] = {}
+    try:
+        hx = _find_hex(state, hex_id)
+        for owner, pieces in (getattr(hx, "pieces", {}) or {}).items():
+            if owner == pid:
+                continue
+            for name, count in (getattr(pieces, "ships", {}) or {}).items():
+                fleet[name] = fleet.get(name, 0) + int(count)
+            if int(getattr(pieces, "starbase", 0) or 0):
+                fleet["starbase"] = fleet.get("starbase", 0) + int(pieces.starbase)
+    except Exception:
+        return {}
+    return fleet
+
+def combat_details(state: Any, action: Any, n: int = 2000, seed: int = 0) -> Dict[str, float]:
+    """
+    Score.details entries for a MOVE whose payload names the moving fleet and the
+    destination ({"ships": {...}, "hex": id}); the defenders are every rival piece on
+    that hex. Empty when there is nothing to fight.
+    """
+    try:
+        payload = action.payload
+        # starbases cannot move, so they never join the attacking fleet
+        attacker = tuple((name, n) for name, n in fleet_key(payload.get("ships", {}))
+                         if name not in IMMOBILE)
+        hex_id = payload.get("hex", payload.get("to"))
+    except Exception:
+        return {}
+    if not attacker or hex_id is None:
+        return {}
+    defender = fleet_key(_defending_fleet(state, hex_id, _get_active_player(state)))
+    if not defender:
+        return {}
+    result = _simulate(attacker, defender, n, seed, 20)
+    return {
+        "combat_win_prob": result.win_prob,
+        "combat_loss_prob": result.loss_prob,
+        "expected_losses": result.expected_attacker_losses,
+        "expected_kills": result.expected_defender_losses,
+    }
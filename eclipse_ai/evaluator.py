@@ -1,13 +1,16 @@
 # SPDX-License-Identifier: MIT
 from __future__ import annotations
+import copy
+import logging
 from dataclasses import dataclass
-from typing import Any, Dict
+from typing import Any, Dict, Hashable, Optional, Sequence
 
 @dataclass
 class Score:
     expected_vp: float
     risk: float
     details: Dict[str, Any]
+    samples: Optional[Sequence[float]] = None  # sampled VP outcomes, e.g. from combat sims
 
 def evaluate_action(state: Any, action: Any) -> Score:
     """Baseline evaluator stub returning a neutral score."""
@@ -16,21 +19,108 @@ def evaluate_action(state: Any, action: Any) -> Score:
 # === Phase-aware valuation wrapper (append to end of file) ====================
 # This keeps your current evaluate_action() logic intact and post-processes the Score.
 
+_log = logging.getLogger(__name__)
+
+def _record_fail_open() -> None:
+    _log.debug("phase valuation failed; falling back to baseline score", exc_info=True)
+    try:
+        from .valuation.instrument import INSTRUMENTATION
+        INSTRUMENTATION.count("fail_open")
+    except Exception:
+        pass
+
+_TABLE_NAMESPACE = "evaluate_action"  # keeps Score entries apart from planners' float entries
+
+def _table_key(state: Any, action: Any, scorer: Any) -> Optional[Hashable]:
+    """
+    (namespace, ai.transposition.action_key, explain flag, compiled scorer), or None
+    if unhashable. The scorer compares by identity, so entries stored before a
+    reload_valuation() are not returned for the new config.
+    """
+    try:
+        from ai.transposition import action_key
+        from .valuation.explain import explain_enabled
+        key = action_key(state, action)
+        return None if key is None else (_TABLE_NAMESPACE, key, explain_enabled(), scorer)
+    except Exception:
+        return None
+
+def _snapshot(score: Any) -> Any:
+    """Private copy of `score` for a table entry, made once on store."""
+    snap = copy.deepcopy(score)
+    samples = getattr(snap, "samples", None)
+    if hasattr(samples, "setflags"):
+        samples.setflags(write=False)  # NumPy samples are shared read-only by every hit
+    return snap
+
+def _from_snapshot(snap: Any) -> Any:
+    """Shallow copy of a stored Score with its own details dict and samples list."""
+    out = copy.copy(snap)
+    if isinstance(getattr(snap, "details", None), dict):
+        out.details = dict(snap.details)
+    if isinstance(getattr(snap, "samples", None), list):
+        out.samples = list(snap.samples)
+    return out
+
+_VALUATION: Any = None  # compiled ValuationConfig used by evaluate_action, built on first use
+
+def reload_valuation(cfg: Any = None) -> Any:
+    """
+    Compile `cfg` (default ValuationConfig()) for evaluate_action. Call it after
+    changing the config or the ECLIPSE_* env overrides; returns the new scorer.
+    """
+    global _VALUATION
+    from .valuation.engine import ValuationConfig
+    _VALUATION = (cfg if cfg is not None else ValuationConfig()).compile()
+    return _VALUATION
+
+def invalidate_valuation() -> None:
+    """Drop the compiled scorer; the next evaluate_action compiles the default config."""
+    global _VALUATION
+    _VALUATION = None
+
 try:
     _EVALUATE_ACTION_BASELINE = evaluate_action  # keep a handle
 
-    def evaluate_action(state, action):  # type: ignore[no-redef]
+    def evaluate_action(state, action, table=None):  # type: ignore[no-redef]
         """
         Wrapper that applies phase-aware, risk-aware valuation on top of
         the baseline Score computed by the original evaluator.
+
+        If a transposition table (ai.transposition.TranspositionTable or anything
+        with probe/store) is given and the state exposes state_hash(), transposed
+        positions reuse the stored Score instead of being evaluated again. The
+        entry is copied once on store; hits return a shallow copy with its own
+        details dict (nested detail values and read-only NumPy samples are shared).
         """
+        scorer = _VALUATION or reload_valuation()
+        key = _table_key(state, action, scorer) if table is not None else None
+        if key is not None:
+            entry = table.probe(key)
+            if entry is not None and entry.data is not None:
+                return _from_snapshot(entry.data)
+
         base = _EVALUATE_ACTION_BASELINE(state, action)
         try:
-            from .valuation.engine import apply_phase_valuation
-            return apply_phase_valuation(state, action, base)
+            result = scorer(state, action, base)
         except Exception:
-            # If anything goes wrong in the new engine, fail open to baseline.
-            return base
+            # If anything goes wrong in the new engine, fail open to baseline,
+            # but leave a trace: a counter in valuation_stats() and a debug log.
+            _record_fail_open()
+            result = base
+
+        if key is not None:
+            table.store(key, float(getattr(result, "expected_vp", 0.0)), data=_snapshot(result))
+        return result
+
+    def explain_action(state, action):
+        """
+        Full Score (with the details["valuation"] breakdown) for one action, even
+        when it is called inside valuation.explain_disabled().
+        """
+        from .valuation.explain import explaining
+        with explaining(True):
+            return evaluate_action(state, action)
 
 except Exception:
     # If evaluator was not yet defined for some reason, leave file unchanged.
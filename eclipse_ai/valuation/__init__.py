@@ -1,9 +1,31 @@
 # SPDX-License-Identifier: MIT
-from .engine import apply_phase_valuation, ValuationConfig
+from .engine import apply_phase_valuation, explain_valuation, CompiledValuation, ValuationConfig
+from .explain import explain_disabled, explaining
 from .phase import PhaseConfig
+from .cache import STATE_CACHE, StateCache, state_fingerprint
+from .spatial import HexOccupancyIndex
+from .instrument import INSTRUMENTATION, Instrumentation, valuation_stats
+
+try:
+    from .batch import apply_phase_valuation_batch, apply_phase_valuation_many
+except ImportError:  # NumPy not installed: the scalar engine keeps working
+    apply_phase_valuation_batch = apply_phase_valuation_many = None  # type: ignore[assignment]
 
 __all__ = [
     "apply_phase_valuation",
+    "apply_phase_valuation_batch",
+    "apply_phase_valuation_many",
     "ValuationConfig",
+    "CompiledValuation",
+    "explain_disabled",
+    "explain_valuation",
+    "explaining",
     "PhaseConfig",
+    "HexOccupancyIndex",
+    "INSTRUMENTATION",
+    "Instrumentation",
+    "valuation_stats",
+    "STATE_CACHE",
+    "StateCache",
+    "state_fingerprint",
 ]
@@ -0,0 +1,120 @@
+# SPDX-License-Identifier: MIT
+from __future__ import annotations
+import dataclasses
+from typing import Any, Callable, Dict, FrozenSet, Iterable, NamedTuple, Optional, Tuple
+
+ROUND_KEYS = ("round_idx", "round", "turn_idx", "turn")
+RESOURCE_NAMES = ("materials", "science", "money")
+
+class StateAdapter(NamedTuple):
+    """Accessors compiled once per state type. Each may raise; callers fall back to probing."""
+    active_player: Callable[[Any], Optional[str]]
+    player: Callable[[Any, Optional[str]], Any]
+    round_idx: Callable[[Any], Optional[int]]
+    hexes: Callable[[Any], Iterable[Any]]
+
+_STATE_ADAPTERS: Dict[type, Optional[StateAdapter]] = {}
+_RESOURCE_READERS: Dict[type, Optional[Callable[[Any], Tuple[int, int, int]]]] = {}
+
+def declared_attrs(tp: type) -> Optional[FrozenSet[str]]:
+    """
+    Attribute names every instance of `tp` is guaranteed to have: dataclass fields,
+    NamedTuple fields or __slots__, plus class attributes. None for free-form
+    classes, whose instances may carry arbitrary attributes (those keep probing).
+    """
+    if dataclasses.is_dataclass(tp):
+        names = {f.name for f in dataclasses.fields(tp)}
+    elif isinstance(getattr(tp, "_fields", None), tuple):
+        names = set(tp._fields)
+    elif "__slots__" in tp.__dict__ and not hasattr(tp, "__dict__"):
+        names = set()
+        for klass in tp.__mro__:
+            slots = klass.__dict__.get("__slots__", ())
+            names.update((slots,) if isinstance(slots, str) else slots)
+    else:
+        return None
+    names.update(n for n in dir(tp) if not n.startswith("__"))
+    return frozenset(names)
+
+def _compile_round(attrs: FrozenSet[str]) -> Callable[[Any], Optional[int]]:
+    if "meta" in attrs:
+        def read(state: Any) -> Optional[int]:
+            meta = state.meta or {}
+            for key in ROUND_KEYS:
+                val = getattr(state, key, None)
+                if isinstance(val, int) and val >= 1:
+                    return val
+                val = meta.get(key)
+                if isinstance(val, int) and val >= 1:
+                    return val
+            return None
+        return read
+    keys = tuple(k for k in ROUND_KEYS if k in attrs)
+
+    def read_attrs(state: Any) -> Optional[int]:
+        for key in keys:
+            val = getattr(state, key)
+            if isinstance(val, int) and val >= 1:
+                return val
+        return None
+    return read_attrs
+
+def _undeclared(name: str) -> Callable[..., Any]:
+    # The type may still gain `name` at runtime: raise so callers probe the instance.
+    def read(state: Any, *args: Any) -> Any:
+        raise AttributeError(f"{type(state).__name__} does not declare {name!r}")
+    return read
+
+def _compile_state(tp: type) -> Optional[StateAdapter]:
+    attrs = declared_attrs(tp)
+    if attrs is None:
+        return None
+    if "active_player" in attrs:
+        active = lambda s: s.active_player or "you"
+    else:
+        active = _undeclared("active_player")
+    if "players" in attrs:
+        player = lambda s, pid: s.players.get(pid) if (pid and s.players) else None
+    else:
+        player = _undeclared("players")
+    if "map" in attrs:
+        hexes = lambda s: s.map.hexes.values()
+    else:
+        hexes = _undeclared("map")
+    return StateAdapter(active, player, _compile_round(attrs), hexes)
+
+def register_adapter(tp: type, adapter: StateAdapter) -> None:
+    """Install hand-written accessors for a state type (e.g. array-backed boards)."""
+    _STATE_ADAPTERS[tp] = adapter
+
+def adapter_for(state: Any) -> Optional[StateAdapter]:
+    """Compiled accessors for type(state), or None if the type can't be compiled."""
+    tp = type(state)
+    try:
+        return _STATE_ADAPTERS[tp]
+    except KeyError:
+        adapter = _STATE_ADAPTERS[tp] = _compile_state(tp)
+        return adapter
+
+def register_resource_reader(tp: type, reader: Callable[[Any], Tuple[int, int, int]]) -> None:
+    """Install a hand-written (materials, science, money) reader for a player type."""
+    _RESOURCE_READERS[tp] = reader
+
+def _compile_resources(tp: type) -> Optional[Callable[[Any], Tuple[int, int, int]]]:
+    if issubclass(tp, dict):
+        return lambda d: (int(d.get("materials", 0)), int(d.get("science", 0)), int(d.get("money", 0)))
+    attrs = declared_attrs(tp)
+    if attrs is None:
+        return None
+    if all(n in attrs for n in RESOURCE_NAMES):
+        return lambda p: (int(p.materials or 0), int(p.science or 0), int(p.money or 0))
+    return None
+
+def resource_reader_for(player: Any) -> Optional[Callable[[Any], Tuple[int, int, int]]]:
+    """Compiled (materials, science, money) reader for type(player), or None."""
+    tp = type(player)
+    try:
+        return _RESOURCE_READERS[tp]
+    except KeyError:
+        reader = _RESOURCE_READERS[tp] = _compile_resources(tp)
+        return reader
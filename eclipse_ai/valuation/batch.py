@@ -0,0 +1,117 @@
+# SPDX-License-Identifier: MIT
+from __future__ import annotations
+from typing import Any, List, Sequence, Tuple
+
+import numpy as np
+
+from .engine import ValuationConfig, _coerce_score, _components, _state_terms
+from .explain import explain_enabled, merge_breakdown
+from .instrument import INSTRUMENTATION
+from .features import WEIGHTED, Features, build_features
+from .phase import PhaseWeights, WEIGHT_FIELDS
+from .risk import risk_penalties
+
+def weight_vector(W: PhaseWeights) -> np.ndarray:
+    """Signed weight vector in WEIGHT_FIELDS order (subtractive terms negated)."""
+    return np.array(W.signed(), dtype=np.float64)
+
+def feature_matrix(features: Sequence[Features]) -> Tuple[np.ndarray, np.ndarray]:
+    """(vp_now column, weighted matrix): one row per action, one column per PhaseWeights field."""
+    if not features:
+        return np.empty(0, dtype=np.float64), np.empty((0, len(WEIGHT_FIELDS)), dtype=np.float64)
+    rows = np.array(features, dtype=np.float64)
+    return rows[:, 0], rows[:, WEIGHTED]
+
+def score_matrix(vp_now: np.ndarray, M: np.ndarray, w: np.ndarray) -> np.ndarray:
+    """
+    vp_now + M·w for every row (`w` is one weight vector, or one per row).
+
+    The weighted columns are accumulated left to right (cumsum is sequential, the
+    same order the scalar engine sums its components in) so the result is
+    bit-identical to the scalar path.
+    """
+    P = M * w
+    if P.shape[1] == 0:
+        return vp_now + 0.0
+    return vp_now + np.cumsum(P, axis=1)[:, -1]
+
+def apply_phase_valuation_batch(state: Any, actions: Sequence[Any], base_scores: Sequence[Any],
+                                cfg: ValuationConfig = ValuationConfig()) -> List[Any]:
+    """
+    Batched apply_phase_valuation over many candidate actions for one state.
+
+    State-only terms (round, phase weights, convertible VP shadow, opponent pressure)
+    are computed once; the per-action features are stacked into a matrix and scored
+    against the phase weight vector in one vectorized pass. Returns the Score-like
+    objects in input order, identical to calling apply_phase_valuation per action.
+    """
+    if len(actions) != len(base_scores):
+        raise ValueError("actions and base_scores must have the same length")
+    if not actions:
+        return []
+
+    sw = INSTRUMENTATION.stopwatch()  # None unless profiling is enabled
+    total_rounds, round_idx, W, _, cvp, opp = _state_terms(state, cfg, sw)
+
+    feats = [
+        build_features(state, action, base, cvp, opp, penalty, simulate_combat=cfg.simulate_combat)
+        for action, base, penalty in zip(actions, base_scores, risk_penalties(base_scores, cfg.risk))
+    ]
+    if sw:
+        sw.lap("build_features")
+    vp_now, M = feature_matrix(feats)
+    new_vp = score_matrix(vp_now, M, weight_vector(W))
+    if sw:
+        sw.lap("score")
+
+    explain = cfg.explain and explain_enabled()
+    out = []
+    for i, (base, F) in enumerate(zip(base_scores, feats)):
+        details = getattr(base, "details", {}) or {}
+        if explain:
+            details = merge_breakdown(details, _components(W, F), round_idx, total_rounds)
+        out.append(_coerce_score(base, expected_vp=float(new_vp[i]), details=details))
+    if sw:
+        sw.lap("merge_breakdown" if explain else "coerce_scores")
+        sw.finish(len(out))
+    return out
+
+def apply_phase_valuation_many(requests: Sequence[Tuple[Any, Sequence[Any], Sequence[Any]]],
+                               cfg: ValuationConfig = ValuationConfig()) -> List[List[Any]]:
+    """
+    apply_phase_valuation_batch across many states at once, e.g. several games.
+
+    `requests` is a sequence of (state, actions, base_scores). State-only terms are
+    computed once per state; the rows of every request are scored in one vectorized
+    pass, each row against the weights of its own round (requests in the same round
+    or phase share a weight vector). Returns one list of Scores per request, in order.
+    """
+    terms, feats, weights = [], [], []
+    for state, actions, base_scores in requests:
+        if len(actions) != len(base_scores):
+            raise ValueError("actions and base_scores must have the same length")
+        total_rounds, round_idx, W, _, cvp, opp = _state_terms(state, cfg)
+        terms.append((total_rounds, round_idx, W))
+        for action, base, penalty in zip(actions, base_scores, risk_penalties(base_scores, cfg.risk)):
+            feats.append(build_features(state, action, base, cvp, opp, penalty,
+                                        simulate_combat=cfg.simulate_combat))
+        weights.append(np.broadcast_to(weight_vector(W), (len(actions), len(WEIGHT_FIELDS))))
+    if not feats:
+        return [[] for _ in requests]
+
+    vp_now, M = feature_matrix(feats)
+    new_vp = score_matrix(vp_now, M, np.concatenate(weights))
+
+    explain = cfg.explain and explain_enabled()
+    out: List[List[Any]] = []
+    i = 0
+    for (total_rounds, round_idx, W), (_, _, base_scores) in zip(terms, requests):
+        scored = []
+        for base in base_scores:
+            details = getattr(base, "details", {}) or {}
+            if explain:
+                details = merge_breakdown(details, _components(W, feats[i]), round_idx, total_rounds)
+            scored.append(_coerce_score(base, expected_vp=float(new_vp[i]), details=details))
+            i += 1
+        out.append(scored)
+    return out
@@ -0,0 +1,108 @@
+# SPDX-License-Identifier: MIT
+from __future__ import annotations
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+def state_fingerprint(state: Any) -> Optional[Hashable]:
+    """
+    Cheap identity for a state *as of now*, or None if the state can't be keyed safely.
+
+    States opt in by exposing one of:
+      - state_hash() -> int         (e.g. an incrementally updated Zobrist hash)
+      - fingerprint() -> hashable   (content hash; equal boards share entries)
+      - version: int                (bumped on every mutation; keyed per object)
+    Anything else is treated as uncacheable, because we can't tell a mutated
+    state from the one we saw last time. Hash and fingerprint keys include the
+    active player: the cached terms are seen from that seat, and a position-only
+    hash does not change when the seat does (e.g. opponent_model.as_player views).
+    """
+    try:
+        h = getattr(state, "state_hash", None)
+        if callable(h):
+            return ("hash", type(state).__name__, h(), getattr(state, "active_player", None))
+        fp = getattr(state, "fingerprint", None)
+        if callable(fp):
+            return ("fp", type(state).__name__, fp(), getattr(state, "active_player", None))
+        version = getattr(state, "version", None)
+        if isinstance(version, int):
+            return ("ver", id(state), version)
+    except Exception:
+        pass
+    return None
+
+class StateCache:
+    """
+    Bounded LRU of state-only valuation terms (round, convertible VP, pressure).
+
+    One entry per state fingerprint holds every term computed for that state, so
+    scoring N actions against one state walks the state once. Entries keyed by
+    object id keep a weak reference to detect id reuse after garbage collection.
+    Thread-safe: a lock guards the LRU and counters (the planning service values
+    batches on a thread pool); terms are computed outside it, so two threads
+    missing the same term may both compute it and the last one stored wins.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self.maxsize = max(1, int(maxsize))
+        self._entries: "OrderedDict[Hashable, Tuple[Any, Dict[Hashable, Any]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    def _terms_for(self, state: Any, key: Hashable) -> Dict[Hashable, Any]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            ref, terms = entry
+            if ref is None or ref() is state:
+                self._entries.move_to_end(key)
+                return terms
+        ref = None
+        if key[0] == "ver":
+            ref = weakref.ref(state)  # raises TypeError for non-weakrefable states
+        terms = {}
+        self._entries[key] = (ref, terms)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return terms
+
+    def get_or_compute(self, state: Any, term: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return the cached value of `term` for `state`, computing it on a miss."""
+        key = state_fingerprint(state)
+        with self._lock:
+            try:
+                terms = None if key is None else self._terms_for(state, key)
+            except TypeError:
+                terms = None
+            if terms is not None and term in terms:
+                self.hits += 1
+                return terms[term]
+            self.misses += 1
+        val = compute()
+        if terms is not None:
+            with self._lock:
+                terms[term] = val
+        return val
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hit_rate": (self.hits / lookups) if lookups else 0.0,
+            }
+
+# Process-wide default used by the engine
+STATE_CACHE = StateCache()
@@ -1,20 +1,31 @@
 # SPDX-License-Identifier: MIT
 from __future__ import annotations
+import copy
 import os
-from dataclasses import dataclass
-from typing import Any, Dict
+from operator import mul
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
 
-from .phase import PhaseConfig, weights_for_round
-from .risk import RiskProfile, penalty_from_scalar_risk
+from .phase import PhaseConfig, PhaseWeights, weight_table, weights_for_round
+from .risk import RiskProfile, risk_multiplier, risk_penalty
 from .resource_prices import convertible_vp_shadow, infer_round_idx
 from .opponent import opponent_pressure_proxy
-from .features import build_features
-from .explain import merge_breakdown
+from .features import WEIGHTED, Features, build_features
+from .explain import explain_enabled, merge_breakdown
+from .cache import STATE_CACHE
+from .instrument import INSTRUMENTATION, _Stopwatch
 
 @dataclass
 class ValuationConfig:
-    phase: PhaseConfig = PhaseConfig()
-    risk: RiskProfile = RiskProfile()
+    phase: PhaseConfig = field(default_factory=PhaseConfig)
+    risk: RiskProfile = field(default_factory=RiskProfile)
+    use_state_cache: bool = True  # memoize state-only terms in STATE_CACHE
+    explain: bool = True          # write Score.details["valuation"] (see explain_disabled)
+    simulate_combat: bool = False # MOVEs without details["combat_win_prob"]: run combat.py
+
+    def compile(self) -> "CompiledValuation":
+        """Resolve env overrides, risk multiplier and weight table once (see CompiledValuation)."""
+        return CompiledValuation(self)
 
 def _read_env_int(name: str, default_val: int) -> int:
     try:
@@ -40,6 +51,34 @@ def _coerce_score(obj: Any, expected_vp: float, details: Dict[str, Any]) -> Any:
             # Worst case: return original, unmodified
             return obj
 
+def _state_terms(state: Any, cfg: ValuationConfig, sw: Optional[_Stopwatch] = None
+                 ) -> Tuple[int, int, PhaseWeights, Tuple[float, ...], float, float]:
+    """
+    Everything that depends only on the state (not the action):
+    (total_rounds, round_idx, phase weights, signed weights, convertible VP shadow,
+    opponent pressure), from the compiled valuation of `cfg` (see _compiled_for).
+    `sw` records per-stage timings when instrumentation is enabled.
+    """
+    return _compiled_for(cfg).state_terms(state, sw)
+
+def _bonus(SW: Tuple[float, ...], F: Features) -> float:
+    # Same products and left-to-right order as summing _components(), without the dict.
+    return sum(map(mul, SW, F[WEIGHTED]))
+
+def _components(W: PhaseWeights, F: Features) -> Dict[str, float]:
+    # IMPORTANT: `vp_now` (baseline EV) is already inside base_score.expected_vp
+    # We add only the *bonus/malus* components around it.
+    return {
+        "vp_now": F.vp_now,  # for transparency only; not added again
+        "convertible_vp": W.convertible_vp * F.convertible_vp,
+        "econ_growth":    W.econ_growth * F.econ_growth,
+        "tech_power":     W.tech_power * F.tech_power,
+        "fleet_power":    W.fleet_power * F.fleet_power,
+        "map_control":    W.map_control * F.map_control,
+        "risk_penalty":  -W.risk_penalty * F.risk_penalty,
+        "opp_pressure":  -W.opp_pressure * F.opp_pressure,
+    }
+
 def apply_phase_valuation(state: Any, action: Any, base_score: Any,
                           cfg: ValuationConfig = ValuationConfig()) -> Any:
     """
@@ -51,45 +90,118 @@ def apply_phase_valuation(state: Any, action: Any, base_score: Any,
       - Applies early/late weights
       - Adds a transparent breakdown into Score.details["valuation"]
       - Returns a Score-like object with adjusted expected_vp
+    The work is done by the CompiledValuation of `cfg`, looked up per call so that
+    config edits and env overrides still apply immediately.
     """
-    total_rounds = _read_env_int("ECLIPSE_TOTAL_ROUNDS", cfg.phase.total_rounds)
-    round_idx = _read_env_int("ECLIPSE_ROUND", infer_round_idx(state, default_round=1))
+    return _compiled_for(cfg)(state, action, base_score)
 
-    # Phase weights
-    W = weights_for_round(round_idx, PhaseConfig(
-        total_rounds=total_rounds,
-        early_until_round=cfg.phase.early_until_round,
-        taper_rounds=cfg.phase.taper_rounds,
-    ))
+def explain_valuation(state: Any, action: Any, base_score: Any,
+                      cfg: ValuationConfig = ValuationConfig()) -> Dict[str, Any]:
+    """
+    Build the Score.details breakdown on demand, e.g. for the move a search picked
+    while explanations were disabled. `base_score` is the *baseline* Score (before
+    phase valuation); it is not modified.
+    """
+    compiled = _compiled_for(cfg)
+    total_rounds, round_idx, W, SW, cvp, opp = compiled.state_terms(state)
+    F = build_features(state, action, base_score, cvp, opp, compiled.risk_penalty(base_score),
+                       simulate_combat=cfg.simulate_combat)
+    return merge_breakdown(getattr(base_score, "details", {}) or {}, _components(W, F),
+                           round_idx, total_rounds)
 
-    # Shadow VP from resources
-    cvp = convertible_vp_shadow(state, action, total_rounds=total_rounds, round_idx=round_idx)
+class CompiledValuation:
+    """
+    apply_phase_valuation specialized for one ValuationConfig: ECLIPSE_TOTAL_ROUNDS /
+    ECLIPSE_ROUND, the risk multiplier and the per-round weight table are resolved at
+    construction instead of per call. Scores are identical to apply_phase_valuation
+    under the same config and environment. It is a snapshot: after changing the
+    config or the env overrides, build a new one (evaluator.reload_valuation()).
+    """
+    __slots__ = ("cfg", "total_rounds", "round_override", "phase", "risk_mult",
+                 "_weights", "_signed", "_cached")
 
-    # Risk & pressure proxies
-    risk_scalar = penalty_from_scalar_risk(getattr(base_score, "risk", 0.0), cfg.risk)
-    opp = opponent_pressure_proxy(state, action)
+    def __init__(self, cfg: ValuationConfig):
+        self.cfg = cfg
+        self.total_rounds = _read_env_int("ECLIPSE_TOTAL_ROUNDS", cfg.phase.total_rounds)
+        self.round_override: Optional[int] = _read_env_int("ECLIPSE_ROUND", None)  # type: ignore[arg-type]
+        self.phase = PhaseConfig(
+            total_rounds=self.total_rounds,
+            early_until_round=cfg.phase.early_until_round,
+            taper_rounds=cfg.phase.taper_rounds,
+            early=cfg.phase.early,
+            late=cfg.phase.late,
+        )
+        self.risk_mult = risk_multiplier(cfg.risk)
+        self._weights = weight_table(self.phase)
+        self._signed = tuple(W.signed() for W in self._weights)
+        if cfg.use_state_cache:
+            self._cached = STATE_CACHE.get_or_compute
+        else:
+            self._cached = lambda _state, _term, compute: compute()
 
-    # Assemble features
-    F = build_features(state, action, base_score, cvp, opp, risk_scalar)
+    def state_terms(self, state: Any, sw: Optional[_Stopwatch] = None
+                    ) -> Tuple[int, int, PhaseWeights, Tuple[float, ...], float, float]:
+        """Same tuple as engine._state_terms, with the config-only parts precomputed."""
+        cached, total_rounds = self._cached, self.total_rounds
+        round_idx = self.round_override
+        if round_idx is None:
+            round_idx = cached(state, "round_idx", lambda: infer_round_idx(state, default_round=1))
+        if sw:
+            sw.lap("infer_round_idx")
+        if 0 <= round_idx < len(self._weights):
+            W, SW = self._weights[round_idx], self._signed[round_idx]
+        else:
+            W = weights_for_round(round_idx, self.phase)
+            SW = W.signed()
+        if sw:
+            sw.lap("phase_weights")
+        cvp = cached(state, ("convertible_vp", total_rounds, round_idx), lambda: convertible_vp_shadow(
+            state, None, total_rounds=total_rounds, round_idx=round_idx))
+        if sw:
+            sw.lap("convertible_vp_shadow")
+        opp = cached(state, "opp_pressure", lambda: opponent_pressure_proxy(state, None))
+        if sw:
+            sw.lap("opponent_pressure_proxy")
+        return total_rounds, round_idx, W, SW, cvp, opp
 
-    # IMPORTANT: `vp_now` (baseline EV) is already inside base_score.expected_vp
-    # We add only the *bonus/malus* components around it.
-    components = {
-        "vp_now": F.vp_now,  # for transparency only; not added again
-        "convertible_vp": W.convertible_vp * F.convertible_vp,
-        "econ_growth":    W.econ_growth * F.econ_growth,
-        "tech_power":     W.tech_power * F.tech_power,
-        "fleet_power":    W.fleet_power * F.fleet_power,
-        "map_control":    W.map_control * F.map_control,
-        "risk_penalty":  -W.risk_penalty * F.risk_penalty,
-        "opp_pressure":  -W.opp_pressure * F.opp_pressure,
-    }
+    def risk_penalty(self, base_score: Any) -> float:
+        if getattr(base_score, "samples", None) is not None:
+            return risk_penalty(base_score, self.cfg.risk)  # distributional (CVaR) path
+        return self.risk_mult * max(0.0, min(1.0, float(getattr(base_score, "risk", 0.0))))
 
-    bonus = sum(v for k, v in components.items() if k != "vp_now")
-    new_vp = float(F.vp_now + bonus)
+    def __call__(self, state: Any, action: Any, base_score: Any) -> Any:
+        """apply_phase_valuation(state, action, base_score, cfg) for the compiled cfg."""
+        sw = INSTRUMENTATION.stopwatch()
+        total_rounds, round_idx, W, SW, cvp, opp = self.state_terms(state, sw)
+        F = build_features(state, action, base_score, cvp, opp,
+                           self.risk_penalty(base_score), simulate_combat=self.cfg.simulate_combat)
+        if sw:
+            sw.lap("build_features")
+        new_vp = float(F.vp_now + _bonus(SW, F))
+        if sw:
+            sw.lap("score")
+        details = getattr(base_score, "details", {}) or {}
+        if self.cfg.explain and explain_enabled():
+            details = merge_breakdown(details, _components(W, F), round_idx, total_rounds)
+            if sw:
+                sw.lap("merge_breakdown")
+        out = _coerce_score(base_score, expected_vp=new_vp, details=details)
+        if sw:
+            sw.finish()
+        return out
 
-    # Merge explainable breakdown
-    details = merge_breakdown(getattr(base_score, "details", {}) or {}, components, round_idx, total_rounds)
+# id(cfg) -> (cfg, env overrides, config snapshot, compiled). Holding cfg keeps its id
+# from being reused; the snapshot catches configs edited in place.
+_COMPILED: Dict[int, Tuple[ValuationConfig, Tuple[Optional[str], ...], ValuationConfig, CompiledValuation]] = {}
+_COMPILED_LIMIT = 64
 
-    # Return an updated Score
-    return _coerce_score(base_score, expected_vp=new_vp, details=details)
+def _compiled_for(cfg: ValuationConfig) -> CompiledValuation:
+    env = (os.environ.get("ECLIPSE_TOTAL_ROUNDS"), os.environ.get("ECLIPSE_ROUND"))
+    entry = _COMPILED.get(id(cfg))
+    if entry is not None and entry[0] is cfg and entry[1] == env and entry[2] == cfg:
+        return entry[3]
+    compiled = cfg.compile()
+    if len(_COMPILED) >= _COMPILED_LIMIT:
+        _COMPILED.clear()
+    _COMPILED[id(cfg)] = (cfg, env, copy.deepcopy(cfg), compiled)
+    return compiled
@@ -1,6 +1,31 @@
 # SPDX-License-Identifier: MIT
 from __future__ import annotations
-from typing import Dict, Any
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Any, Iterator
+
+# Whether apply_phase_valuation writes Score.details["valuation"] (per context)
+_EXPLAIN: ContextVar[bool] = ContextVar("eclipse_valuation_explain", default=True)
+
+def explain_enabled() -> bool:
+    return _EXPLAIN.get()
+
+@contextmanager
+def explaining(enabled: bool) -> Iterator[None]:
+    """Turn the Score.details breakdown on or off inside this block."""
+    token = _EXPLAIN.set(bool(enabled))
+    try:
+        yield
+    finally:
+        _EXPLAIN.reset(token)
+
+def explain_disabled():
+    """
+    Skip the Score.details breakdown inside this block (search hot path).
+    Scores are unchanged; rebuild the breakdown for the chosen move with
+    evaluator.explain_action() / engine.explain_valuation() afterwards.
+    """
+    return explaining(False)
 
 def merge_breakdown(details: Dict[str, Any],
                     components: Dict[str, float],
@@ -1,11 +1,15 @@
 # SPDX-License-Identifier: MIT
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Any, Dict
+from typing import Any, Dict, NamedTuple
 from ..game_models import ActionType  # enum in your repo
+from .phase import WEIGHT_FIELDS
+from .techs import lookup_tech
 
-@dataclass
-class Features:
+class Features(NamedTuple):
+    # Tuple-backed: F[WEIGHTED] lines up with PhaseWeights field order.
+    # Being a NamedTuple (formerly a dataclass), it compares and iterates as a
+    # tuple, is immutable (use F._replace) and `raw` is a read-only property
+    # derived from vp_now/risk rather than a constructor argument.
     vp_now: float                 # baseline EV from legacy evaluator
     convertible_vp: float         # shadow VP from resources
     econ_growth: float            # heuristic for engine building
@@ -14,10 +18,16 @@ class Features:
     map_control: float            # adjacency/safe hex positional value
     risk_penalty: float           # scalar risk mapped to penalty (0..1)
     opp_pressure: float           # threat/pressure proxy (0..1)
-    raw: Dict[str, float]         # for debugging/explain
+    risk: float = 0.0             # raw Score.risk, kept for explain
 
-def _lower(s: str) -> str:
-    return (s or "").lower()
+    @property
+    def raw(self) -> Dict[str, float]:
+        """Debug/explain view, built on demand."""
+        return {"vp_now": self.vp_now, "risk": self.risk}
+
+# Slice of a Features tuple holding the weighted columns
+WEIGHTED = slice(1, 1 + len(WEIGHT_FIELDS))
+assert Features._fields[WEIGHTED] == WEIGHT_FIELDS
 
 def _payload_tech_name(action: Any) -> str:
     try:
@@ -25,18 +35,18 @@ def _payload_tech_name(action: Any) -> str:
     except Exception:
         return ""
 
-def _econ_tech_score(name_lower: str) -> float:
-    keys = ("advanced mining", "advanced labs", "nanorobots")
-    return 1.0 if any(k in name_lower for k in keys) else 0.0
-
-def _combat_tech_score(name_lower: str) -> float:
-    keys = ("plasma", "positron", "gauss", "ion", "shield", "drive", "hull", "starbase")
-    return 1.0 if any(k in name_lower for k in keys) else 0.0
+def _simulated_win_prob(state: Any, action: Any) -> float:
+    try:
+        from ..combat import combat_details  # NumPy-backed; optional
+        return float(combat_details(state, action).get("combat_win_prob", 0.0))
+    except Exception:
+        return 0.0
 
 def build_features(state: Any, action: Any, base_score: Any,
                    convertible_vp: float,
                    opponent_pressure: float,
-                   risk_penalty_scalar: float) -> Features:
+                   risk_penalty_scalar: float,
+                   simulate_combat: bool = False) -> Features:
     t = getattr(action, "type", None)
     details = getattr(base_score, "details", {}) or {}
     vp_now = float(getattr(base_score, "expected_vp", 0.0))
@@ -54,9 +64,9 @@ def build_features(state: Any, action: Any, base_score: Any,
         econ_growth += 0.6
         map_control += 0.3
     elif t == ActionType.RESEARCH:
-        name = _lower(_payload_tech_name(action))
-        econ_growth += 0.7 * _econ_tech_score(name)
-        tech_power += 0.7 * _combat_tech_score(name) + 0.3 * _econ_tech_score(name)
+        tech = lookup_tech(_payload_tech_name(action))
+        econ_growth += 0.7 * tech.econ
+        tech_power += 0.7 * tech.combat + 0.3 * tech.econ
     elif t == ActionType.BUILD:
         # Weight heavier ships a bit higher (mirrors your evaluator’s proxy)
         ships = {}
@@ -75,9 +85,11 @@ def build_features(state: Any, action: Any, base_score: Any,
         if details.get("positional"):
             # reward good positional moves
             map_control += 0.3 + 0.2 * float(details.get("territory_ev", 0.0))
-        # if we have win prob from combat sim, reflect it
-        pwin = float(details.get("combat_win_prob", 0.0))
-        fleet_power += 1.2 * pwin
+        # if we have win prob from combat sim, reflect it (opt-in: simulate the payload's battle)
+        pwin = details.get("combat_win_prob")
+        if pwin is None and simulate_combat:
+            pwin = _simulated_win_prob(state, action)
+        fleet_power += 1.2 * float(pwin or 0.0)
 
     # risk penalty scalar is already 0..1-ish
     risk_penalty = float(risk_penalty_scalar)
@@ -86,16 +98,13 @@ def build_features(state: Any, action: Any, base_score: Any,
     opp_pressure = float(details.get("pressure", opponent_pressure))
 
     return Features(
-        vp_now=vp_now,
-        convertible_vp=float(convertible_vp),
-        econ_growth=float(econ_growth),
-        tech_power=float(tech_power),
-        fleet_power=float(fleet_power),
-        map_control=float(map_control),
-        risk_penalty=risk_penalty,
-        opp_pressure=opp_pressure,
-        raw={
-            "vp_now": vp_now,
-            "risk": float(getattr(base_score, "risk", 0.0)),
-        },
+        vp_now,
+        float(convertible_vp),
+        float(econ_growth),
+        float(tech_power),
+        float(fleet_power),
+        float(map_control),
+        risk_penalty,
+        opp_pressure,
+        float(getattr(base_score, "risk", 0.0)),
     )
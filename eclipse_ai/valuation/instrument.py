@@ -0,0 +1,130 @@
+# SPDX-License-Identifier: MIT
+from __future__ import annotations
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger("eclipse_ai.valuation")
+
+class _Stopwatch:
+    """Lap timer for one valuation; only created while instrumentation is enabled."""
+    __slots__ = ("_instr", "_start", "_last")
+
+    def __init__(self, instr: "Instrumentation") -> None:
+        self._instr = instr
+        self._start = self._last = time.perf_counter_ns()
+
+    def lap(self, stage: str) -> None:
+        now = time.perf_counter_ns()
+        self._instr._add(stage, now - self._last)
+        self._last = now
+
+    def finish(self, valuations: int = 1) -> None:
+        self._instr._add("total", time.perf_counter_ns() - self._start)
+        self._instr.count("valuations", valuations)
+        self._instr.maybe_log()
+
+class Instrumentation:
+    """
+    Opt-in per-stage timers and counters for the valuation hot path.
+
+    Disabled (the default) the engine pays one attribute check per valuation.
+    Enable in code with INSTRUMENTATION.enable(log_interval=...) or by setting
+    ECLIPSE_VALUATION_PROFILE=1 (optionally ECLIPSE_VALUATION_PROFILE_LOG=<seconds>).
+    Fail-open fallbacks in the evaluator are counted even while disabled.
+    Updates take a lock, so worker threads valuing in parallel don't lose counts.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.log_interval: Optional[float] = None
+        self._last_log = time.monotonic()
+        self._timings: Dict[str, List[int]] = {}   # stage -> [calls, total_ns, max_ns]
+        self._counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def enable(self, log_interval: Optional[float] = None) -> None:
+        """Start timing; log a stats line every `log_interval` seconds if given."""
+        self.enabled = True
+        self.log_interval = log_interval
+        self._last_log = time.monotonic()
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def reset(self) -> None:
+        with self._lock:
+            self._timings.clear()
+            self._counters.clear()
+
+    def stopwatch(self) -> Optional[_Stopwatch]:
+        return _Stopwatch(self) if self.enabled else None
+
+    def _add(self, stage: str, ns: int) -> None:
+        with self._lock:
+            t = self._timings.get(stage)
+            if t is None:
+                self._timings[stage] = [1, ns, ns]
+            else:
+                t[0] += 1
+                t[1] += ns
+                if ns > t[2]:
+                    t[2] = ns
+
+    def count(self, name: str, n: int = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + n
+
+    def stats(self) -> Dict[str, Any]:
+        """Timings (microseconds) per stage and counters, as a plain dict."""
+        with self._lock:
+            timings = {stage: tuple(t) for stage, t in self._timings.items()}
+            counters = dict(self._counters)
+        return {
+            "enabled": self.enabled,
+            "stages": {
+                stage: {
+                    "calls": calls,
+                    "total_us": total / 1e3,
+                    "mean_us": total / 1e3 / calls,
+                    "max_us": worst / 1e3,
+                }
+                for stage, (calls, total, worst) in timings.items()
+            },
+            "counters": counters,
+        }
+
+    def log_line(self) -> str:
+        with self._lock:
+            counters = sorted(self._counters.items())
+            timings = sorted((stage, tuple(t)) for stage, t in self._timings.items())
+        parts = [f"{k}={v}" for k, v in counters]
+        parts += [f"{stage}={calls}x{total / 1e3 / calls:.1f}us"
+                  for stage, (calls, total, _) in timings]
+        return "valuation stats: " + " ".join(parts)
+
+    def maybe_log(self) -> None:
+        if self.log_interval is None:
+            return
+        now = time.monotonic()
+        if now - self._last_log >= self.log_interval:
+            self._last_log = now
+            logger.info(self.log_line())
+
+INSTRUMENTATION = Instrumentation()
+
+if os.environ.get("ECLIPSE_VALUATION_PROFILE", "") not in ("", "0"):
+    try:
+        _interval: Optional[float] = float(os.environ["ECLIPSE_VALUATION_PROFILE_LOG"])
+    except Exception:
+        _interval = None
+    INSTRUMENTATION.enable(log_interval=_interval)
+
+def valuation_stats() -> Dict[str, Any]:
+    """Instrumentation stats plus the state cache counters."""
+    from .cache import STATE_CACHE
+    out = INSTRUMENTATION.stats()
+    out["state_cache"] = STATE_CACHE.stats()
+    return out
@@ -2,31 +2,47 @@
 from __future__ import annotations
 from typing import Any
 
+from .adapters import adapter_for
+from .spatial import pressure_from_counts
+
+def _iter_hexes(state: Any) -> Any:
+    adapter = adapter_for(state)
+    if adapter is not None:
+        try:
+            return adapter.hexes(state)
+        except Exception:
+            pass
+    m = getattr(state, "map", None)
+    hexes = getattr(m, "hexes", {}) if m else {}
+    return getattr(hexes, "values", lambda: [])()
+
 def opponent_pressure_proxy(state: Any, action: Any) -> float:
     """
     0..1-ish proxy of how hot the local neighborhood is.
     Falls back to 0 if state schema doesn't expose needed fields.
+    Uses state.occupancy_index (a spatial.HexOccupancyIndex) in O(1) when present.
     """
-    # Try to reuse any pressure your evaluator already computed (e.g., research case).
     try:
+        pid = getattr(state, "active_player", None)
+        index = getattr(state, "occupancy_index", None)
+        if index is not None:
+            return index.pressure(pid)
+
         # If the caller passed Score.details with "pressure", engine will pick it up separately.
         # Here we only do a coarse fallback on the map if available.
-        m = getattr(state, "map", None)
-        hexes = getattr(m, "hexes", {}) if m else {}
         contested = 0
         yours = 0
-        pid = getattr(state, "active_player", None)
-        for hx in getattr(hexes, "values", lambda: [])():
+        for hx in _iter_hexes(state):
             pieces = getattr(hx, "pieces", {})
             you_here = pid in pieces and any(int(v) > 0 for v in getattr(pieces[pid], "ships", {}).values())
             if you_here:
                 yours += 1
-                others = sum(int(v) for owner, p in pieces.items() if owner != pid for v in getattr(p, "ships", {}).values()) + int(getattr(p, "starbase", 0))
+                others = sum(
+                    sum(int(v) for v in getattr(p, "ships", {}).values()) + int(getattr(p, "starbase", 0) or 0)
+                    for owner, p in pieces.items() if owner != pid
+                )
                 if others > 0:
                     contested += 1
-        if yours == 0:
-            return 0.0
-        frac = contested / float(max(1, yours))
-        return max(0.0, min(1.0, 0.2 + 0.6 * frac))
+        return pressure_from_counts(yours, contested)
     except Exception:
         return 0.0
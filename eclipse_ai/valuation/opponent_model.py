@@ -0,0 +1,123 @@
+# SPDX-License-Identifier: MIT
+"""
+Opponent best-response model: what each rival is likely to do next.
+
+opponent_pressure_proxy only counts contested hexes. Here every rival's candidate
+actions are scored with the same phase-aware valuation, from that rival's point of
+view, in ONE apply_phase_valuation_many batch across all rivals. Each rival's
+values become a softmax reply distribution (temperature -> 0 is a pure best
+response), and the expected reply values add up to a predicted-threat term in VP.
+"""
+from __future__ import annotations
+import copy
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .batch import apply_phase_valuation_many
+from .engine import ValuationConfig
+from .resource_prices import _get_active_player
+
+class ReplyForecast(NamedTuple):
+    player: str
+    actions: Tuple[Any, ...]
+    values: np.ndarray    # phase-aware value of each action for `player`
+    probs: np.ndarray     # softmax reply distribution over `actions`
+
+    @property
+    def expected_value(self) -> float:
+        return float(self.probs @ self.values) if len(self.actions) else 0.0
+
+    @property
+    def best_action(self) -> Any:
+        return self.actions[int(np.argmax(self.values))] if len(self.actions) else None
+
+class OpponentForecast(NamedTuple):
+    replies: Dict[str, ReplyForecast]
+    threat: float         # sum over rivals of their expected reply value (VP)
+
+    def distribution(self, player: str) -> List[Tuple[Any, float]]:
+        """(action, probability) pairs of `player`'s likely replies, most likely first."""
+        r = self.replies.get(player)
+        if r is None:
+            return []
+        order = np.argsort(-r.probs, kind="stable")
+        return [(r.actions[i], float(r.probs[i])) for i in order]
+
+def softmax(values: np.ndarray, temperature: float = 1.0) -> np.ndarray:
+    """Reply probabilities; temperature <= 0 puts all mass on the best value(s)."""
+    values = np.asarray(values, dtype=np.float64)
+    if values.size == 0:
+        return values
+    if temperature <= 0:
+        best = values == values.max()
+        return best / best.sum()
+    z = np.exp((values - values.max()) / temperature)
+    return z / z.sum()
+
+def player_ids(state: Any) -> List[str]:
+    ids = getattr(state, "player_ids", None)
+    if ids is None:
+        ids = list(getattr(state, "players", {}) or {})
+    return list(ids)
+
+def as_player(state: Any, pid: str) -> Any:
+    """`state` seen from `pid`'s seat: with_active_player(pid) if offered, else a shallow copy."""
+    switch = getattr(state, "with_active_player", None)
+    if callable(switch):
+        return switch(pid)
+    view = copy.copy(state)
+    view.active_player = pid
+    return view
+
+def _baseline(state: Any, action: Any) -> Any:
+    from ..evaluator import _EVALUATE_ACTION_BASELINE
+    return _EVALUATE_ACTION_BASELINE(state, action)
+
+@dataclass
+class OpponentModel:
+    """
+    enumerate_actions(state) lists the candidate actions of state's active player
+    (e.g. a planning AI's candidate_actions); base_scorer(state, action) returns the
+    baseline Score (default: the evaluator's baseline). max_actions caps the
+    candidates per rival to bound the batch size.
+    """
+    enumerate_actions: Callable[[Any], Sequence[Any]]
+    base_scorer: Callable[[Any, Any], Any] = _baseline
+    cfg: ValuationConfig = field(default_factory=lambda: ValuationConfig(explain=False))
+    temperature: float = 1.0
+    max_actions: Optional[int] = None
+
+    def forecast(self, state: Any, rivals: Optional[Sequence[str]] = None) -> OpponentForecast:
+        """Reply distributions of every rival (default: all players but the active one)."""
+        if rivals is None:
+            me = _get_active_player(state)
+            rivals = [pid for pid in player_ids(state) if pid != me]
+        requests = []
+        for pid in rivals:
+            view = as_player(state, pid)
+            actions = tuple(self.enumerate_actions(view))[:self.max_actions]
+            requests.append((view, actions, [self.base_scorer(view, a) for a in actions]))
+
+        scored = apply_phase_valuation_many(requests, self.cfg)  # one batch, all rivals
+        replies = {}
+        for pid, (_, actions, _), scores in zip(rivals, requests, scored):
+            values = np.fromiter((float(getattr(s, "expected_vp", 0.0)) for s in scores),
+                                 dtype=np.float64, count=len(scores))
+            replies[pid] = ReplyForecast(pid, actions, values, softmax(values, self.temperature))
+        return OpponentForecast(replies, float(sum(r.expected_value for r in replies.values())))
+
+    def threat_after(self, state: Any, action: Any) -> float:
+        """Predicted threat once the active player has played `action` (state is not modified)."""
+        me = _get_active_player(state)
+        nxt = state.clone()
+        nxt.apply_action(action)
+        return self.forecast(nxt, [pid for pid in player_ids(state) if pid != me]).threat
+
+def threat_aware_scorer(scorer: Callable[[Any, Any], float], model: OpponentModel,
+                        weight: float = 1.0) -> Callable[[Any, Any], float]:
+    """Planner scorer: scorer(state, action) minus `weight` x the threat left after it."""
+    def score(state: Any, action: Any) -> float:
+        return float(scorer(state, action)) - weight * model.threat_after(state, action)
+    return score
@@ -1,16 +1,14 @@
 # SPDX-License-Identifier: MIT
 from __future__ import annotations
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import NamedTuple, Optional, Tuple
 
-@dataclass
-class PhaseConfig:
-    total_rounds: int = 9         # Eclipse standard
-    early_until_round: int = 6    # 1–6 = growth mode; 7–9 = VP mode
-    taper_rounds: int = 2         # smooth handoff 6→8
-
-@dataclass
-class PhaseWeights:
+class PhaseWeights(NamedTuple):
     # weights applied to normalized/heuristic features (NOT counting vp_now)
+    # Tuple-backed: fixed field indices, no per-instance dict. As a NamedTuple
+    # (formerly a dataclass) it compares and iterates as a tuple; use W._replace
+    # instead of dataclasses.replace.
     convertible_vp: float
     econ_growth: float
     tech_power: float
@@ -19,6 +17,15 @@ class PhaseWeights:
     risk_penalty: float   # subtractive
     opp_pressure: float   # subtractive
 
+    def signed(self) -> Tuple[float, ...]:
+        """Weights in field order with the subtractive terms negated."""
+        return tuple(-w if k in SUBTRACTIVE_FIELDS else w for k, w in zip(WEIGHT_FIELDS, self))
+
+# Column order shared by every vectorized consumer of PhaseWeights
+WEIGHT_FIELDS = PhaseWeights._fields
+# Components that are subtracted rather than added
+SUBTRACTIVE_FIELDS = frozenset({"risk_penalty", "opp_pressure"})
+
 EARLY = PhaseWeights(
     convertible_vp=0.45,
     econ_growth=1.00,
@@ -39,22 +46,70 @@ LATE = PhaseWeights(
     opp_pressure=0.25,
 )
 
+@dataclass
+class PhaseConfig:
+    total_rounds: int = 9         # Eclipse standard
+    early_until_round: int = 6    # 1–6 = growth mode; 7–9 = VP mode
+    taper_rounds: int = 2         # smooth handoff 6→8
+    early: Optional[PhaseWeights] = None   # None = module EARLY (e.g. tuned weights)
+    late: Optional[PhaseWeights] = None    # None = module LATE
+
 def _lerp(a: float, b: float, t: float) -> float:
     return a + (b - a) * t
 
 def _blend(a: PhaseWeights, b: PhaseWeights, t: float) -> PhaseWeights:
-    return PhaseWeights(**{
-        k: _lerp(getattr(a, k), getattr(b, k), t) for k in a.__dict__.keys()
-    })
+    return PhaseWeights(*(_lerp(x, y, t) for x, y in zip(a, b)))
 
-def weights_for_round(round_idx: int, cfg: PhaseConfig) -> PhaseWeights:
+def _blend_t(round_idx: int, early_until_round: int, taper_rounds: int) -> float:
     # Hard late if past early cutoff
-    if round_idx > cfg.early_until_round:
-        return LATE
+    if round_idx > early_until_round:
+        return 1.0
     # Taper into LATE during the final "taper_rounds" of early
-    start = max(1, cfg.early_until_round - cfg.taper_rounds + 1)
+    start = max(1, early_until_round - taper_rounds + 1)
     if round_idx < start:
-        return EARLY
-    span = max(1, cfg.early_until_round - start + 1)
-    t = (round_idx - start) / float(span)  # 0..1 across taper
-    return _blend(EARLY, LATE, t)
+        return 0.0
+    span = max(1, early_until_round - start + 1)
+    return (round_idx - start) / float(span)  # 0..1 across taper
+
+def blend_factor(round_idx: int, cfg: PhaseConfig) -> float:
+    """Position between EARLY (0.0) and LATE (1.0) weights for a round."""
+    return _blend_t(round_idx, cfg.early_until_round, cfg.taper_rounds)
+
+def _compute_weights(round_idx: int, early_until_round: int, taper_rounds: int,
+                     early: PhaseWeights, late: PhaseWeights) -> PhaseWeights:
+    t = _blend_t(round_idx, early_until_round, taper_rounds)
+    if t >= 1.0:
+        return late
+    if t <= 0.0:
+        return early
+    return _blend(early, late, t)
+
+def _key(cfg: PhaseConfig) -> Tuple[int, int, int, PhaseWeights, PhaseWeights]:
+    return (cfg.total_rounds, cfg.early_until_round, cfg.taper_rounds,
+            cfg.early or EARLY, cfg.late or LATE)
+
+@lru_cache(maxsize=64)
+def _table(total_rounds: int, early_until_round: int, taper_rounds: int, early: PhaseWeights,
+           late: PhaseWeights) -> Tuple[Tuple[PhaseWeights, ...], Tuple[Tuple[float, ...], ...]]:
+    # Index 0 is unused so that rounds index the table directly (1..total_rounds).
+    rounds = range(0, max(1, total_rounds) + 1)
+    weights = tuple(_compute_weights(r, early_until_round, taper_rounds, early, late) for r in rounds)
+    return weights, tuple(W.signed() for W in weights)
+
+def weight_table(cfg: PhaseConfig) -> Tuple[PhaseWeights, ...]:
+    """Precomputed PhaseWeights for every round of `cfg`, indexed by round."""
+    return _table(*_key(cfg))[0]
+
+def signed_weights_for_round(round_idx: int, cfg: PhaseConfig) -> Tuple[float, ...]:
+    """weights_for_round(...).signed(), served from the precomputed table."""
+    signed = _table(*_key(cfg))[1]
+    if 0 <= round_idx < len(signed):
+        return signed[round_idx]
+    return weights_for_round(round_idx, cfg).signed()
+
+def weights_for_round(round_idx: int, cfg: PhaseConfig) -> PhaseWeights:
+    table = weight_table(cfg)
+    if 0 <= round_idx < len(table):
+        return table[round_idx]
+    return _compute_weights(round_idx, cfg.early_until_round, cfg.taper_rounds,
+                            cfg.early or EARLY, cfg.late or LATE)
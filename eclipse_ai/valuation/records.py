@@ -0,0 +1,236 @@
+# SPDX-License-Identifier: MIT
+"""
+Compact binary record format for recorded decisions.
+
+One fixed-width row per (state, action, base score) decision, columnar via a NumPy
+structured dtype: round, active player's resources, a map occupancy summary,
+ActionType, a short payload, the baseline Score, the engine Features and an
+optional outcome. Files are a 64-byte header followed by rows; RecordWriter
+appends in buffered chunks and open_records() maps the rows with numpy.memmap, so
+corpora far larger than RAM can be replayed and re-scored chunk by chunk.
+"""
+from __future__ import annotations
+import json
+import logging
+import os
+import struct
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+import numpy as np
+
+from ..game_models import ActionType
+from .batch import score_matrix
+from .engine import ValuationConfig, _state_terms
+from .features import WEIGHTED, Features, build_features
+from .opponent import _iter_hexes
+from .phase import PhaseConfig, blend_factor, signed_weights_for_round
+from .resource_prices import _get_active_player, _get_player, _read_resources
+from .risk import risk_penalty
+
+_log = logging.getLogger(__name__)
+
+MAGIC = b"ECLREC\x00\x01"
+FORMAT_VERSION = 2
+HEADER_SIZE = 64
+PAYLOAD_BYTES = 128
+ACTION_TYPES = tuple(ActionType)
+
+RECORD_DTYPE = np.dtype([
+    ("round", "<u2"),
+    ("action_type", "<u1"),            # index into ACTION_TYPES
+    ("payload", f"S{PAYLOAD_BYTES}"),  # compact JSON of action.payload, empty if it overflowed
+    ("resources", "<i4", (3,)),        # materials, science, money of the active player
+    ("occupancy", "<u2", (4,)),        # hexes, own hexes, contested hexes, rival ships
+    ("base_vp", "<f8"),
+    ("base_risk", "<f8"),
+    ("features", "<f8", (len(Features._fields),)),
+    ("outcome", "<f8"),                # NaN when unknown
+])
+
+# magic, format version, row size, number of fields
+_HEADER = struct.Struct("<8sIII")
+
+def _header() -> bytes:
+    head = _HEADER.pack(MAGIC, FORMAT_VERSION, RECORD_DTYPE.itemsize, len(RECORD_DTYPE.names))
+    return head.ljust(HEADER_SIZE, b"\x00")
+
+def _check_header(raw: bytes, path: str) -> None:
+    if len(raw) < HEADER_SIZE:
+        raise ValueError(f"{path}: truncated record file header")
+    magic, version, itemsize, nfields = _HEADER.unpack_from(raw)
+    if magic != MAGIC:
+        raise ValueError(f"{path}: not a decision record file")
+    if (version, itemsize, nfields) != (FORMAT_VERSION, RECORD_DTYPE.itemsize, len(RECORD_DTYPE.names)):
+        raise ValueError(f"{path}: unsupported record format (version {version}, row size {itemsize})")
+
+class PayloadOverflow(ValueError):
+    """The action payload's compact JSON is longer than PAYLOAD_BYTES."""
+
+def _encode_payload(action: Any) -> bytes:
+    try:
+        payload = getattr(action, "payload", None) or {}
+        raw = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str).encode()
+    except Exception:
+        return b""
+    if len(raw) > PAYLOAD_BYTES:
+        raise PayloadOverflow(f"payload needs {len(raw)} bytes, rows hold {PAYLOAD_BYTES}")
+    return raw
+
+def decode_payload(raw: bytes) -> Dict[str, Any]:
+    """Payload dict of a stored row ({} if it was empty or overflowed, see RecordWriter)."""
+    try:
+        return json.loads(raw.rstrip(b"\x00") or b"{}")
+    except Exception:
+        return {}
+
+def _occupancy(state: Any, pid: Optional[str]) -> tuple:
+    hexes = own = contested = rival_ships = 0
+    try:
+        for hx in _iter_hexes(state):
+            hexes += 1
+            pieces = getattr(hx, "pieces", {}) or {}
+            mine = pid in pieces and any(int(v) > 0 for v in getattr(pieces[pid], "ships", {}).values())
+            others = sum(sum(int(v) for v in getattr(p, "ships", {}).values())
+                         for owner, p in pieces.items() if owner != pid)
+            own += mine
+            contested += mine and others > 0
+            rival_ships += others
+    except Exception:
+        pass
+    return tuple(min(int(x), 0xFFFF) for x in (hexes, own, contested, rival_ships))
+
+def _encode(state: Any, action: Any, base_score: Any, outcome: float,
+            cfg: ValuationConfig) -> Tuple[np.void, Optional[PayloadOverflow]]:
+    _, round_idx, _, _, cvp, opp = _state_terms(state, cfg)
+    F = build_features(state, action, base_score, cvp, opp,
+                       risk_penalty(base_score, cfg.risk), simulate_combat=cfg.simulate_combat)
+    pid = _get_active_player(state)
+    t = getattr(action, "type", None)
+    row = np.zeros((), dtype=RECORD_DTYPE)
+    row["round"] = max(0, round_idx)
+    row["action_type"] = ACTION_TYPES.index(t) if t in ACTION_TYPES else 0xFF
+    overflow = None
+    try:
+        row["payload"] = _encode_payload(action)
+    except PayloadOverflow as exc:
+        overflow = exc
+    row["resources"] = _read_resources(_get_player(state, pid))
+    row["occupancy"] = _occupancy(state, pid)
+    row["base_vp"] = float(getattr(base_score, "expected_vp", 0.0))
+    row["base_risk"] = float(getattr(base_score, "risk", 0.0))
+    row["features"] = F
+    row["outcome"] = outcome
+    return row[()], overflow
+
+def encode_record(state: Any, action: Any, base_score: Any, outcome: float = float("nan"),
+                  cfg: ValuationConfig = ValuationConfig()) -> np.void:
+    """
+    One RECORD_DTYPE row for a decision; features come from the valuation engine.
+    Raises PayloadOverflow if the action payload does not fit in PAYLOAD_BYTES.
+    """
+    row, overflow = _encode(state, action, base_score, outcome, cfg)
+    if overflow is not None:
+        raise overflow
+    return row
+
+class RecordWriter:
+    """
+    Streaming appender: rows are buffered and written `chunk` at a time.
+    Appending to an existing file validates its header first. A payload longer
+    than PAYLOAD_BYTES is stored empty and counted in `payload_overflows`
+    (logged once per writer) rather than failing the append.
+    """
+
+    def __init__(self, path: str, cfg: ValuationConfig = ValuationConfig(), chunk: int = 4096):
+        self.path = path
+        self.cfg = cfg
+        self._buf = np.zeros(max(1, chunk), dtype=RECORD_DTYPE)
+        self._n = 0
+        self.payload_overflows = 0
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        if exists:
+            with open(path, "rb") as fh:
+                _check_header(fh.read(HEADER_SIZE), path)
+        self._fh = open(path, "ab")
+        if not exists:
+            self._fh.write(_header())
+
+    def append(self, state: Any, action: Any, base_score: Any, outcome: float = float("nan")) -> None:
+        row, overflow = _encode(state, action, base_score, outcome, self.cfg)
+        if overflow is not None:
+            if not self.payload_overflows:
+                _log.warning("%s: %s; storing empty payloads for such rows", self.path, overflow)
+            self.payload_overflows += 1
+        self.append_row(row)
+
+    def append_row(self, row: np.void) -> None:
+        self._buf[self._n] = row
+        self._n += 1
+        if self._n == len(self._buf):
+            self.flush()
+
+    def flush(self) -> None:
+        if self._n:
+            self._fh.write(self._buf[:self._n].tobytes())
+            self._n = 0
+        self._fh.flush()
+
+    def close(self) -> None:
+        if not self._fh.closed:
+            self.flush()
+            self._fh.close()
+
+    def __enter__(self) -> "RecordWriter":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+def open_records(path: str) -> np.ndarray:
+    """Read-only memory map of every row in a record file (nothing is loaded eagerly)."""
+    with open(path, "rb") as fh:
+        _check_header(fh.read(HEADER_SIZE), path)
+    n = (os.path.getsize(path) - HEADER_SIZE) // RECORD_DTYPE.itemsize
+    if n == 0:
+        return np.zeros(0, dtype=RECORD_DTYPE)
+    return np.memmap(path, dtype=RECORD_DTYPE, mode="r", offset=HEADER_SIZE, shape=(n,))
+
+def iter_chunks(records: np.ndarray, chunk: int = 65536) -> Iterator[np.ndarray]:
+    for lo in range(0, len(records), chunk):
+        yield records[lo:lo + chunk]
+
+def _phase(cfg: ValuationConfig) -> PhaseConfig:
+    p = cfg.phase
+    return PhaseConfig(total_rounds=p.total_rounds, early_until_round=p.early_until_round,
+                       taper_rounds=p.taper_rounds, early=p.early, late=p.late)
+
+def rescore(records: np.ndarray, cfg: ValuationConfig = ValuationConfig(),
+            chunk: int = 65536) -> np.ndarray:
+    """
+    expected_vp of every stored decision under `cfg`'s phase weights, computed
+    chunk by chunk from the stored features (bit-identical to apply_phase_valuation
+    for the weights in effect). Risk penalties are taken as recorded.
+    """
+    phase = _phase(cfg)
+    rounds = int(records["round"].max()) + 1 if len(records) else 1
+    table = np.array([signed_weights_for_round(r, phase) for r in range(rounds)], dtype=np.float64)
+    out = np.empty(len(records), dtype=np.float64)
+    lo = 0
+    for part in iter_chunks(records, chunk):
+        F = np.asarray(part["features"])
+        w = table[np.asarray(part["round"], dtype=np.intp)]
+        out[lo:lo + len(part)] = score_matrix(F[:, 0], F[:, WEIGHTED], w)
+        lo += len(part)
+    return out
+
+def tuning_set(records: np.ndarray, cfg: ValuationConfig = ValuationConfig()):
+    """TuningSet (see tuning.py) over the rows with a known outcome."""
+    from .tuning import TuningSet
+    known = records[~np.isnan(records["outcome"])]
+    F = np.asarray(known["features"], dtype=np.float64).reshape(len(known), -1)
+    phase = _phase(cfg)
+    blend = np.array([blend_factor(r, phase) for r in range(int(known["round"].max()) + 1)]
+                     if len(known) else [0.0], dtype=np.float64)
+    return TuningSet(F[:, 0].copy(), F[:, WEIGHTED].copy(),
+                     blend[np.asarray(known["round"], dtype=np.intp)],
+                     np.asarray(known["outcome"], dtype=np.float64).copy())
@@ -1,15 +1,32 @@
 # SPDX-License-Identifier: MIT
 from __future__ import annotations
 import math
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+from .adapters import ROUND_KEYS, adapter_for, resource_reader_for
+
+# Each reader tries the accessors compiled for the state's type first (adapters.py);
+# the duck-typed probing below stays as the fallback for unrecognized types.
 
 def _get_active_player(state: Any) -> Optional[str]:
+    adapter = adapter_for(state)
+    if adapter is not None:
+        try:
+            return adapter.active_player(state)
+        except Exception:
+            pass
     try:
         return state.active_player or "you"
     except Exception:
         return None
 
 def _get_player(state: Any, pid: Optional[str]) -> Any:
+    adapter = adapter_for(state)
+    if adapter is not None:
+        try:
+            return adapter.player(state, pid)
+        except Exception:
+            pass
     try:
         return state.players.get(pid) if (pid and state.players) else None
     except Exception:
@@ -34,8 +51,28 @@ def _read_resource(obj: Any, name: str, default: int = 0) -> int:
         pass
     return default
 
+def _read_resources(obj: Any) -> Tuple[int, int, int]:
+    """(materials, science, money) of a player object."""
+    reader = resource_reader_for(obj)
+    if reader is not None:
+        try:
+            return reader(obj)
+        except Exception:
+            pass
+    return (_read_resource(obj, "materials"), _read_resource(obj, "science"),
+            _read_resource(obj, "money"))
+
 def infer_round_idx(state: Any, default_round: int = 1) -> int:
-    for key in ("round_idx", "round", "turn_idx", "turn"):
+    adapter = adapter_for(state)
+    if adapter is not None:
+        try:
+            val = adapter.round_idx(state)
+            if val is not None:
+                return val
+        except Exception:
+            pass
+        # None only means no declared attribute held a round: probe runtime ones too
+    for key in ROUND_KEYS:
         try:
             val = getattr(state, key, None)
             if isinstance(val, int) and val >= 1:
@@ -59,9 +96,7 @@ def convertible_vp_shadow(state: Any, action: Any, total_rounds: int, round_idx:
     pid = _get_active_player(state)
     me = _get_player(state, pid)
 
-    mats = _read_resource(me, "materials")
-    sci  = _read_resource(me, "science")
-    money = _read_resource(me, "money")
+    mats, sci, money = _read_resources(me)
 
     rounds_left = max(0, int(total_rounds) - int(round_idx))
 
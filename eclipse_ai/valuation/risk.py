@@ -1,16 +1,130 @@
 # SPDX-License-Identifier: MIT
 from __future__ import annotations
 from dataclasses import dataclass
+from typing import Any, List, NamedTuple, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy not installed: only the scalar penalty is available
+    np = None  # type: ignore[assignment]
+
+# CVaR tail level per mode. With sampled outcomes the risk is the relative CVaR gap
+# (mean - CVaR_alpha) / |mean|: how far the worst alpha share of outcomes falls below
+# the mean, clipped to 0..1 and priced like Score.risk (greedy = risk-neutral).
+CVAR_LEVELS = {"greedy": 1.0, "balanced": 0.25, "safe": 0.05}
+# |mean| below this (in VP) is treated as this, so near-zero means do not saturate
+GAP_SCALE_FLOOR = 1.0
 
 @dataclass
 class RiskProfile:
     mode: str = "balanced"  # "greedy" | "balanced" | "safe"
+    cvar_alpha: Optional[float] = None  # override the mode's CVaR level
+
+    @property
+    def alpha(self) -> float:
+        if self.cvar_alpha is not None:
+            return float(self.cvar_alpha)
+        return CVAR_LEVELS.get(self.mode, CVAR_LEVELS["balanced"])
+
+def risk_multiplier(profile: RiskProfile) -> float:
+    """Penalty per unit of scalar risk for the profile's mode."""
+    if profile.mode == "greedy":
+        return 0.10
+    if profile.mode == "safe":
+        return 0.75
+    return 0.35
 
 def penalty_from_scalar_risk(risk_0_to_1: float, profile: RiskProfile) -> float:
     """Map your existing scalar Score.risk (0..1) to a penalty we can subtract."""
     r = max(0.0, min(1.0, float(risk_0_to_1)))
-    if profile.mode == "greedy":
-        return 0.10 * r
-    if profile.mode == "safe":
-        return 0.75 * r
-    return 0.35 * r
+    return risk_multiplier(profile) * r
+
+# --- distributional risk (Score.samples) -------------------------------------
+
+class RiskStats(NamedTuple):
+    mean: Any       # (n,)
+    var: Any        # (n,) population variance
+    quantiles: Any  # (n, len(qs))
+    cvar: Any       # (n,) mean of the worst alpha share of samples
+
+def sample_matrix(samples: Sequence[Sequence[float]]) -> Any:
+    """(n, k) matrix with one row of sampled outcomes per action; short rows padded with NaN."""
+    rows = [np.asarray(s, dtype=np.float64).ravel() for s in samples]
+    M = np.full((len(rows), max((r.size for r in rows), default=0)), np.nan)
+    for i, r in enumerate(rows):
+        M[i, :r.size] = r
+    return M
+
+def _tails(M: Any, alpha: float) -> Tuple[Any, Any, Any]:
+    # Sorted rows (NaN last) and sequential prefix sums: a row's results do not
+    # depend on the other rows or on padding, so one row alone scores identically.
+    S = np.sort(M, axis=1)
+    n = (~np.isnan(M)).sum(axis=1)
+    C = np.cumsum(np.nan_to_num(S, nan=0.0), axis=1)
+    k = np.clip(np.ceil(alpha * n), 1, np.maximum(n, 1)).astype(np.intp)
+    rows = np.arange(M.shape[0])
+    last = np.maximum(n, 1) - 1
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.where(n > 0, C[rows, last] / n, np.nan) if M.shape[1] else np.full(M.shape[0], np.nan)
+        cvar = np.where(n > 0, C[rows, k - 1] / k, np.nan) if M.shape[1] else np.full(M.shape[0], np.nan)
+    return S, mean, cvar
+
+def distribution_stats(M: Any, alpha: float = 0.25,
+                       qs: Sequence[float] = (0.05, 0.5, 0.95)) -> RiskStats:
+    """Mean, variance, quantiles and lower-tail CVaR of every row of a sample_matrix."""
+    M = np.atleast_2d(np.asarray(M, dtype=np.float64))
+    _, mean, cvar = _tails(M, alpha)
+    with np.errstate(invalid="ignore"):
+        var = np.nanmean((M - mean[:, None]) ** 2, axis=1) if M.shape[1] else mean.copy()
+        quant = (np.nanquantile(M, qs, axis=1).T if M.shape[1]
+                 else np.full((M.shape[0], len(qs)), np.nan))
+    return RiskStats(mean, var, quant, cvar)
+
+def cvar_risk(samples: Sequence[Sequence[float]], alpha: float) -> Any:
+    """Relative CVaR gap in 0..1 for every action's samples, vectorized (0 for empty rows)."""
+    M = sample_matrix(samples)
+    _, mean, cvar = _tails(M, alpha)
+    with np.errstate(invalid="ignore"):
+        gap = (mean - cvar) / np.maximum(np.abs(mean), GAP_SCALE_FLOOR)
+    return np.nan_to_num(np.clip(gap, 0.0, 1.0), nan=0.0)
+
+def cvar_penalties(samples: Sequence[Sequence[float]], profile: RiskProfile) -> Any:
+    """
+    Penalties on the scale of penalty_from_scalar_risk: the relative CVaR gap plays
+    the role of Score.risk, so sampled and unsampled actions mix in one batch.
+    """
+    return risk_multiplier(profile) * cvar_risk(samples, profile.alpha)
+
+def _samples(base_score: Any) -> Optional[Any]:
+    samples = getattr(base_score, "samples", None)
+    if samples is None or np is None:
+        return None
+    try:
+        arr = np.asarray(samples, dtype=np.float64).ravel()
+    except TypeError:  # plain iterables (e.g. generators) have no len()
+        arr = np.fromiter(samples, dtype=np.float64)
+    return arr if arr.size else None
+
+def risk_penalty(base_score: Any, profile: RiskProfile) -> float:
+    """CVaR penalty when the Score carries samples, else penalty_from_scalar_risk(Score.risk)."""
+    samples = _samples(base_score)
+    if samples is None:
+        return penalty_from_scalar_risk(getattr(base_score, "risk", 0.0), profile)
+    return float(cvar_penalties([samples], profile)[0])
+
+def risk_penalties(base_scores: Sequence[Any], profile: RiskProfile) -> List[float]:
+    """risk_penalty for many Scores; every sampled one is handled in one vectorized pass."""
+    out = []
+    sampled, idx = [], []
+    for i, base in enumerate(base_scores):
+        samples = _samples(base)
+        if samples is None:
+            out.append(penalty_from_scalar_risk(getattr(base, "risk", 0.0), profile))
+        else:
+            out.append(0.0)
+            sampled.append(samples)
+            idx.append(i)
+    if sampled:
+        for i, p in zip(idx, cvar_penalties(sampled, profile).tolist()):
+            out[i] = p
+    return out
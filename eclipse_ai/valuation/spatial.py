@@ -0,0 +1,152 @@
+# SPDX-License-Identifier: MIT
+from __future__ import annotations
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Set, Tuple
+
+HexId = Hashable
+NeighborFn = Callable[[HexId], Iterable[HexId]]
+
+_AXIAL_DIRS = ((1, 0), (1, -1), (0, -1), (-1, 0), (-1, 1), (0, 1))
+
+def axial_neighbors(hex_id: Tuple[int, int]) -> Iterable[Tuple[int, int]]:
+    """Six neighbours of an axial (q, r) hex coordinate."""
+    q, r = hex_id
+    return [(q + dq, r + dr) for dq, dr in _AXIAL_DIRS]
+
+def pressure_from_counts(yours: int, contested: int) -> float:
+    """The 0..1 pressure proxy from 'hexes you occupy' and 'of those, contested'."""
+    if yours == 0:
+        return 0.0
+    frac = contested / float(max(1, yours))
+    return max(0.0, min(1.0, 0.2 + 0.6 * frac))
+
+def _ship_total(pieces: Any) -> int:
+    return sum(int(v) for v in getattr(pieces, "ships", {}).values())
+
+class HexOccupancyIndex:
+    """
+    Per-player index of occupied and contested hexes, maintained incrementally.
+
+    A player occupies a hex when they have ships there; the hex is contested for
+    them when any other player has ships or a starbase on it. Updates cost
+    O(players on the hex); pressure(pid) is O(1). States that own an index expose it
+    as `state.occupancy_index` and call set_presence/move_ships/build_ships from
+    apply_action; opponent_pressure_proxy then skips the map scan.
+    """
+
+    def __init__(self, neighbors: Optional[NeighborFn] = None) -> None:
+        self._neighbors = neighbors
+        self._ships: Dict[HexId, Dict[Hashable, int]] = {}
+        self._starbases: Dict[HexId, Dict[Hashable, int]] = {}
+        self._strength: Dict[HexId, int] = {}        # ships + starbases, all owners
+        self._occupied: Dict[Hashable, Set[HexId]] = {}
+        self._contested: Dict[Hashable, Set[HexId]] = {}
+
+    @classmethod
+    def from_map(cls, game_map: Any, neighbors: Optional[NeighborFn] = None) -> "HexOccupancyIndex":
+        """Build an index with one O(map) scan of map.hexes[...].pieces[...]."""
+        index = cls(neighbors)
+        for hex_id, hx in getattr(game_map, "hexes", {}).items():
+            for owner, pieces in getattr(hx, "pieces", {}).items():
+                index.set_presence(hex_id, owner, _ship_total(pieces),
+                                   int(getattr(pieces, "starbase", 0) or 0))
+        return index
+
+    def copy(self) -> "HexOccupancyIndex":
+        other = HexOccupancyIndex(self._neighbors)
+        other._ships = {h: dict(v) for h, v in self._ships.items()}
+        other._starbases = {h: dict(v) for h, v in self._starbases.items()}
+        other._strength = dict(self._strength)
+        other._occupied = {p: set(v) for p, v in self._occupied.items()}
+        other._contested = {p: set(v) for p, v in self._contested.items()}
+        return other
+
+    # --- updates -------------------------------------------------------------
+    def _refresh(self, hex_id: HexId) -> None:
+        ships = self._ships.get(hex_id, {})
+        total = self._strength.get(hex_id, 0)
+        for owner, n in ships.items():
+            if n <= 0:
+                continue
+            hostile = total - n - self._starbases.get(hex_id, {}).get(owner, 0)
+            if hostile > 0:
+                self._contested.setdefault(owner, set()).add(hex_id)
+            else:
+                self._contested.get(owner, set()).discard(hex_id)
+
+    def set_presence(self, hex_id: HexId, owner: Hashable, ships: int, starbase: int = 0) -> None:
+        """Set `owner`'s ship count and starbases on `hex_id`."""
+        hex_ships = self._ships.setdefault(hex_id, {})
+        hex_bases = self._starbases.setdefault(hex_id, {})
+        before = hex_ships.get(owner, 0) + hex_bases.get(owner, 0)
+        hex_ships[owner] = max(0, int(ships))
+        hex_bases[owner] = max(0, int(starbase))
+        self._strength[hex_id] = self._strength.get(hex_id, 0) - before + hex_ships[owner] + hex_bases[owner]
+        if hex_ships[owner] > 0:
+            self._occupied.setdefault(owner, set()).add(hex_id)
+        else:
+            self._occupied.get(owner, set()).discard(hex_id)
+            self._contested.get(owner, set()).discard(hex_id)
+        self._refresh(hex_id)
+
+    def build_ships(self, hex_id: HexId, owner: Hashable, count: int = 1) -> None:
+        """Add `count` ships for `owner` on `hex_id`."""
+        self.set_presence(hex_id, owner, self.ships(hex_id, owner) + count,
+                          self._starbases.get(hex_id, {}).get(owner, 0))
+
+    def move_ships(self, src: HexId, dst: HexId, owner: Hashable, count: int = 1) -> int:
+        """
+        Move up to `count` of `owner`'s ships from `src` to `dst`; only the ships
+        present at `src` can move. Returns the number moved.
+        """
+        moved = max(0, min(int(count), self.ships(src, owner)))
+        if moved:
+            self.build_ships(src, owner, -moved)
+            self.build_ships(dst, owner, moved)
+        return moved
+
+    # --- queries -------------------------------------------------------------
+    def ships(self, hex_id: HexId, owner: Hashable) -> int:
+        return self._ships.get(hex_id, {}).get(owner, 0)
+
+    def hostile_strength(self, hex_id: HexId, owner: Hashable) -> int:
+        """Ships + starbases of everyone but `owner` on `hex_id`."""
+        return (self._strength.get(hex_id, 0) - self.ships(hex_id, owner)
+                - self._starbases.get(hex_id, {}).get(owner, 0))
+
+    def occupied(self, owner: Hashable) -> Set[HexId]:
+        return self._occupied.get(owner, set())
+
+    def contested(self, owner: Hashable) -> Set[HexId]:
+        return self._contested.get(owner, set())
+
+    def pressure(self, owner: Hashable) -> float:
+        """Same value as the map-scanning opponent_pressure_proxy, in O(1)."""
+        return pressure_from_counts(len(self.occupied(owner)), len(self.contested(owner)))
+
+    def pressure_within(self, owner: Hashable, k: int) -> float:
+        """
+        Neighbourhood variant: an occupied hex counts as contested when hostile
+        pieces are within `k` rings of it. k=0 equals pressure(). Costs
+        O(own hexes * ring size). Needs a neighbour function, or axial (q, r) ids.
+        """
+        neighbors = self._neighbors or axial_neighbors
+        yours = self.occupied(owner)
+        contested = 0
+        for start in yours:
+            frontier, seen = [start], {start}
+            hit = self.hostile_strength(start, owner) > 0
+            for _ in range(max(0, int(k))):
+                if hit:
+                    break
+                nxt = []
+                for hx in frontier:
+                    for nb in neighbors(hx):
+                        if nb in seen:
+                            continue
+                        seen.add(nb)
+                        if self.hostile_strength(nb, owner) > 0:
+                            hit = True
+                        nxt.append(nb)
+                frontier = nxt
+            contested += hit
+        return pressure_from_counts(len(yours), contested)
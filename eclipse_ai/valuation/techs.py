@@ -0,0 +1,75 @@
+# SPDX-License-Identifier: MIT
+from __future__ import annotations
+import re
+from typing import Dict, NamedTuple
+
+class TechProfile(NamedTuple):
+    tech_id: str      # canonical id, e.g. "plasma_cannon"
+    econ: float       # 1.0 for engine/economy techs
+    combat: float     # 1.0 for weapons, computers, shields, drives, hulls, starbase
+    tier: int         # 1..3 by position on the tech track (0 = unknown)
+
+# Whole-word keywords: "ion" must not match "fusion", "positron" etc.
+_ECON_PHRASES = ("advanced mining", "advanced labs", "nanorobots")
+_COMBAT_WORDS = frozenset({
+    "plasma", "positron", "gauss", "ion", "shield", "drive", "hull", "starbase",
+    "cannon", "missile", "computer", "bombs", "turret", "disruptor",
+})
+
+# (canonical id, tier) per track, base game + common expansion techs
+_TRACKS = {
+    "military": (
+        ("neutron_bombs", 1), ("starbase", 1), ("plasma_cannon", 1),
+        ("phase_shield", 2), ("advanced_mining", 2), ("tachyon_source", 2),
+        ("plasma_missile", 3), ("gluon_computer", 3),
+    ),
+    "grid": (
+        ("gauss_shield", 1), ("improved_hull", 1), ("fusion_source", 1),
+        ("positron_computer", 2), ("advanced_economy", 2), ("tachyon_drive", 2),
+        ("antimatter_cannon", 3), ("quantum_grid", 3),
+    ),
+    "nano": (
+        ("nanorobots", 1), ("fusion_drive", 1), ("advanced_robotics", 1),
+        ("orbital", 2), ("advanced_labs", 2), ("monolith", 2),
+        ("artifact_key", 3), ("wormhole_generator", 3),
+    ),
+    "rare": (
+        ("ion_turret", 2), ("distortion_shield", 2), ("conformal_drive", 2),
+        ("sentient_hull", 3), ("absorption_shield", 3), ("ion_disruptor", 3),
+    ),
+}
+
+def _normalize(name: str) -> str:
+    return " ".join(re.split(r"[\s_\-]+", (name or "").strip().lower()))
+
+def _classify(key: str, tech_id: str, tier: int) -> TechProfile:
+    econ = 1.0 if any(p in key for p in _ECON_PHRASES) else 0.0
+    combat = 1.0 if _COMBAT_WORDS.intersection(key.split()) else 0.0
+    return TechProfile(tech_id, econ, combat, tier)
+
+# Interned lookup: normalized display name -> profile. Built once at import.
+TECHS: Dict[str, TechProfile] = {}
+for _track in _TRACKS.values():
+    for _tech_id, _tier in _track:
+        TECHS[_normalize(_tech_id)] = _classify(_normalize(_tech_id), _tech_id, _tier)
+
+_UNKNOWN = TechProfile("", 0.0, 0.0, 0)
+_MISS_CACHE_LIMIT = 4096
+_lookup: Dict[str, TechProfile] = {"": _UNKNOWN}
+
+def lookup_tech(name: str) -> TechProfile:
+    """
+    Profile for a payload tech name ("Plasma Cannon", "plasma_cannon", ...).
+    One dict lookup on the hot path; names outside the registry are classified
+    once with the same whole-word rules and remembered.
+    """
+    prof = _lookup.get(name)
+    if prof is not None:
+        return prof
+    key = _normalize(name)
+    prof = TECHS.get(key)
+    if prof is None:
+        prof = _classify(key, key.replace(" ", "_"), 0)
+    if len(_lookup) < _MISS_CACHE_LIMIT:
+        _lookup[name] = prof
+    return prof
@@ -0,0 +1,160 @@
+# SPDX-License-Identifier: MIT
+"""
+Offline tuning of the EARLY/LATE phase weights from recorded decisions.
+
+A dataset is a sequence of (state, action, outcome) or (state, action, base_score,
+outcome) records, where `outcome` is the realized value the valuation should have
+predicted (e.g. final VP margin). Features are extracted once per dataset (and can
+be cached to disk); after that every candidate weight setting is scored with a
+single matrix product, so thousands of settings cost one pass over the data.
+
+The model is the engine's own: expected_vp = vp_now + F·W(round), with
+W(round) = (1 - t)·EARLY + t·LATE and t = blend_factor(round). Parameters are the
+14 unsigned weights [EARLY fields..., LATE fields...].
+"""
+from __future__ import annotations
+import dataclasses
+import os
+from typing import Any, Iterable, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .engine import ValuationConfig, _state_terms
+from .features import WEIGHTED, build_features
+from .phase import EARLY, LATE, PhaseConfig, PhaseWeights, WEIGHT_FIELDS, blend_factor
+from .risk import risk_penalty
+
+N_WEIGHTS = len(WEIGHT_FIELDS)
+# +1 / -1 per field: subtractive terms (risk, pressure) enter the score negated
+SIGNS = np.array(PhaseWeights(*([1.0] * N_WEIGHTS)).signed(), dtype=np.float64)
+
+class TuningSet(NamedTuple):
+    vp_now: np.ndarray     # (n,) baseline EV
+    features: np.ndarray   # (n, 7) weighted feature columns, WEIGHT_FIELDS order
+    blend: np.ndarray      # (n,) EARLY→LATE blend factor of the record's round
+    outcome: np.ndarray    # (n,) target value
+
+    def design_matrix(self) -> np.ndarray:
+        """(n, 14) matrix X such that predictions are vp_now + X @ theta."""
+        signed = self.features * SIGNS
+        t = self.blend[:, None]
+        return np.hstack([(1.0 - t) * signed, t * signed])
+
+class TunedWeights(NamedTuple):
+    early: PhaseWeights
+    late: PhaseWeights
+    loss: float            # mean squared error of the fitted weights
+    baseline_loss: float   # same, for the starting weights
+
+    def phase_config(self, base: Optional[PhaseConfig] = None) -> PhaseConfig:
+        """`base` (default PhaseConfig()) with the tuned weights plugged in."""
+        return dataclasses.replace(base or PhaseConfig(), early=self.early, late=self.late)
+
+def to_theta(early: PhaseWeights = EARLY, late: PhaseWeights = LATE) -> np.ndarray:
+    return np.array(tuple(early) + tuple(late), dtype=np.float64)
+
+def from_theta(theta: Sequence[float]) -> Tuple[PhaseWeights, PhaseWeights]:
+    theta = [float(x) for x in theta]
+    return PhaseWeights(*theta[:N_WEIGHTS]), PhaseWeights(*theta[N_WEIGHTS:])
+
+def _split(record: Sequence[Any]) -> Tuple[Any, Any, Any, float]:
+    if len(record) == 4:
+        state, action, base, outcome = record
+    else:
+        from ..evaluator import _EVALUATE_ACTION_BASELINE
+        state, action, outcome = record
+        base = _EVALUATE_ACTION_BASELINE(state, action)
+    return state, action, base, float(outcome)
+
+def _extract(records: Iterable[Sequence[Any]], cfg: ValuationConfig) -> TuningSet:
+    rows, blend, outcome = [], [], []
+    for record in records:
+        state, action, base, y = _split(record)
+        total_rounds, round_idx, _, _, cvp, opp = _state_terms(state, cfg)
+        phase = dataclasses.replace(cfg.phase, total_rounds=total_rounds)
+        rows.append(build_features(state, action, base, cvp, opp,
+                                   risk_penalty(base, cfg.risk), simulate_combat=cfg.simulate_combat))
+        blend.append(blend_factor(round_idx, phase))
+        outcome.append(y)
+    if rows:
+        M = np.array(rows, dtype=np.float64)
+    else:
+        M = np.empty((0, 1 + N_WEIGHTS + 1), dtype=np.float64)
+    return TuningSet(M[:, 0], M[:, WEIGHTED], np.array(blend, dtype=np.float64),
+                     np.array(outcome, dtype=np.float64))
+
+def extract_features(records: Iterable[Sequence[Any]], cfg: ValuationConfig = ValuationConfig(),
+                     cache_path: Optional[str] = None, cache_key: str = "") -> TuningSet:
+    """
+    Feature extraction for a dataset, run once. With `cache_path`, the result is
+    saved as .npz and reloaded on later calls whose `cache_key` matches (use
+    something that changes with the dataset, e.g. its path and mtime).
+    """
+    if cache_path and os.path.exists(cache_path):
+        try:
+            with np.load(cache_path, allow_pickle=False) as z:
+                if str(z["key"]) == cache_key:
+                    return TuningSet(*(z[f] for f in TuningSet._fields))
+        except Exception:
+            pass  # unreadable or stale cache: extract again
+    data = _extract(records, cfg)
+    if cache_path:
+        with open(cache_path, "wb") as fh:
+            np.savez(fh, key=np.array(cache_key), **data._asdict())
+    return data
+
+def sweep(data: TuningSet, grid: np.ndarray, chunk: int = 4096) -> np.ndarray:
+    """
+    Mean squared error of every weight vector in `grid` (k, 14), as one matrix
+    product per chunk of `chunk` rows. Returns a (k,) array of losses.
+    """
+    grid = np.atleast_2d(np.asarray(grid, dtype=np.float64))
+    if data.outcome.size == 0:
+        return np.zeros(grid.shape[0], dtype=np.float64)
+    X = data.design_matrix()
+    resid = (data.vp_now - data.outcome)[:, None]
+    out = np.empty(grid.shape[0], dtype=np.float64)
+    for lo in range(0, grid.shape[0], chunk):
+        err = X @ grid[lo:lo + chunk].T + resid
+        out[lo:lo + chunk] = np.mean(err * err, axis=0)
+    return out
+
+def random_grid(center: Optional[np.ndarray] = None, count: int = 1024, scale: float = 0.5,
+                seed: int = 0) -> np.ndarray:
+    """`count` non-negative weight vectors jittered multiplicatively around `center`."""
+    center = to_theta() if center is None else np.asarray(center, dtype=np.float64)
+    rng = np.random.default_rng(seed)
+    return center * np.exp(rng.normal(0.0, scale, size=(count, center.size)))
+
+def grid_search(data: TuningSet, grid: np.ndarray, start: Optional[np.ndarray] = None) -> TunedWeights:
+    """Best row of `grid`; falls back to `start` if nothing in the grid beats it."""
+    start = to_theta() if start is None else np.asarray(start, dtype=np.float64)
+    grid = np.vstack([start, np.atleast_2d(grid)])
+    losses = sweep(data, grid)
+    best = int(np.argmin(losses))
+    return TunedWeights(*from_theta(grid[best]), float(losses[best]), float(losses[0]))
+
+def fit_weights(data: TuningSet, start: Optional[np.ndarray] = None, *, steps: int = 21,
+                span: float = 1.0, sweeps: int = 32, tol: float = 1e-6) -> TunedWeights:
+    """
+    Coordinate descent over the 14 weights, kept non-negative. Each coordinate
+    move scores `steps` candidate values in one sweep(); the search span halves
+    whenever a full pass brings no improvement.
+    """
+    theta = to_theta() if start is None else np.array(start, dtype=np.float64)
+    best = baseline = float(sweep(data, theta)[0])
+    offsets = np.linspace(-1.0, 1.0, steps)
+    for _ in range(sweeps):
+        improved = False
+        for j in range(theta.size):
+            grid = np.repeat(theta[None, :], steps, axis=0)
+            grid[:, j] = np.maximum(0.0, theta[j] + span * offsets)
+            losses = sweep(data, grid)
+            k = int(np.argmin(losses))
+            if losses[k] < best - tol * max(1.0, best):
+                best, theta, improved = float(losses[k]), grid[k], True
+        if not improved:
+            span *= 0.5
+            if span < tol:
+                break
+    return TunedWeights(*from_theta(theta), best, baseline)
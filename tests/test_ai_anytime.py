@@ -0,0 +1,145 @@
+"""Tests for deadline-driven, iteratively deepened planning."""
+from __future__ import annotations
+
+import asyncio
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from ai import AnytimeDecisionMaker, CancellationToken
+
+
+@dataclass
+class DummyBoardState:
+    """Board that records the sequence of applied moves."""
+
+    moves: List[str]
+
+    def apply_action(self, action: str) -> None:
+        """Apply the provided action to the board."""
+        self.moves.append(action)
+
+    def clone(self) -> "DummyBoardState":
+        """Return a copy so planning can simulate future turns."""
+        return DummyBoardState(moves=self.moves.copy())
+
+
+class EndlessAI:
+    """AI that always has two candidate moves."""
+
+    def candidate_actions(self, board_state: DummyBoardState) -> List[str]:
+        """Return the two moves available everywhere."""
+        return ["left", "right"]
+
+    def choose_action(self, board_state: DummyBoardState) -> str:
+        """Pick the first move."""
+        return "left"
+
+
+def slow_scorer(board_state: DummyBoardState, action: str) -> float:
+    """Prefer 'right', taking a millisecond per evaluation."""
+    time.sleep(0.001)
+    return 1.0 if action == "right" else 0.0
+
+
+def test_deepens_until_max_steps_without_deadline() -> None:
+    """With no budget the plan reaches the requested depth."""
+    improvements = []
+    planner = AnytimeDecisionMaker(ai=EndlessAI(), scorer=lambda s, a: float(a == "right"))
+
+    plan = planner.make_plan(DummyBoardState(moves=[]), max_steps=4, on_improvement=improvements.append)
+
+    assert plan.actions == ["right"] * 4
+    assert [len(p.actions) for p in improvements] == [1, 2, 3, 4]
+
+
+def test_deadline_bounds_latency_and_keeps_best_plan() -> None:
+    """A tight deadline returns the deepest complete plan found in time."""
+    planner = AnytimeDecisionMaker(ai=EndlessAI(), scorer=slow_scorer, beam_width=2)
+
+    start = time.monotonic()
+    plan = planner.make_plan(DummyBoardState(moves=[]), max_steps=50, time_budget=0.05)
+    elapsed = time.monotonic() - start
+
+    assert elapsed < 0.5
+    assert 1 <= len(plan.actions) < 50
+    assert set(plan.actions) == {"right"}
+
+
+def test_cancellation_token_from_another_thread() -> None:
+    """Cancelling the token stops the search with the best plan so far."""
+    planner = AnytimeDecisionMaker(ai=EndlessAI(), scorer=slow_scorer, beam_width=2)
+    token = CancellationToken()
+    threading.Timer(0.05, token.cancel).start()
+
+    plan = planner.make_plan(DummyBoardState(moves=[]), max_steps=1000, cancel=token)
+
+    assert token.cancelled
+    assert 1 <= len(plan.actions) < 1000
+
+
+def test_async_plan_and_task_cancellation() -> None:
+    """The asyncio front end returns on deadline and propagates task cancellation."""
+    planner = AnytimeDecisionMaker(ai=EndlessAI(), scorer=slow_scorer, beam_width=2)
+
+    async def scenario() -> None:
+        plan = await planner.make_plan_async(DummyBoardState(moves=[]), max_steps=50, time_budget=0.05)
+        assert len(plan.actions) >= 1
+
+        token = CancellationToken()
+        task = asyncio.ensure_future(
+            planner.make_plan_async(DummyBoardState(moves=[]), max_steps=1000, cancel=token)
+        )
+        await asyncio.sleep(0.02)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert token.cancelled
+
+    asyncio.run(scenario())
+
+
+def test_iterations_resume_instead_of_rescoring() -> None:
+    """Each deeper iteration only scores its new depth."""
+    calls: List[str] = []
+
+    def scorer(board_state: DummyBoardState, action: str) -> float:
+        calls.append(action)
+        return float(action == "right")
+
+    planner = AnytimeDecisionMaker(ai=EndlessAI(), scorer=scorer, beam_width=2)
+    plan = planner.make_plan(DummyBoardState(moves=[]), max_steps=4)
+
+    assert plan.actions == ["right"] * 4
+    # 2 candidates from the root, then 2 beam plans x 2 candidates per depth.
+    assert len(calls) == 2 + 3 * 4
+
+
+class WideAI:
+    """AI with many candidate moves everywhere."""
+
+    def candidate_actions(self, board_state: DummyBoardState) -> List[str]:
+        """Return forty moves."""
+        return [f"m{i}" for i in range(40)]
+
+    def choose_action(self, board_state: DummyBoardState) -> str:
+        """Pick the first move."""
+        return "m0"
+
+
+def test_deadline_is_checked_per_candidate() -> None:
+    """A slow scorer over a wide candidate list cannot blow through the deadline."""
+    planner = AnytimeDecisionMaker(ai=WideAI(), scorer=lambda s, a: time.sleep(0.01) or 0.0)
+
+    start = time.monotonic()
+    plan = planner.make_plan(DummyBoardState(moves=[]), max_steps=3, time_budget=0.05)
+
+    assert time.monotonic() - start < 0.2
+    assert len(plan.actions) == 1
@@ -0,0 +1,122 @@
+"""Tests for the beam-search planning mode."""
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from ai import PlanResult, create_plan_beam
+
+
+@dataclass
+class DummyBoardState:
+    """Board that records the sequence of applied moves."""
+
+    moves: List[str]
+
+    def apply_action(self, action: str) -> None:
+        """Apply the provided action to the board."""
+        self.moves.append(action)
+
+    def clone(self) -> "DummyBoardState":
+        """Return a copy so planning can simulate future turns."""
+        return DummyBoardState(moves=self.moves.copy())
+
+
+# A greedy trap: "bait" scores best now, but "setup" unlocks the big payoff.
+MOVE_TREE: Dict[Tuple[str, ...], Dict[str, float]] = {
+    (): {"bait": 2.0, "setup": 1.0},
+    ("bait",): {"filler": 0.0},
+    ("setup",): {"payoff": 10.0},
+}
+
+
+class TreeAI:
+    """AI that enumerates candidates from :data:`MOVE_TREE`."""
+
+    def candidate_actions(self, board_state: DummyBoardState) -> List[str]:
+        """Return every move available from the current position."""
+        return list(MOVE_TREE.get(tuple(board_state.moves), {}))
+
+    def choose_action(self, board_state: DummyBoardState) -> str:
+        """Greedily pick the best scored candidate."""
+        options = MOVE_TREE[tuple(board_state.moves)]
+        return max(options, key=options.__getitem__)
+
+
+def tree_scorer(board_state: DummyBoardState, action: str) -> float:
+    """Look up the value of playing ``action`` from ``board_state``."""
+    return MOVE_TREE[tuple(board_state.moves)][action]
+
+
+def test_beam_search_escapes_greedy_trap() -> None:
+    """A beam wider than one finds the plan with the best cumulative score."""
+    board_state = DummyBoardState(moves=[])
+
+    greedy = create_plan_beam(TreeAI(), board_state, steps=2, beam_width=1, scorer=tree_scorer)
+    beam: PlanResult[str, DummyBoardState] = create_plan_beam(
+        TreeAI(), board_state, steps=2, beam_width=2, scorer=tree_scorer
+    )
+
+    assert greedy.actions == ["bait", "filler"]
+    assert beam.actions == ["setup", "payoff"]
+    assert beam.score == 11.0
+    assert beam.resulting_state.moves == ["setup", "payoff"]
+    assert board_state.moves == []  # The original board remains untouched.
+
+
+def test_beam_search_stops_at_node_budget() -> None:
+    """Once the node budget is spent the best plan found so far is returned."""
+    result = create_plan_beam(
+        TreeAI(), DummyBoardState(moves=[]), steps=2, beam_width=2, scorer=tree_scorer, node_budget=2
+    )
+
+    assert result.actions == ["bait"]
+    assert result.score == 2.0
+
+
+class MappingAI:
+    """AI enumerating candidates from a move tree given at construction."""
+
+    def __init__(self, tree: Dict[Tuple[str, ...], Dict[str, float]]) -> None:
+        self.tree = tree
+
+    def candidate_actions(self, board_state: DummyBoardState) -> List[str]:
+        """Return every move available from the current position."""
+        return list(self.tree.get(tuple(board_state.moves), {}))
+
+    def choose_action(self, board_state: DummyBoardState) -> str:
+        """Return the first candidate."""
+        return self.candidate_actions(board_state)[0]
+
+
+def test_beam_search_keeps_finished_plans() -> None:
+    """A high scoring plan that reaches a terminal state is not dropped for longer ones."""
+    tree = {(): {"win": 20.0, "slow": 1.0}, ("slow",): {"more": 1.0}}
+    scorer = lambda state, action: tree[tuple(state.moves)][action]
+
+    result = create_plan_beam(MappingAI(tree), DummyBoardState(moves=[]), steps=2, beam_width=2, scorer=scorer)
+
+    assert result.actions == ["win"]
+    assert result.score == 20.0
+    assert result.resulting_state.moves == ["win"]
+
+
+def test_beam_search_checks_budget_per_candidate() -> None:
+    """One wide state cannot overshoot the node budget by its whole candidate list."""
+    tree = {(): {f"m{i}": float(i) for i in range(50)}}
+    calls: List[str] = []
+
+    def scorer(state: DummyBoardState, action: str) -> float:
+        calls.append(action)
+        return tree[tuple(state.moves)][action]
+
+    result = create_plan_beam(
+        MappingAI(tree), DummyBoardState(moves=[]), steps=1, scorer=scorer, node_budget=3
+    )
+
+    assert len(calls) == 3
+    assert result.actions == ["m2"]
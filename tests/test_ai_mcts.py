@@ -0,0 +1,184 @@
+"""Tests for the Monte Carlo Tree Search decision maker."""
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from ai import MCTSDecisionMaker
+
+
+@dataclass
+class DummyBoardState:
+    """Board that records the sequence of applied moves."""
+
+    moves: List[str]
+
+    def apply_action(self, action: str) -> None:
+        """Apply the provided action to the board."""
+        self.moves.append(action)
+
+    def clone(self) -> "DummyBoardState":
+        """Return a copy so planning can simulate future turns."""
+        return DummyBoardState(moves=self.moves.copy())
+
+
+MOVE_TREE: Dict[Tuple[str, ...], Dict[str, float]] = {
+    (): {"bait": 2.0, "setup": 1.0, "pass": 0.0},
+    ("bait",): {"filler": 0.0},
+    ("setup",): {"payoff": 10.0, "filler": 0.0},
+    ("pass",): {"filler": 0.0},
+}
+
+
+class TreeAI:
+    """AI that enumerates candidates from :data:`MOVE_TREE` and plays greedily."""
+
+    def candidate_actions(self, board_state: DummyBoardState) -> List[str]:
+        """Return every move available from the current position."""
+        return list(MOVE_TREE.get(tuple(board_state.moves), {}))
+
+    def choose_action(self, board_state: DummyBoardState) -> str:
+        """Greedily pick the best scored candidate."""
+        options = MOVE_TREE[tuple(board_state.moves)]
+        return max(options, key=options.__getitem__)
+
+
+def tree_scorer(board_state: DummyBoardState, action: str) -> float:
+    """Look up the value of playing ``action`` from ``board_state``."""
+    return MOVE_TREE[tuple(board_state.moves)][action]
+
+
+def test_mcts_finds_best_two_step_plan() -> None:
+    """Simulations discover that the setup move leads to the payoff."""
+    board_state = DummyBoardState(moves=[])
+    mcts = MCTSDecisionMaker(ai=TreeAI(), scorer=tree_scorer, iterations=60, seed=7)
+
+    plan = mcts.make_plan(board_state, steps=2)
+
+    assert plan.actions == ["setup", "payoff"]
+    assert plan.score == 11.0
+    assert board_state.moves == []  # Planning must not touch the live board.
+
+
+def test_mcts_reuses_subtree_after_advance() -> None:
+    """Advancing keeps the statistics gathered below the played action."""
+    mcts = MCTSDecisionMaker(ai=TreeAI(), scorer=tree_scorer, iterations=60, seed=7)
+    mcts.make_plan(DummyBoardState(moves=[]), steps=2)
+    child = mcts.root.child_for("setup")
+    visits = child.visits
+
+    mcts.advance("setup")
+    assert mcts.root is child
+    root = mcts.search(DummyBoardState(moves=["setup"]), steps=1)
+
+    assert root is child
+    assert root.visits == visits + 60
+
+
+def test_mcts_rebase_keeps_raw_return_bounds() -> None:
+    """After advance() the normalization bounds span the surviving raw returns, not node means."""
+    mcts = MCTSDecisionMaker(ai=TreeAI(), scorer=tree_scorer, iterations=4, seed=1)
+    mcts.make_plan(DummyBoardState(moves=[]), steps=2)
+    child = mcts.root.child_for("setup")
+    assert (child.low, child.high) == (1.0, 11.0)  # a rollout to payoff, then filler
+
+    mcts.advance("setup")
+
+    assert child.mean_value == 5.0
+    assert (mcts._low, mcts._high) == (0.0, 10.0)
+
+
+def test_mcts_requires_a_budget() -> None:
+    """An unbounded search is rejected up front."""
+    with pytest.raises(ValueError):
+        MCTSDecisionMaker(ai=TreeAI(), iterations=None, time_budget=None)
+
+
+class ReversibleBoardState(DummyBoardState):
+    """Board supporting make/unmake that counts how often it is cloned."""
+
+    clones = 0
+
+    def apply_action(self, action: str) -> int:
+        """Apply the action and return the undo token (the previous move count)."""
+        self.moves.append(action)
+        return len(self.moves) - 1
+
+    def undo_action(self, token: int) -> None:
+        """Restore the board to the move count stored in ``token``."""
+        del self.moves[token:]
+
+    def clone(self) -> "ReversibleBoardState":
+        """Return a copy and count the allocation."""
+        ReversibleBoardState.clones += 1
+        return ReversibleBoardState(moves=self.moves.copy())
+
+
+def test_mcts_walks_reversible_states_in_place() -> None:
+    """Reversible boards are cloned once per search instead of once per simulation."""
+    ReversibleBoardState.clones = 0
+    board_state = ReversibleBoardState(moves=[])
+    mcts = MCTSDecisionMaker(ai=TreeAI(), scorer=tree_scorer, iterations=60, seed=7)
+
+    mcts.search(board_state, steps=2)
+
+    assert ReversibleBoardState.clones == 1
+    assert mcts.make_plan(board_state, steps=2).actions == ["setup", "payoff"]
+    assert board_state.moves == []
+
+
+class HashableBoardState(DummyBoardState):
+    """Board exposing a position hash."""
+
+    def state_hash(self) -> int:
+        """Hash of the move sequence."""
+        return hash(tuple(self.moves))
+
+    def clone(self) -> "HashableBoardState":
+        """Return a copy so planning can simulate future turns."""
+        return HashableBoardState(moves=self.moves.copy())
+
+
+def test_mcts_reuses_subtree_after_advance_on_hashable_board() -> None:
+    """The re-rooted tree is kept when the live board hashes to the played child."""
+    mcts = MCTSDecisionMaker(ai=TreeAI(), scorer=tree_scorer, iterations=60, seed=7)
+    mcts.make_plan(HashableBoardState(moves=[]), steps=2)
+    child = mcts.root.child_for("setup")
+    visits = child.visits
+
+    mcts.advance("setup")
+    root = mcts.search(HashableBoardState(moves=["setup"]), steps=1)
+
+    assert root is child
+    assert root.visits == visits + 60
+    # The sunk reward of "setup" no longer counts towards the subtree's returns.
+    assert root.child_for("payoff").mean_value == pytest.approx(10.0)
+
+
+def test_mcts_discards_tree_for_other_hashable_board() -> None:
+    """A board that does not hash to the advanced child starts a fresh tree."""
+    mcts = MCTSDecisionMaker(ai=TreeAI(), scorer=tree_scorer, iterations=60, seed=7)
+    mcts.make_plan(HashableBoardState(moves=[]), steps=2)
+    child = mcts.root.child_for("setup")
+
+    mcts.advance("setup")
+    root = mcts.search(HashableBoardState(moves=["pass"]), steps=1)
+
+    assert root is not child
+    assert [node.action for node in root.children] == ["filler"]
+
+
+def test_mcts_does_not_reuse_tree_for_unrelated_keyless_board() -> None:
+    """Without a state key the tree is only reused directly after advance()."""
+    mcts = MCTSDecisionMaker(ai=TreeAI(), scorer=tree_scorer, iterations=60, seed=7)
+    mcts.make_plan(DummyBoardState(moves=["setup"]), steps=1)
+
+    plan = mcts.make_plan(DummyBoardState(moves=[]), steps=2)
+
+    assert plan.actions == ["setup", "payoff"]
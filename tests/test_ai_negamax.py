@@ -0,0 +1,144 @@
+"""Tests for the negamax alpha-beta decision maker."""
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Tuple
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from ai import NegamaxDecisionMaker, TranspositionTable
+
+COINS = (3, 9, 1, 2, 7, 4, 8, 5, 6, 2)
+
+
+@dataclass
+class CoinRowState:
+    """Two players alternately take a coin from either end of a row."""
+
+    coins: Tuple[int, ...]
+    clones: List[int] = field(default_factory=lambda: [0])
+
+    def apply_action(self, action: str) -> Tuple[int, ...]:
+        """Take the left ("L") or right ("R") coin; the token is the previous row."""
+        token = self.coins
+        self.coins = self.coins[1:] if action == "L" else self.coins[:-1]
+        return token
+
+    def undo_action(self, token: Tuple[int, ...]) -> None:
+        """Put the row back as it was before the move."""
+        self.coins = token
+
+    def clone(self) -> "CoinRowState":
+        """Return a copy and count the allocation."""
+        self.clones[0] += 1
+        return CoinRowState(self.coins, self.clones)
+
+    def state_hash(self) -> int:
+        """Position key: the remaining row (the side to move follows from its length)."""
+        return hash(self.coins)
+
+
+@dataclass
+class PlainCoinRowState:
+    """The same game without make/unmake support."""
+
+    coins: Tuple[int, ...]
+
+    def apply_action(self, action: str) -> None:
+        """Take the left or right coin."""
+        self.coins = self.coins[1:] if action == "L" else self.coins[:-1]
+
+    def clone(self) -> "PlainCoinRowState":
+        """Return a copy so planning can simulate future turns."""
+        return PlainCoinRowState(self.coins)
+
+
+class CoinAI:
+    """Enumerates both ends (one when a single coin is left)."""
+
+    def candidate_actions(self, board_state) -> List[str]:
+        """Return the legal moves."""
+        if not board_state.coins:
+            return []
+        return ["L"] if len(board_state.coins) == 1 else ["L", "R"]
+
+    def choose_action(self, board_state) -> str:
+        """Greedily take the larger end."""
+        return "L" if board_state.coins[0] >= board_state.coins[-1] else "R"
+
+
+def coin_scorer(board_state, action: str) -> float:
+    """Value of the coin the move takes, for the player taking it."""
+    return float(board_state.coins[0] if action == "L" else board_state.coins[-1])
+
+
+@lru_cache(maxsize=None)
+def minimax(coins: Tuple[int, ...], depth: int) -> float:
+    """Brute-force margin of the side to move over ``depth`` plies."""
+    if depth == 0 or not coins:
+        return 0.0
+    return max(
+        coins[0] - minimax(coins[1:], depth - 1),
+        coins[-1] - minimax(coins[:-1], depth - 1),
+    )
+
+
+@pytest.mark.parametrize("depth", [1, 3, 6, 10])
+def test_negamax_matches_brute_force_minimax(depth: int) -> None:
+    """Alpha-beta with move ordering returns the exact minimax value."""
+    for board_state in (CoinRowState(COINS), PlainCoinRowState(COINS)):
+        search = NegamaxDecisionMaker(ai=CoinAI(), scorer=coin_scorer, max_depth=depth)
+        value, line = search.search(board_state)
+        assert value == minimax(COINS, depth)
+        assert len(line) == min(depth, len(COINS))
+        assert board_state.coins == COINS
+
+
+def test_principal_variation_replays_to_its_value() -> None:
+    """The returned line, played out, realizes the reported margin."""
+    search = NegamaxDecisionMaker(ai=CoinAI(), scorer=coin_scorer, max_depth=len(COINS))
+    plan = search.make_plan(CoinRowState(COINS))
+
+    state, margin, sign = CoinRowState(COINS), 0.0, 1.0
+    for action in plan.actions:
+        margin += sign * coin_scorer(state, action)
+        state.apply_action(action)
+        sign = -sign
+    assert margin == plan.score
+    assert plan.resulting_state.coins == ()
+
+
+def test_move_ordering_prunes_more_than_plain_alpha_beta() -> None:
+    """Ordering, killers and the table cut the number of scored actions."""
+    ordered = NegamaxDecisionMaker(
+        ai=CoinAI(), scorer=coin_scorer, max_depth=8, table=TranspositionTable()
+    )
+    plain = NegamaxDecisionMaker(ai=CoinAI(), scorer=coin_scorer, max_depth=8, ordering=False)
+    assert ordered.search(CoinRowState(COINS))[0] == plain.search(CoinRowState(COINS))[0]
+    assert ordered.nodes < plain.nodes
+
+
+def test_reversible_states_are_searched_in_place() -> None:
+    """A reversible board is cloned once per search."""
+    board_state = CoinRowState(COINS)
+    NegamaxDecisionMaker(ai=CoinAI(), scorer=coin_scorer, max_depth=6).search(board_state)
+    assert board_state.clones[0] == 1
+
+
+def test_node_budget_returns_deepest_completed_iteration() -> None:
+    """Running out of nodes keeps the last fully searched depth."""
+    search = NegamaxDecisionMaker(ai=CoinAI(), scorer=coin_scorer, max_depth=10, node_budget=60)
+    value, line = search.search(CoinRowState(COINS))
+
+    assert 1 <= search.depth_reached < 10
+    assert value == minimax(COINS, search.depth_reached)
+    assert len(line) == search.depth_reached
+
+    starved = NegamaxDecisionMaker(ai=CoinAI(), scorer=coin_scorer, max_depth=4, node_budget=1)
+    assert starved.choose_action(CoinRowState(COINS)) == CoinAI().choose_action(CoinRowState(COINS))
+    assert starved.depth_reached == 0
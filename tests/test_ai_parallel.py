@@ -0,0 +1,90 @@
+"""Tests for process-parallel rollouts and root-parallel MCTS."""
+from __future__ import annotations
+
+import multiprocessing
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from ai import MCTSDecisionMaker, ParallelRolloutExecutor, create_plan
+
+pytestmark = pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(),
+    reason="test helpers are shared with workers through fork",
+)
+
+
+@dataclass
+class DummyBoardState:
+    """Board that records the sequence of applied moves."""
+
+    moves: List[str]
+
+    def apply_action(self, action: str) -> None:
+        """Apply the provided action to the board."""
+        self.moves.append(action)
+
+    def clone(self) -> "DummyBoardState":
+        """Return a copy so planning can simulate future turns."""
+        return DummyBoardState(moves=self.moves.copy())
+
+
+MOVE_TREE: Dict[Tuple[str, ...], Dict[str, float]] = {
+    (): {"bait": 2.0, "setup": 1.0},
+    ("bait",): {"filler": 0.0},
+    ("setup",): {"payoff": 10.0},
+}
+
+
+class TreeAI:
+    """AI that enumerates candidates from :data:`MOVE_TREE` and plays greedily."""
+
+    def candidate_actions(self, board_state: DummyBoardState) -> List[str]:
+        """Return every move available from the current position."""
+        return list(MOVE_TREE.get(tuple(board_state.moves), {}))
+
+    def choose_action(self, board_state: DummyBoardState) -> str:
+        """Greedily pick the best scored candidate."""
+        options = MOVE_TREE[tuple(board_state.moves)]
+        return max(options, key=options.__getitem__)
+
+
+def tree_scorer(board_state: DummyBoardState, action: str) -> float:
+    """Look up the value of playing ``action`` from ``board_state``."""
+    return MOVE_TREE[tuple(board_state.moves)][action]
+
+
+def seeded_rollout(board_state: DummyBoardState, seed: int) -> Tuple[int, List[str]]:
+    """Plan two greedy steps and report the seed the rollout ran with."""
+    return seed, create_plan(TreeAI(), board_state, steps=2).actions
+
+
+def test_map_rollouts_runs_every_seed_in_order() -> None:
+    """Rollout results come back in seed order from fresh state copies."""
+    board_state = DummyBoardState(moves=[])
+    with ParallelRolloutExecutor(
+        max_workers=2, base_seed=10, mp_context=multiprocessing.get_context("fork")
+    ) as executor:
+        results = executor.map_rollouts(seeded_rollout, board_state, count=5)
+
+    assert [seed for seed, _ in results] == [10, 11, 12, 13, 14]
+    assert all(actions == ["bait", "filler"] for _, actions in results)
+    assert board_state.moves == []
+
+
+def test_root_parallel_search_merges_tree_statistics() -> None:
+    """Root statistics are summed over trees and ranked by visit count."""
+    template = MCTSDecisionMaker(ai=TreeAI(), scorer=tree_scorer, iterations=30)
+    with ParallelRolloutExecutor(
+        max_workers=2, mp_context=multiprocessing.get_context("fork")
+    ) as executor:
+        merged = executor.root_parallel_search(template, DummyBoardState(moves=[]), steps=2, trees=3)
+
+    assert merged[0].action == "setup"
+    assert sum(stats.visits for stats in merged) == 3 * 30
+    assert merged[0].mean_value == 11.0
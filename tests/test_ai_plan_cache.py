@@ -0,0 +1,171 @@
+"""Tests for the plan cache and incremental replanning."""
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from ai import NormalDecisionMaker, PlanCache
+
+
+@dataclass
+class DummyBoardState:
+    """Board that records the sequence of applied moves."""
+
+    moves: List[str]
+
+    def apply_action(self, action: str) -> None:
+        """Apply the provided action to the board."""
+        self.moves.append(action)
+
+    def clone(self) -> "DummyBoardState":
+        """Return a copy so planning can simulate future turns."""
+        return type(self)(moves=self.moves.copy())
+
+
+class HashableBoardState(DummyBoardState):
+    """Board exposing a position hash."""
+
+    def state_hash(self) -> int:
+        """Hash of the move history."""
+        return hash(tuple(self.moves))
+
+
+class CountingAI:
+    """Plays ``m<n>`` after ``n`` moves and counts how often it is asked."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def choose_action(self, board_state: DummyBoardState) -> str:
+        """Return the move named after the current move count."""
+        self.calls += 1
+        return f"m{len(board_state.moves)}"
+
+
+def test_reuses_plan_while_game_follows_it() -> None:
+    """Following the plan costs one new action per turn instead of a full plan."""
+    ai = CountingAI()
+    maker = NormalDecisionMaker(ai=ai, plan_cache=PlanCache())
+    live = HashableBoardState(moves=[])
+
+    first = maker.make_plan(live, steps=4)
+    assert first.actions == ["m0", "m1", "m2", "m3"]
+    assert ai.calls == 4
+
+    live.apply_action("m0")
+    second = maker.make_plan(live, steps=4)
+    assert second.actions == ["m1", "m2", "m3", "m4"]
+    assert second.resulting_state.moves == ["m0", "m1", "m2", "m3", "m4"]
+    assert ai.calls == 5
+    assert live.moves == ["m0"]
+
+    live.apply_action("m1")
+    assert maker.make_plan(live, steps=2).actions == ["m2", "m3"]
+    assert ai.calls == 5
+
+    stats = maker.plan_cache.stats()
+    assert (stats["requests"], stats["full_replans"], stats["partial_reuses"]) == (3, 1, 2)
+    assert stats["reused_actions"] == 5
+    assert stats["reuse_rate"] == 2 / 3
+
+
+def test_divergence_triggers_full_replan() -> None:
+    """A live position off the cached plan is planned from scratch."""
+    ai = CountingAI()
+    cache = PlanCache()
+    planner = lambda state, n: NormalDecisionMaker(ai).make_plan(state, n)
+    cache.plan(HashableBoardState(moves=[]), 3, planner)
+
+    result = cache.plan(HashableBoardState(moves=["rival"]), 3, planner)
+    assert result.actions == ["m1", "m2", "m3"]
+    assert ai.calls == 6
+    assert cache.full_replans == 2
+
+
+def test_action_prefix_tracking_without_state_keys() -> None:
+    """Boards without hashes are matched through observed live actions."""
+    ai = CountingAI()
+    cache = PlanCache(track_actions=True)
+    planner = lambda state, n: NormalDecisionMaker(ai).make_plan(state, n)
+    live = DummyBoardState(moves=[])
+    cache.plan(live, 3, planner)
+
+    live.apply_action("m0")
+    cache.observe("m0")
+    assert cache.plan(live, 3, planner).actions == ["m1", "m2", "m3"]
+    assert ai.calls == 4
+
+    cache.observe("m1")
+    cache.observe("surprise")
+    live.moves += ["m1", "surprise"]
+    assert cache.plan(live, 2, planner).actions == ["m3", "m4"]
+    assert cache.full_replans == 2
+
+
+def test_consecutive_full_reuses_rebase_the_cache() -> None:
+    """Serving the whole remainder moves the cached plan to the live position each turn."""
+    ai = CountingAI()
+    cache = PlanCache(track_actions=True)
+    planner = lambda state, n: NormalDecisionMaker(ai).make_plan(state, n)
+    live = DummyBoardState(moves=[])
+    cache.plan(live, 4, planner)
+
+    for played, expected in [("m0", ["m1", "m2", "m3"]), ("m1", ["m2", "m3"])]:
+        live.apply_action(played)
+        cache.observe(played)
+        result = cache.plan(live, len(expected), planner)
+        assert result.actions == expected
+        assert result.resulting_state.moves == ["m0", "m1", "m2", "m3"]
+        assert cache._entry.actions == expected
+    assert ai.calls == 4
+    assert (cache.full_replans, cache.partial_reuses) == (1, 2)
+
+
+class ScriptedAI:
+    """Plays the actions listed on the board, one per step."""
+
+    def choose_action(self, board_state: "ScriptedBoardState") -> str:
+        """Return the next scripted move."""
+        return board_state.script[len(board_state.moves) % len(board_state.script)]
+
+
+@dataclass
+class ScriptedBoardState(DummyBoardState):
+    """Keyless board whose legal moves are fixed by ``script``."""
+
+    script: List[str]
+
+    def clone(self) -> "ScriptedBoardState":
+        """Return a copy so planning can simulate future turns."""
+        return ScriptedBoardState(moves=self.moves.copy(), script=self.script)
+
+
+def test_keyless_boards_replan_without_action_tracking() -> None:
+    """An unrelated keyless board never receives the cached plan."""
+    maker = NormalDecisionMaker(ai=ScriptedAI(), plan_cache=PlanCache())
+
+    assert maker.make_plan(ScriptedBoardState([], ["x", "y"]), 2).actions == ["x", "y"]
+    other = maker.make_plan(ScriptedBoardState([], ["bait"]), 2)
+
+    assert other.actions == ["bait", "bait"]
+    assert other.resulting_state.moves == ["bait", "bait"]
+    assert maker.plan_cache.full_replans == 2
+
+
+def test_min_reuse_and_invalidate() -> None:
+    """Too little to reuse, or an explicit invalidate, means a full replan."""
+    ai = CountingAI()
+    cache = PlanCache(min_reuse=3)
+    planner = lambda state, n: NormalDecisionMaker(ai).make_plan(state, n)
+    cache.plan(HashableBoardState(moves=[]), 4, planner)
+    cache.plan(HashableBoardState(moves=["m0", "m1"]), 4, planner)
+    assert cache.full_replans == 2
+
+    cache.invalidate()
+    cache.plan(HashableBoardState(moves=["m0", "m1"]), 4, planner)
+    assert cache.full_replans == 3
+    assert cache.stats()["estimated_seconds_saved"] == 0.0
@@ -0,0 +1,121 @@
+"""Tests for the asyncio planning service."""
+from __future__ import annotations
+
+import asyncio
+import sys
+import threading
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from ai import PlanResult, PlanningService
+from benchmarks.fake_server import FakeGameServer
+
+
+def test_fake_game_server_round_trip() -> None:
+    """Every game gets a plan per turn and valuation calls are batched."""
+
+    async def scenario() -> dict:
+        from ai import NormalDecisionMaker
+        from benchmarks.synthetic import SyntheticAI
+
+        planner = NormalDecisionMaker(ai=SyntheticAI()).make_plan
+        async with PlanningService(planner, max_workers=2, batch_window=0.01) as service:
+            server = FakeGameServer(service, n_games=6, turns=2)
+            stats = await server.run()
+        assert server.plans_received == {g: 2 for g in range(6)}
+        return stats
+
+    stats = asyncio.run(scenario())
+    assert stats["decisions"] == 12
+    assert stats["decisions_per_second"] > 0
+    assert stats["mean_batch_size"] > 1
+
+
+def test_round_robin_fairness_and_backpressure() -> None:
+    """With one worker, queued games are served in turns and admission is bounded."""
+    order: List[str] = []
+    gate = threading.Event()
+
+    def planner(board_state: str, steps: int) -> PlanResult:
+        gate.wait(timeout=5)
+        order.append(board_state)
+        return PlanResult(actions=[board_state], resulting_state=board_state)
+
+    async def scenario() -> None:
+        async with PlanningService(
+            planner, max_workers=1, max_pending=4, max_pending_per_game=4
+        ) as service:
+            requests = [
+                asyncio.ensure_future(service.request_plan(game, f"{game}{i}", 1))
+                for game, i in [("a", 1), ("a", 2), ("a", 3), ("b", 1), ("b", 2)]
+            ]
+            await asyncio.sleep(0.05)
+            # a1 is running, three more are queued, the fifth waits for admission.
+            assert service.stats()["queued"] == 3
+            assert not requests[-1].done()
+            gate.set()
+            await asyncio.gather(*requests)
+
+    asyncio.run(scenario())
+    assert order == ["a1", "b1", "a2", "b2", "a3"]
+
+
+def test_busy_game_cannot_take_every_admission_slot() -> None:
+    """A game past its per-game cap waits while other games are still admitted."""
+    gate = threading.Event()
+
+    def planner(board_state: str, steps: int) -> PlanResult:
+        gate.wait(timeout=5)
+        return PlanResult(actions=[board_state], resulting_state=board_state)
+
+    async def scenario() -> None:
+        async with PlanningService(planner, max_workers=1, max_pending=4) as service:
+            busy = [
+                asyncio.ensure_future(service.request_plan("a", f"a{i}", 1)) for i in range(6)
+            ]
+            await asyncio.sleep(0.05)
+            # a0 runs and a1 is queued; the other four wait on a's share of two slots.
+            assert service.stats()["queued"] == 1
+            other = asyncio.ensure_future(service.request_plan("b", "b0", 1))
+            await asyncio.sleep(0.05)
+            assert service.stats()["queued"] == 2
+            gate.set()
+            await asyncio.wait_for(asyncio.gather(*busy, other), timeout=5)
+            assert service._game_slots == {}
+
+    asyncio.run(scenario())
+
+
+def test_stop_fails_queued_requests() -> None:
+    """Stopping finishes the running plan and fails everything still queued."""
+    from ai import ServiceStopped
+
+    gate = threading.Event()
+
+    def planner(board_state: str, steps: int) -> PlanResult:
+        gate.wait(timeout=5)
+        return PlanResult(actions=[board_state], resulting_state=board_state)
+
+    async def scenario() -> List[object]:
+        service = PlanningService(planner, max_workers=1, max_pending=2)
+        await service.start()
+        requests = [
+            asyncio.ensure_future(service.request_plan(game, game, 1))
+            for game in ["a", "b", "c", "d"]
+        ]
+        await asyncio.sleep(0.05)
+        # a runs, b is queued, c and d wait for admission.
+        stopping = asyncio.ensure_future(service.stop())
+        await asyncio.sleep(0.05)
+        assert not stopping.done()  # the event loop stays responsive while a runs
+        gate.set()
+        await asyncio.wait_for(stopping, timeout=5)
+        return await asyncio.wait_for(
+            asyncio.gather(*requests, return_exceptions=True), timeout=5
+        )
+
+    results = asyncio.run(scenario())
+    assert results[0].actions == ["a"]
+    assert all(isinstance(result, ServiceStopped) for result in results[1:])
@@ -0,0 +1,124 @@
+"""Tests for Zobrist hashing and the transposition table."""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import FrozenSet, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from ai import TranspositionTable, ZobristHasher, create_plan_beam, state_hash
+from eclipse_ai.evaluator import evaluate_action
+
+HASHER = ZobristHasher(seed=1)
+
+
+class HashedBoardState:
+    """Board made of a set of features with an incrementally updated Zobrist hash."""
+
+    def __init__(self, features: FrozenSet[str] = frozenset(), position: int = 0) -> None:
+        self.features = set(features)
+        self._hash = position
+
+    def apply_action(self, action: str) -> None:
+        """Toggle the feature named by the action and update the hash."""
+        self.features ^= {action}
+        self._hash = HASHER.toggle(self._hash, action)
+
+    def clone(self) -> "HashedBoardState":
+        """Return a copy so planning can simulate future turns."""
+        return HashedBoardState(frozenset(self.features), self._hash)
+
+    def state_hash(self) -> int:
+        """Return the incrementally maintained hash."""
+        return self._hash
+
+
+class OrderingAI:
+    """AI offering every feature not yet on the board."""
+
+    def candidate_actions(self, board_state: HashedBoardState) -> List[str]:
+        """Return the features that can still be added."""
+        return [a for a in ("explore", "influence") if a not in board_state.features]
+
+    def choose_action(self, board_state: HashedBoardState) -> str:
+        """Pick the first available feature."""
+        return self.candidate_actions(board_state)[0]
+
+
+def test_move_order_does_not_change_the_hash() -> None:
+    """Explore-then-influence and influence-then-explore reach the same hash."""
+    a, b = HashedBoardState(), HashedBoardState()
+    a.apply_action("explore")
+    a.apply_action("influence")
+    b.apply_action("influence")
+    b.apply_action("explore")
+
+    assert state_hash(a) == state_hash(b) != 0
+    a.apply_action("influence")
+    assert a.state_hash() == HASHER.key("explore")
+
+
+def test_table_is_bounded_and_prefers_deeper_results() -> None:
+    """Shallower stores never overwrite deeper entries and old entries are evicted."""
+    table = TranspositionTable(max_entries=2)
+    table.store("p1", score=1.0, depth=3, best_action="x")
+    table.store("p1", score=9.0, depth=1)
+    assert table.probe("p1").score == 1.0
+    assert table.probe("p1", min_depth=4) is None
+
+    table.store("p2", score=2.0)
+    table.store("p3", score=3.0)
+    stats = table.stats()
+    assert stats["entries"] == 2
+    assert stats["evictions"] == 1
+    assert stats["hit_rate"] == 0.5
+    assert stats["memory_bytes"] > 0
+
+
+def test_beam_search_scores_each_position_once() -> None:
+    """The table answers repeated (position, action) scoring requests."""
+    calls = []
+
+    def scorer(board_state: HashedBoardState, action: str) -> float:
+        calls.append((board_state.state_hash(), action))
+        return 1.0
+
+    table = TranspositionTable()
+    for _ in range(2):
+        create_plan_beam(OrderingAI(), HashedBoardState(), steps=2, beam_width=2, scorer=scorer, table=table)
+
+    assert len(calls) == len(set(calls))
+    assert table.hits > 0
+
+
+def test_evaluate_action_reuses_table_entries() -> None:
+    """A transposed position returns a copy of the stored Score."""
+    table = TranspositionTable()
+    state = HashedBoardState()
+
+    first = evaluate_action(state, "explore", table=table)
+    second = evaluate_action(state, "explore", table=table)
+
+    assert second == first and second is not first
+    assert table.hits == 1
+
+
+def test_evaluate_action_shares_table_with_planner() -> None:
+    """Planner float entries do not count as Score hits, and hits own their details."""
+    from ai.transposition import cached_score
+
+    table = TranspositionTable()
+    state = HashedBoardState()
+    cached_score(table, lambda s, a: 1.0, state, "explore")
+
+    evaluate_action(state, "explore", table=table)
+    assert (table.hits, table.misses) == (0, 2)
+
+    second = evaluate_action(state, "explore", table=table)
+    second.details["note"] = "mutated"
+    third = evaluate_action(state, "explore", table=table)
+
+    assert table.hits == 2
+    assert "note" not in third.details
+    assert cached_score(table, lambda s, a: 5.0, state, "explore") == 1.0
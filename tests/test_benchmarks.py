@@ -0,0 +1,44 @@
+"""Smoke tests for the valuation benchmark suite and its regression check."""
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from benchmarks.bench_valuation import BENCHMARKS, find_regressions, main, run_suite
+from benchmarks.synthetic import make_actions, make_state
+from eclipse_ai.game_models import ActionType
+
+
+def test_synthetic_generators_cover_every_action_type() -> None:
+    """Generated actions include all six action types and the map has the requested size."""
+    state = make_state(n_hexes=30, n_players=5, seed=3)
+
+    assert len(state.map.hexes) == 30
+    assert len(state.players) == 5
+    assert {a.type for a in make_actions(12)} == set(ActionType)
+
+
+def test_run_suite_reports_every_benchmark() -> None:
+    """Each benchmark produces a positive per-operation time at the requested scale."""
+    report = run_suite(scales=["small"], repeat=1, min_time=0.0)
+
+    assert set(report["results"]) == {f"{name}[small]" for name in BENCHMARKS}
+    assert all(row["us_per_op"] > 0 for row in report["results"].values())
+
+
+def test_regression_threshold(tmp_path: Path) -> None:
+    """A slowdown beyond the threshold is reported and fails the command line."""
+    baseline = {"results": {"create_plan[small]": {"us_per_op": 1e-6}}}
+    current = {"results": {"create_plan[small]": {"us_per_op": 1.3e-6}}}
+    assert [r["key"] for r in find_regressions(current, baseline, threshold=0.2)] == [
+        "create_plan[small]"
+    ]
+    assert find_regressions(current, baseline, threshold=0.5) == []
+
+    path = tmp_path / "baseline.json"
+    path.write_text(json.dumps(baseline))
+    argv = ["--scales", "small", "--benchmarks", "create_plan", "--repeat", "1", "--min-time", "0"]
+    assert main(argv + ["--baseline", str(path)]) == 1
@@ -0,0 +1,115 @@
+"""Tests for the array-backed Eclipse board state."""
+from __future__ import annotations
+
+import copy
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from ai import MCTSDecisionMaker, NegamaxDecisionMaker, create_plan_beam, supports_undo
+from benchmarks.synthetic import SyntheticAction, make_actions, make_scores, make_state
+from eclipse_ai.board import ArrayBoardState, PlayerResources
+from eclipse_ai.game_models import ActionType
+from eclipse_ai.valuation import HexOccupancyIndex, apply_phase_valuation, explain_disabled
+from eclipse_ai.valuation.adapters import adapter_for
+
+
+def test_valuation_matches_source_state() -> None:
+    """Scores read through the array accessors equal those of the original state."""
+    for seed in range(5):
+        source = make_state(n_hexes=15, n_players=4, round_idx=2 + seed, seed=seed)
+        board = ArrayBoardState.from_state(source)
+        assert adapter_for(board) is not None
+        assert board.occupancy_index.pressure("p0") == \
+            HexOccupancyIndex.from_map(source.map).pressure("p0")
+
+        actions = make_actions(18, seed=seed)
+        with explain_disabled():
+            for action, base in zip(actions, make_scores(actions, seed=seed)):
+                expected = apply_phase_valuation(source, action, copy.copy(base)).expected_vp
+                assert apply_phase_valuation(board, action, copy.copy(base)).expected_vp == expected
+
+
+def test_clone_undo_and_hash() -> None:
+    """Clones share nothing, undo restores the buffer and equal boards hash equally."""
+    board = ArrayBoardState.from_state(make_state(n_hexes=6, n_players=2, seed=1))
+    twin = board.clone()
+    assert twin.buf is not board.buf
+    assert twin.state_hash() == board.state_hash()
+
+    build = SyntheticAction(ActionType.BUILD, {"ships": {"cruiser": 1}, "hex": 0})
+    token = twin.apply_action(build)
+    assert twin.state_hash() != board.state_hash()
+    assert twin.ships[0, 0, 1] == board.ships[0, 0, 1] + 1
+    assert twin.player("p0").materials == max(0, board.player("p0").materials - 5)
+
+    twin.undo_action(token)
+    assert np.array_equal(twin.buf, board.buf)
+    assert supports_undo(board)
+
+
+def test_undo_tokens_hold_changed_cells_and_hash_is_incremental() -> None:
+    """Tokens copy a few cells, and the updated hash equals one computed from scratch."""
+    board = ArrayBoardState.from_state(make_state(n_hexes=8, n_players=3, seed=2))
+    start, tokens = board.state_hash(), []
+    for action in make_actions(12, seed=3) + [
+        SyntheticAction(ActionType.MOVE, {"ships": {"interceptor": 1}, "from": 0, "hex": 1}),
+        SyntheticAction(ActionType.EXPLORE),
+    ]:
+        tokens.append(board.apply_action(action))
+        assert sum(old.size for _, old in tokens[-1].cells) <= 13
+        assert board.state_hash() == board.clone().state_hash()
+        fresh = ArrayBoardState(board.player_ids, board._layout.max_hexes, board.buf.copy())
+        assert board.state_hash() == fresh.state_hash()
+    for token in reversed(tokens):
+        board.undo_action(token)
+    assert board.state_hash() == start
+
+    board.ships[0, 0, 0] += 1
+    board.rehash()
+    assert board.state_hash() != start
+
+
+def test_actions_update_arrays() -> None:
+    """Explore, move and alternate-turn bookkeeping act on the flat buffer."""
+    board = ArrayBoardState.new(["a", "b"], max_hexes=4, round_idx=3, alternate=True)
+    board.resources[:] = [10, 8, 5]
+    board.apply_action(SyntheticAction(ActionType.EXPLORE))
+    assert (board.n_hexes, board.active_player) == (1, "b")
+    board.apply_action(SyntheticAction(ActionType.EXPLORE))
+    board.apply_action(SyntheticAction(ActionType.MOVE, {"ships": {"interceptor": 1}, "from": 0, "hex": 1}))
+    assert board.ships[1].tolist() == [[1, 0, 0], [1, 0, 0]]
+    assert board.occupancy_index.counts("a") == (1, 1)
+    assert board.player("b") == PlayerResources(10, 8, 5)
+    assert [h.hex_id for h in board.hexes()] == [0, 1]
+
+
+class BoardAI:
+    """One candidate per action type; plays the first."""
+
+    def candidate_actions(self, board_state: ArrayBoardState):
+        """Return a fixed candidate list."""
+        return make_actions(len(ActionType), seed=board_state.round)
+
+    def choose_action(self, board_state: ArrayBoardState):
+        """Return the first candidate."""
+        return self.candidate_actions(board_state)[0]
+
+
+def test_planners_run_on_array_board() -> None:
+    """The search planners accept the array board as a PlanningBoardState."""
+    board = ArrayBoardState.from_state(make_state(n_hexes=8, n_players=2, seed=2))
+    before = board.buf.copy()
+
+    beam = create_plan_beam(BoardAI(), board, steps=3, beam_width=3)
+    assert len(beam.actions) == 3
+    mcts = MCTSDecisionMaker(ai=BoardAI(), iterations=20, seed=0)
+    assert len(mcts.make_plan(board, steps=2).actions) == 2
+
+    duel = ArrayBoardState.from_state(make_state(n_hexes=8, n_players=2, seed=2), alternate=True)
+    line = NegamaxDecisionMaker(ai=BoardAI(), max_depth=2).search(duel)[1]
+    assert len(line) == 2
+    assert np.array_equal(board.buf, before)
@@ -0,0 +1,92 @@
+"""Tests for the vectorized Monte Carlo combat simulator."""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from benchmarks.synthetic import SyntheticAction, SyntheticHex, SyntheticPieces, make_state
+from eclipse_ai import combat
+from eclipse_ai.evaluator import Score
+from eclipse_ai.game_models import ActionType
+from eclipse_ai.valuation.features import build_features
+
+
+def test_duel_matches_closed_form() -> None:
+    """Interceptor duel: defender shoots first, so the attacker wins 5/11 of the time."""
+    result = combat.simulate_combat({"interceptor": 1}, {"interceptor": 1}, n=20000, seed=3)
+    assert result.win_prob == pytest.approx(5 / 11, abs=0.015)
+    assert result.win_prob + result.loss_prob == pytest.approx(1.0, abs=0.005)  # rare max_rounds draws
+    assert result.attacker_losses["interceptor"] == pytest.approx(result.loss_prob)
+
+
+def test_bigger_fleet_wins_and_losses_are_bounded() -> None:
+    """Dreadnoughts crush interceptors; expected losses never exceed fleet size."""
+    result = combat.simulate_combat({"dreadnought": 2}, {"interceptor": 2}, n=4000)
+    assert result.win_prob > 0.95
+    assert 0.0 <= result.expected_attacker_losses <= 2.0
+    assert result.expected_defender_losses == pytest.approx(2.0, abs=0.05)
+
+
+def test_results_are_cached_by_composition() -> None:
+    """Equivalent fleets (order, zero counts, unknown types) share one cache entry."""
+    combat.clear_cache()
+    first = combat.simulate_combat({"cruiser": 2, "interceptor": 0}, {"starbase": 1}, n=1000)
+    again = combat.simulate_combat({"mothership": 4, "cruiser": 2}, {"starbase": 1}, n=1000)
+    info = combat.cache_info()
+    assert again is first
+    assert (info.hits, info.misses) == (1, 1)
+
+
+def test_empty_fleets() -> None:
+    """Nobody to fight means a walkover for whoever has ships."""
+    assert combat.simulate_combat({"cruiser": 1}, {}).win_prob == 1.0
+    assert combat.simulate_combat({}, {"cruiser": 1}).loss_prob == 1.0
+
+
+def test_move_features_use_simulated_win_prob_when_enabled() -> None:
+    """With simulate_combat, MOVE actions without a combat_win_prob get one from the simulator."""
+    state = make_state(n_hexes=3, n_players=2, seed=1)
+    state.map.hexes[99] = SyntheticHex(99, {"p1": SyntheticPieces(ships={"interceptor": 1})})
+    move = SyntheticAction(ActionType.MOVE, {"ships": {"dreadnought": 2}, "hex": 99})
+
+    details = combat.combat_details(state, move)
+    assert details["combat_win_prob"] > 0.9
+
+    default = build_features(state, move, Score(0.0, 0.0, {}), 0.0, 0.0, 0.0)
+    simulated = build_features(state, move, Score(0.0, 0.0, {}), 0.0, 0.0, 0.0, simulate_combat=True)
+    given = build_features(state, move, Score(0.0, 0.0, {"combat_win_prob": 0.25}), 0.0, 0.0, 0.0,
+                           simulate_combat=True)
+    assert default.fleet_power == 0.0
+    assert simulated.fleet_power == pytest.approx(1.2 * details["combat_win_prob"])
+    assert given.fleet_power == pytest.approx(1.2 * 0.25)
+
+    empty_hex = SyntheticAction(ActionType.MOVE, {"ships": {"dreadnought": 2}, "hex": 12345})
+    assert combat.combat_details(state, empty_hex) == {}
+
+
+def test_starbases_never_attack() -> None:
+    """A starbase in the MOVE payload is dropped from the attacking fleet."""
+    state = make_state(n_hexes=3, n_players=2, seed=1)
+    state.map.hexes[99] = SyntheticHex(99, {"p1": SyntheticPieces(ships={"interceptor": 1})})
+    with_base = SyntheticAction(ActionType.MOVE, {"ships": {"starbase": 3, "interceptor": 1}, "hex": 99})
+    alone = SyntheticAction(ActionType.MOVE, {"ships": {"interceptor": 1}, "hex": 99})
+    only_base = SyntheticAction(ActionType.MOVE, {"ships": {"starbase": 1}, "hex": 99})
+
+    assert combat.combat_details(state, with_base) == combat.combat_details(state, alone)
+    assert combat.combat_details(state, only_base) == {}
+
+
+def test_defenders_read_through_array_board() -> None:
+    """Boards without a map (ArrayBoardState) are read through their hexes() accessor."""
+    from eclipse_ai.board import ArrayBoardState
+
+    board = ArrayBoardState.new(["p0", "p1"], max_hexes=4)
+    board.header[2] = 2  # two explored hexes
+    board.ships[1, 1, 0] = 1  # a rival interceptor on hex 1
+    move = SyntheticAction(ActionType.MOVE, {"ships": {"dreadnought": 2}, "hex": 1})
+
+    assert combat.combat_details(board, move)["combat_win_prob"] > 0.9
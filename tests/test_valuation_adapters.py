@@ -0,0 +1,145 @@
+"""Tests for the per-type compiled state accessors."""
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from eclipse_ai.valuation.adapters import StateAdapter, adapter_for, register_adapter
+from eclipse_ai.valuation.resource_prices import convertible_vp_shadow, infer_round_idx
+
+
+@dataclass
+class Player:
+    """Player with attribute-style resources."""
+
+    materials: int = 0
+    science: int = 0
+    money: int = 0
+
+
+@dataclass
+class DeclaredState:
+    """State whose attributes are declared, so accessors can be compiled."""
+
+    players: Any
+    turn: int = 0
+    active_player: str = "you"
+
+
+class FreeFormState:
+    """State with ad-hoc instance attributes; keeps the duck-typed probing."""
+
+    def __init__(self, **attrs: Any) -> None:
+        self.__dict__.update(attrs)
+
+
+class PackedState:
+    """State read through hand-written accessors."""
+
+    def __init__(self, packed: Dict[str, int]) -> None:
+        self.packed = packed
+
+
+def test_declared_types_are_compiled_once() -> None:
+    """Dataclass states get a cached adapter; free-form classes do not."""
+    state = DeclaredState(players={"you": Player(materials=20, money=4)}, turn=5)
+
+    assert adapter_for(state) is adapter_for(DeclaredState(players={}))
+    assert adapter_for(FreeFormState(round=2)) is None
+    assert infer_round_idx(state) == 5
+    assert infer_round_idx(FreeFormState(round=2)) == 2
+    assert convertible_vp_shadow(state, None, total_rounds=9, round_idx=5) == 6.2
+
+
+def test_compiled_accessors_fall_back_to_probing() -> None:
+    """A value the compiled accessor can't handle uses the legacy probing path."""
+    state = DeclaredState(players=["not", "a", "dict"], turn=0)
+
+    assert infer_round_idx(state, default_round=3) == 3
+    assert convertible_vp_shadow(state, None, total_rounds=9, round_idx=3) == 0.0
+
+
+def test_registered_adapter_is_used() -> None:
+    """Hand-written accessors take precedence for their type."""
+    register_adapter(
+        PackedState,
+        StateAdapter(
+            active_player=lambda s: "you",
+            player=lambda s, pid: {"materials": s.packed["m"]},
+            round_idx=lambda s: s.packed["r"],
+            hexes=lambda s: (),
+        ),
+    )
+    state = PackedState({"m": 30, "r": 8})
+
+    assert infer_round_idx(state) == 8
+    assert convertible_vp_shadow(state, None, total_rounds=9, round_idx=8) == 9.0
+
+
+@dataclass
+class RuntimeMetaState:
+    """Dataclass whose round only appears at runtime, in an undeclared ``meta``."""
+
+    players: Any
+    active_player: str = "you"
+
+    def __post_init__(self) -> None:
+        self.meta = {"round": 6}
+
+
+def test_runtime_attributes_are_still_probed() -> None:
+    """A compiled adapter finding no declared round falls through to the probing."""
+    state = RuntimeMetaState(players={"you": Player()})
+    assert adapter_for(state) is not None
+    assert infer_round_idx(state, default_round=1) == 6
+
+    state.round = 4
+    assert infer_round_idx(state, default_round=1) == 4
+
+
+@dataclass
+class RuntimeFieldsState:
+    """Dataclass whose players and map are only attached at runtime."""
+
+    turn: int = 3
+
+
+@dataclass
+class Pieces:
+    """Ships of one owner on a hex."""
+
+    ships: Dict[str, int]
+
+
+@dataclass
+class Hex:
+    """A map hex with pieces per owner."""
+
+    pieces: Dict[str, Pieces]
+
+
+@dataclass
+class Map:
+    """A map keyed by hex id."""
+
+    hexes: Dict[int, Hex]
+
+
+def test_runtime_players_and_map_are_probed() -> None:
+    """Undeclared players/map/active_player fall back to probing the instance."""
+    from eclipse_ai.valuation.opponent import opponent_pressure_proxy
+
+    state = RuntimeFieldsState()
+    state.active_player = "you"
+    state.players = {"you": Player(materials=20, money=4)}
+    state.map = Map({1: Hex({"you": Pieces({"cruiser": 1}), "rival": Pieces({"interceptor": 2})})})
+
+    assert adapter_for(state) is not None
+    assert convertible_vp_shadow(state, None, total_rounds=9, round_idx=3) == 6.2
+    assert opponent_pressure_proxy(state, None) == pytest.approx(0.8)
@@ -0,0 +1,151 @@
+"""Tests for the batched phase-aware valuation entry point."""
+from __future__ import annotations
+
+import copy
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from eclipse_ai.evaluator import Score
+from eclipse_ai.game_models import ActionType
+from eclipse_ai.valuation import (
+    apply_phase_valuation,
+    apply_phase_valuation_batch,
+    apply_phase_valuation_many,
+    explain_disabled,
+    explain_valuation,
+)
+
+
+@dataclass
+class DummyPlayer:
+    """Player resources as exposed by a typical state object."""
+
+    materials: int = 0
+    science: int = 0
+    money: int = 0
+
+
+@dataclass
+class DummyState:
+    """Minimal state exposing the fields the valuation engine reads."""
+
+    round: int
+    players: Dict[str, DummyPlayer]
+    active_player: str = "you"
+
+
+@dataclass
+class DummyAction:
+    """Action carrying a type and a payload dictionary."""
+
+    type: ActionType
+    payload: Dict[str, Any] = field(default_factory=dict)
+
+
+def _candidates():
+    actions = [
+        DummyAction(ActionType.EXPLORE),
+        DummyAction(ActionType.INFLUENCE),
+        DummyAction(ActionType.RESEARCH, {"tech": "Plasma Cannon"}),
+        DummyAction(ActionType.RESEARCH, {"tech": "Advanced Mining"}),
+        DummyAction(ActionType.BUILD, {"ships": {"interceptor": 2, "dreadnought": 1}}),
+        DummyAction(ActionType.UPGRADE),
+        DummyAction(ActionType.MOVE),
+    ]
+    scores = [
+        Score(expected_vp=0.5 * i, risk=0.1 * i, details={})
+        for i in range(len(actions) - 1)
+    ]
+    scores.append(
+        Score(
+            expected_vp=1.25,
+            risk=0.6,
+            details={"positional": True, "territory_ev": 0.4, "combat_win_prob": 0.7},
+        )
+    )
+    return actions, scores
+
+
+@pytest.mark.parametrize("round_idx", [1, 5, 6, 9])
+def test_batch_matches_scalar_path_exactly(round_idx: int) -> None:
+    """Every batched Score must equal the scalar apply_phase_valuation result."""
+    state = DummyState(
+        round=round_idx,
+        players={"you": DummyPlayer(materials=23, science=9, money=7)},
+    )
+    actions, scores = _candidates()
+
+    scalar = [
+        apply_phase_valuation(state, a, s)
+        for a, s in zip(actions, copy.deepcopy(scores))
+    ]
+    batched = apply_phase_valuation_batch(state, actions, copy.deepcopy(scores))
+
+    assert [s.expected_vp for s in batched] == [s.expected_vp for s in scalar]
+    assert [s.details for s in batched] == [s.details for s in scalar]
+
+
+def test_batch_rejects_mismatched_lengths() -> None:
+    """Actions and base scores are paired one to one."""
+    state = DummyState(round=1, players={})
+    with pytest.raises(ValueError):
+        apply_phase_valuation_batch(state, [DummyAction(ActionType.EXPLORE)], [])
+
+
+def test_explain_disabled_keeps_scores_and_skips_breakdown() -> None:
+    """Without explanations the score is identical and details stay untouched."""
+    state = DummyState(round=4, players={"you": DummyPlayer(materials=12)})
+    actions, scores = _candidates()
+
+    explained = apply_phase_valuation_batch(state, actions, copy.deepcopy(scores))
+    with explain_disabled():
+        quiet = apply_phase_valuation_batch(state, actions, copy.deepcopy(scores))
+        on_demand = explain_valuation(state, actions[-1], copy.deepcopy(scores[-1]))
+
+    assert [s.expected_vp for s in quiet] == [s.expected_vp for s in explained]
+    assert all("valuation" not in s.details for s in quiet)
+    assert on_demand == explained[-1].details
+
+
+def test_many_states_match_per_state_batches() -> None:
+    """Scoring several games in one pass equals scoring each game separately."""
+    states = [
+        DummyState(round=r, players={"you": DummyPlayer(materials=5 * r, money=r)})
+        for r in (1, 6, 6, 9)
+    ]
+    actions, scores = _candidates()
+
+    separate = [apply_phase_valuation_batch(s, actions, copy.deepcopy(scores)) for s in states]
+    together = apply_phase_valuation_many([(s, actions, copy.deepcopy(scores)) for s in states])
+
+    assert [[x.expected_vp for x in game] for game in together] == [
+        [x.expected_vp for x in game] for game in separate
+    ]
+    assert [[x.details for x in game] for game in together] == [
+        [x.details for x in game] for game in separate
+    ]
+
+
+def test_score_matrix_helpers_match_engine_sum() -> None:
+    """feature_matrix/weight_vector/score_matrix reproduce the engine's left-to-right sum."""
+    import numpy as np
+
+    from eclipse_ai.valuation.batch import feature_matrix, score_matrix, weight_vector
+    from eclipse_ai.valuation.features import WEIGHTED, Features
+    from eclipse_ai.valuation.phase import LATE
+
+    rng = np.random.default_rng(3)
+    feats = [Features(*rng.normal(size=8).tolist()) for _ in range(50)]
+    vp_now, M = feature_matrix(feats)
+    scores = score_matrix(vp_now, M, weight_vector(LATE))
+
+    for F, value in zip(feats, scores):
+        expected = F.vp_now + sum(w * f for w, f in zip(LATE.signed(), F[WEIGHTED]))
+        assert value == expected
+    assert feature_matrix([])[1].shape == (0, len(LATE))
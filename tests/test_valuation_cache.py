@@ -0,0 +1,100 @@
+"""Tests for the per-state memoization of state-only valuation terms."""
+from __future__ import annotations
+
+import sys
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from eclipse_ai.valuation import StateCache, state_fingerprint
+
+
+class VersionedState:
+    """State that bumps a version counter on every mutation."""
+
+    def __init__(self) -> None:
+        self.version = 0
+        self.round = 1
+
+    def advance_round(self) -> None:
+        """Mutate the state and bump its version."""
+        self.round += 1
+        self.version += 1
+
+
+class PlainState:
+    """State without a fingerprint or version; never cached."""
+
+    round = 3
+
+
+def test_terms_are_computed_once_per_state_version() -> None:
+    """Repeated lookups hit the cache until the state version changes."""
+    cache = StateCache(maxsize=4)
+    state = VersionedState()
+    calls = []
+
+    def compute() -> int:
+        calls.append(state.round)
+        return state.round
+
+    assert [cache.get_or_compute(state, "round", compute) for _ in range(5)] == [1] * 5
+    assert calls == [1]
+
+    state.advance_round()
+    assert cache.get_or_compute(state, "round", compute) == 2
+    assert calls == [1, 2]
+    assert cache.stats()["hits"] == 4
+    assert cache.stats()["misses"] == 2
+
+
+def test_cache_is_bounded_and_evicts_least_recently_used() -> None:
+    """The cache holds at most `maxsize` states."""
+    cache = StateCache(maxsize=2)
+    states = [VersionedState() for _ in range(3)]
+    for s in states:
+        cache.get_or_compute(s, "round", lambda: 0)
+
+    stats = cache.stats()
+    assert stats["size"] == 2
+    assert stats["evictions"] == 1
+
+
+def test_unversioned_states_are_not_cached() -> None:
+    """Without a version or fingerprint the term is recomputed every time."""
+    cache = StateCache()
+    state = PlainState()
+    calls = []
+    for _ in range(3):
+        cache.get_or_compute(state, "round", lambda: calls.append(1))
+
+    assert state_fingerprint(state) is None
+    assert len(calls) == 3
+    assert cache.stats()["size"] == 0
+
+
+def test_concurrent_lookups_keep_the_lru_and_counters_consistent() -> None:
+    """Threads sharing one cache get correct values and every lookup is counted."""
+    cache = StateCache(maxsize=3)
+    states = [VersionedState() for _ in range(8)]
+    errors = []
+
+    def worker(offset: int) -> None:
+        try:
+            for i in range(2000):
+                state = states[(i + offset) % len(states)]
+                assert cache.get_or_compute(state, "id", lambda: id(state)) == id(state)
+        except Exception as exc:  # collected for the main thread
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = cache.stats()
+    assert errors == []
+    assert stats["hits"] + stats["misses"] == 6 * 2000
+    assert stats["size"] <= 3
@@ -0,0 +1,123 @@
+"""Tests for ValuationConfig.compile() and the evaluator's compiled scorer."""
+from __future__ import annotations
+
+import copy
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from benchmarks.synthetic import make_actions, make_scores, make_state
+from eclipse_ai import evaluator
+from eclipse_ai.valuation import (
+    CompiledValuation,
+    PhaseConfig,
+    ValuationConfig,
+    apply_phase_valuation,
+    explain_disabled,
+)
+from eclipse_ai.valuation.phase import LATE
+from eclipse_ai.valuation.risk import RiskProfile
+
+
+@pytest.mark.parametrize("mode", ["greedy", "balanced", "safe"])
+@pytest.mark.parametrize("explain", [True, False])
+def test_compiled_scorer_matches_engine(mode: str, explain: bool) -> None:
+    """The compiled scorer returns exactly what apply_phase_valuation does."""
+    cfg = ValuationConfig(risk=RiskProfile(mode), explain=explain,
+                          phase=PhaseConfig(late=LATE._replace(map_control=0.9)))
+    scorer = cfg.compile()
+    assert isinstance(scorer, CompiledValuation)
+    for round_idx in (1, 5, 6, 7, 9, 12):
+        state = make_state(n_hexes=10, n_players=3, round_idx=round_idx, seed=round_idx)
+        actions = make_actions(12, seed=round_idx)
+        for action, base in zip(actions, make_scores(actions, seed=round_idx)):
+            expected = apply_phase_valuation(state, action, copy.deepcopy(base), cfg)
+            got = scorer(state, action, copy.deepcopy(base))
+            assert got.expected_vp == expected.expected_vp
+            assert got.details == expected.details
+
+
+def test_env_overrides_are_resolved_at_compile_time(monkeypatch: pytest.MonkeyPatch) -> None:
+    """ECLIPSE_ROUND is read once; a new compile picks up later changes."""
+    state = make_state(round_idx=2, seed=4)
+    action = make_actions(6, seed=4)[2]
+    base = make_scores([action], seed=4)[0]
+
+    scorer = ValuationConfig().compile()
+    early = scorer(state, action, copy.deepcopy(base)).expected_vp
+    monkeypatch.setenv("ECLIPSE_ROUND", "9")
+    assert scorer(state, action, copy.deepcopy(base)).expected_vp == early
+
+    late = ValuationConfig().compile()
+    assert late.round_override == 9
+    assert late(state, action, copy.deepcopy(base)).expected_vp == \
+        apply_phase_valuation(state, action, copy.deepcopy(base)).expected_vp
+
+
+def test_evaluator_reload_and_invalidate() -> None:
+    """evaluate_action keeps one compiled scorer until it is reloaded or invalidated."""
+    state = make_state(round_idx=8, seed=5)
+    action = make_actions(6, seed=5)[0]
+    try:
+        evaluator.invalidate_valuation()
+        with explain_disabled():
+            default = evaluator.evaluate_action(state, action).expected_vp
+            scorer = evaluator._VALUATION
+            assert evaluator.evaluate_action(state, action).expected_vp == default
+            assert evaluator._VALUATION is scorer
+
+            boosted = ValuationConfig(phase=PhaseConfig(late=LATE._replace(econ_growth=5.0)))
+            evaluator.reload_valuation(boosted)
+            assert evaluator.evaluate_action(state, action).expected_vp > default
+
+            evaluator.invalidate_valuation()
+            assert evaluator.evaluate_action(state, action).expected_vp == default
+    finally:
+        evaluator.invalidate_valuation()
+
+
+def test_engine_delegates_to_a_compiled_valuation_per_config(monkeypatch: pytest.MonkeyPatch) -> None:
+    """apply_phase_valuation reuses one compiled scorer until the config or env changes."""
+    from eclipse_ai.valuation.engine import _compiled_for
+
+    state = make_state(round_idx=8, seed=4)
+    action = make_actions(6, seed=4)[2]
+    base = make_scores([action], seed=4)[0]
+    cfg = ValuationConfig(explain=False)
+
+    compiled = _compiled_for(cfg)
+    assert _compiled_for(cfg) is compiled
+    late = apply_phase_valuation(state, action, copy.deepcopy(base), cfg).expected_vp
+
+    monkeypatch.setenv("ECLIPSE_ROUND", "2")
+    early = apply_phase_valuation(state, action, copy.deepcopy(base), cfg).expected_vp
+    assert _compiled_for(cfg) is not compiled
+    assert early != late
+
+    monkeypatch.delenv("ECLIPSE_ROUND")
+    cfg.phase.late = LATE._replace(convertible_vp=5.0)  # edited in place
+    assert apply_phase_valuation(state, action, copy.deepcopy(base), cfg).expected_vp == \
+        cfg.compile()(state, action, copy.deepcopy(base)).expected_vp != late
+
+
+def test_evaluator_table_entries_are_keyed_by_compiled_config() -> None:
+    """A transposition table never serves a Score valued under a previous config."""
+    from ai import TranspositionTable
+
+    state = make_state(round_idx=8, seed=5)
+    state.state_hash = lambda: 7
+    action = "explore"
+    table = TranspositionTable()
+    try:
+        with explain_disabled():
+            evaluator.reload_valuation()
+            default = evaluator.evaluate_action(state, action, table).expected_vp
+            evaluator.reload_valuation(
+                ValuationConfig(phase=PhaseConfig(late=LATE._replace(convertible_vp=5.0))))
+            assert evaluator.evaluate_action(state, action, table).expected_vp > default
+            assert len(table) == 2
+    finally:
+        evaluator.invalidate_valuation()
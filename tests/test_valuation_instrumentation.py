@@ -0,0 +1,77 @@
+"""Tests for the opt-in valuation profiling hooks."""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from eclipse_ai.evaluator import evaluate_action
+from eclipse_ai.game_models import ActionType
+from eclipse_ai.valuation import INSTRUMENTATION, valuation_stats
+
+
+class Action:
+    """Action with a type and no payload."""
+
+    def __init__(self, action_type: ActionType) -> None:
+        self.type = action_type
+        self.payload = {}
+
+
+class BrokenAction:
+    """Action whose type lookup fails inside the valuation engine."""
+
+    @property
+    def type(self) -> ActionType:
+        """Raise to simulate an unexpected schema."""
+        raise RuntimeError("unexpected schema")
+
+
+class State:
+    """State exposing only a round number."""
+
+    round = 2
+
+
+@pytest.fixture
+def instrumentation() -> Iterator[None]:
+    """Enable profiling for one test and restore a clean, disabled default."""
+    INSTRUMENTATION.reset()
+    INSTRUMENTATION.enable()
+    yield
+    INSTRUMENTATION.disable()
+    INSTRUMENTATION.reset()
+
+
+def test_stage_timings_are_recorded(instrumentation: None) -> None:
+    """Every valuation stage gets a call count and a timing."""
+    for _ in range(3):
+        evaluate_action(State(), Action(ActionType.EXPLORE))
+
+    stats = valuation_stats()
+    stages = stats["stages"]
+    for stage in ("infer_round_idx", "convertible_vp_shadow", "opponent_pressure_proxy",
+                  "build_features", "merge_breakdown", "total"):
+        assert stages[stage]["calls"] == 3
+    assert stats["counters"]["valuations"] == 3
+    assert "state_cache" in stats
+
+
+def test_fail_open_fallbacks_are_counted(instrumentation: None) -> None:
+    """A failing engine returns the baseline score and increments the counter."""
+    score = evaluate_action(State(), BrokenAction())
+
+    assert score.expected_vp == 0.0
+    assert valuation_stats()["counters"]["fail_open"] == 1
+
+
+def test_disabled_instrumentation_records_no_timings() -> None:
+    """With profiling off nothing but fail-open counts is collected."""
+    INSTRUMENTATION.reset()
+    evaluate_action(State(), Action(ActionType.EXPLORE))
+
+    assert valuation_stats()["stages"] == {}
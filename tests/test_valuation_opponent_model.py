@@ -0,0 +1,101 @@
+"""Tests for the batched opponent best-response model."""
+from __future__ import annotations
+
+import copy
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from benchmarks.synthetic import make_actions, make_scores, make_state
+from eclipse_ai.board import ArrayBoardState
+from eclipse_ai.valuation import ValuationConfig, apply_phase_valuation
+from eclipse_ai.valuation.opponent_model import (
+    OpponentModel,
+    as_player,
+    softmax,
+    threat_aware_scorer,
+)
+
+ACTIONS = make_actions(12, seed=3)
+SCORES = make_scores(ACTIONS, seed=3)
+
+
+def base_scorer(state, action):
+    """Baseline Score of ``action`` looked up from the fixed candidate list."""
+    return copy.copy(SCORES[ACTIONS.index(action)])
+
+
+def model(**kwargs) -> OpponentModel:
+    """Opponent model over the fixed candidate list."""
+    return OpponentModel(enumerate_actions=lambda state: ACTIONS, base_scorer=base_scorer, **kwargs)
+
+
+@pytest.mark.parametrize("make", [lambda s: s, ArrayBoardState.from_state])
+def test_forecast_scores_every_rival_from_their_seat(make) -> None:
+    """Each rival's values equal scalar valuations with that rival to move."""
+    state = make(make_state(n_hexes=30, n_players=6, round_idx=4, seed=2))
+    forecast = model().forecast(state)
+
+    assert sorted(forecast.replies) == ["p1", "p2", "p3", "p4", "p5"]
+    assert state.active_player == "p0"
+    cfg = ValuationConfig(explain=False)
+    for pid, reply in forecast.replies.items():
+        view = as_player(state, pid)
+        expected = [apply_phase_valuation(view, a, base_scorer(view, a), cfg).expected_vp for a in ACTIONS]
+        assert reply.values.tolist() == expected
+        assert reply.probs.sum() == pytest.approx(1.0)
+        assert reply.best_action is ACTIONS[int(np.argmax(expected))]
+    assert forecast.threat == pytest.approx(sum(r.expected_value for r in forecast.replies.values()))
+
+
+def test_temperature_and_distribution_order() -> None:
+    """Zero temperature is a best response; distributions list likely replies first."""
+    state = make_state(n_hexes=10, n_players=3, seed=1)
+    greedy = model(temperature=0.0).forecast(state)
+    reply = greedy.replies["p1"]
+    assert reply.expected_value == pytest.approx(reply.values.max())
+
+    ranked = model(temperature=0.5).forecast(state).distribution("p1")
+    probs = [p for _, p in ranked]
+    assert probs == sorted(probs, reverse=True)
+    assert greedy.distribution("nobody") == []
+
+    np.testing.assert_allclose(softmax(np.array([1.0, 1.0, 0.0]), 0.0), [0.5, 0.5, 0.0])
+
+
+def test_max_actions_caps_the_batch() -> None:
+    """Only the first max_actions candidates of each rival are scored."""
+    forecast = model(max_actions=4).forecast(make_state(n_players=4, seed=5))
+    assert {len(r.actions) for r in forecast.replies.values()} == {4}
+
+
+def test_threat_aware_scorer_subtracts_threat() -> None:
+    """The planner scorer charges an action with the threat left after it."""
+    state = ArrayBoardState.from_state(make_state(n_hexes=12, n_players=4, seed=6))
+    before = state.buf.copy()
+    m = model()
+    scorer = threat_aware_scorer(lambda s, a: 1.0, m, weight=0.5)
+    action = ACTIONS[0]
+
+    assert scorer(state, action) == pytest.approx(1.0 - 0.5 * m.threat_after(state, action))
+    assert np.array_equal(state.buf, before)
+
+
+def test_rival_views_do_not_share_cached_terms_with_position_only_hash() -> None:
+    """A hash covering positions only still keys cached terms per active player."""
+    state = make_state(n_hexes=10, n_players=3, round_idx=4, seed=5)
+    state.state_hash = lambda: 42  # position-only: identical for every seat
+    cached = ValuationConfig(explain=False)
+    uncached = ValuationConfig(explain=False, use_state_cache=False)
+
+    apply_phase_valuation(state, ACTIONS[0], base_scorer(state, ACTIONS[0]), cached)
+    for pid in ("p1", "p2"):
+        view = as_player(state, pid)
+        for action in ACTIONS:
+            got = apply_phase_valuation(view, action, base_scorer(view, action), cached).expected_vp
+            want = apply_phase_valuation(view, action, base_scorer(view, action), uncached).expected_vp
+            assert got == want
@@ -0,0 +1,137 @@
+"""Tests for the binary decision-record format and memory-mapped replay."""
+from __future__ import annotations
+
+import copy
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from benchmarks.synthetic import make_actions, make_scores, make_state
+from eclipse_ai.game_models import ActionType
+from eclipse_ai.valuation import PhaseConfig, ValuationConfig, apply_phase_valuation, explain_disabled
+from eclipse_ai.valuation.phase import LATE
+from eclipse_ai.valuation.records import (
+    ACTION_TYPES,
+    PayloadOverflow,
+    RecordWriter,
+    decode_payload,
+    encode_record,
+    open_records,
+    rescore,
+    tuning_set,
+)
+from eclipse_ai.valuation.tuning import extract_features
+
+
+def _decisions(n_states: int = 4):
+    """(state, action, base_score) triples over several rounds."""
+
+    out = []
+    for round_idx in range(1, n_states + 1):
+        state = make_state(n_hexes=10, n_players=3, round_idx=2 * round_idx, seed=round_idx)
+        actions = make_actions(8, seed=round_idx)
+        out.extend((state, a, s) for a, s in zip(actions, make_scores(actions, seed=round_idx)))
+    return out
+
+
+def test_write_and_memmap_roundtrip(tmp_path: Path) -> None:
+    """Rows written in small chunks are read back in order through a memmap."""
+
+    path = str(tmp_path / "games.rec")
+    decisions = _decisions()
+    with RecordWriter(path, chunk=5) as writer:
+        for i, (state, action, base) in enumerate(decisions):
+            writer.append(state, action, base, outcome=float(i))
+
+    rows = open_records(path)
+    assert isinstance(rows, np.memmap)
+    assert len(rows) == len(decisions)
+    np.testing.assert_array_equal(rows["outcome"], np.arange(len(decisions), dtype=np.float64))
+    for row, (state, action, base) in zip(rows, decisions):
+        assert ACTION_TYPES[row["action_type"]] == action.type
+        assert row["round"] == state.round
+        assert row["base_vp"] == base.expected_vp
+        assert tuple(row["resources"]) == (
+            state.players["p0"].materials, state.players["p0"].science, state.players["p0"].money)
+        if action.type == ActionType.RESEARCH:
+            assert decode_payload(row["payload"]) == action.payload
+
+
+def test_append_to_existing_file(tmp_path: Path) -> None:
+    """Reopening a record file appends after the existing rows."""
+
+    path = str(tmp_path / "games.rec")
+    decisions = _decisions(2)
+    for chunk in (decisions[:5], decisions[5:]):
+        with RecordWriter(path) as writer:
+            for state, action, base in chunk:
+                writer.append(state, action, base)
+    rows = open_records(path)
+    assert len(rows) == len(decisions)
+    assert np.isnan(rows["outcome"]).all()
+
+
+def test_bad_header_is_rejected(tmp_path: Path) -> None:
+    """Files without the record header raise ValueError instead of misreading."""
+
+    path = tmp_path / "junk.rec"
+    path.write_bytes(b"not a record file" * 8)
+    with pytest.raises(ValueError):
+        open_records(str(path))
+    with pytest.raises(ValueError):
+        RecordWriter(str(path))
+
+
+def test_rescore_matches_engine(tmp_path: Path) -> None:
+    """Re-scoring stored features equals apply_phase_valuation bit for bit."""
+
+    path = str(tmp_path / "games.rec")
+    decisions = _decisions()
+    with RecordWriter(path) as writer:
+        for state, action, base in decisions:
+            writer.append(state, action, base)
+    rows = open_records(path)
+
+    for cfg in (ValuationConfig(), ValuationConfig(phase=PhaseConfig(late=LATE._replace(fleet_power=2.0)))):
+        with explain_disabled():
+            expected = [apply_phase_valuation(s, a, copy.copy(b), cfg).expected_vp for s, a, b in decisions]
+        assert rescore(rows, cfg, chunk=7).tolist() == expected
+
+
+def test_tuning_set_from_records(tmp_path: Path) -> None:
+    """Records with outcomes feed the tuning harness like in-memory datasets."""
+
+    path = str(tmp_path / "games.rec")
+    decisions = _decisions()
+    with RecordWriter(path) as writer:
+        for i, (state, action, base) in enumerate(decisions):
+            writer.append(state, action, base, outcome=float(i % 3))
+    data = tuning_set(open_records(path))
+    expected = extract_features([(s, a, b, float(i % 3)) for i, (s, a, b) in enumerate(decisions)])
+    for a, b in zip(data, expected):
+        np.testing.assert_array_equal(a, b)
+
+
+def test_multi_ship_payload_roundtrip_and_overflow(tmp_path: Path) -> None:
+    """Ordinary payloads survive the round trip; oversized ones are counted, not lost silently."""
+
+    from benchmarks.synthetic import SyntheticAction
+
+    state, _, base = _decisions(1)[0]
+    build = SyntheticAction(ActionType.BUILD, {"ships": {"dreadnought": 1, "interceptor": 2}})
+    huge = SyntheticAction(ActionType.BUILD, {"note": "x" * 200})
+    path = str(tmp_path / "ships.rec")
+    with RecordWriter(path) as writer:
+        writer.append(state, build, base)
+        writer.append(state, huge, base)
+    assert writer.payload_overflows == 1
+
+    rows = open_records(path)
+    assert decode_payload(rows[0]["payload"]) == build.payload
+    assert decode_payload(rows[1]["payload"]) == {}
+    with pytest.raises(PayloadOverflow):
+        encode_record(state, huge, base)
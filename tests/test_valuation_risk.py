@@ -0,0 +1,106 @@
+"""Tests for distributional (CVaR) risk scoring."""
+from __future__ import annotations
+
+import copy
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from benchmarks.synthetic import make_actions, make_scores, make_state
+from eclipse_ai.evaluator import Score
+from eclipse_ai.valuation import (
+    ValuationConfig,
+    apply_phase_valuation,
+    apply_phase_valuation_batch,
+    explain_disabled,
+)
+from eclipse_ai.valuation.risk import (
+    RiskProfile,
+    cvar_penalties,
+    distribution_stats,
+    penalty_from_scalar_risk,
+    risk_multiplier,
+    risk_penalties,
+    risk_penalty,
+    sample_matrix,
+)
+
+
+def test_distribution_stats_match_reference() -> None:
+    """Vectorized stats over ragged rows equal per-row NumPy computations."""
+    rng = np.random.default_rng(0)
+    rows = [rng.normal(size=n) for n in (1, 7, 20, 33)]
+    stats = distribution_stats(sample_matrix(rows), alpha=0.2, qs=(0.1, 0.5))
+    for i, row in enumerate(rows):
+        tail = np.sort(row)[: max(1, int(np.ceil(0.2 * row.size)))]
+        assert stats.mean[i] == pytest.approx(row.mean())
+        assert stats.var[i] == pytest.approx(row.var())
+        assert stats.quantiles[i] == pytest.approx(np.quantile(row, (0.1, 0.5)))
+        assert stats.cvar[i] == pytest.approx(tail.mean())
+
+
+def test_coin_flip_is_riskier_than_sure_thing() -> None:
+    """Same mean, different spread: only the coin flip is penalized, more so when safe."""
+    coin, sure = [0.0, 2.0] * 50, [1.0] * 100
+    balanced = cvar_penalties([coin, sure], RiskProfile("balanced"))
+    assert balanced[0] == pytest.approx(risk_multiplier(RiskProfile("balanced")))
+    assert balanced[1] == 0.0
+    assert cvar_penalties([coin], RiskProfile("greedy"))[0] == 0.0
+    assert cvar_penalties([coin], RiskProfile(cvar_alpha=0.75))[0] == pytest.approx(0.35 / 3)
+
+
+def test_sampled_penalties_share_the_scalar_scale() -> None:
+    """A 0/6 VP coin flip costs at most a certain-loss scalar risk, not raw VP."""
+    profile = RiskProfile("balanced")
+    battle = Score(3.0, 0.0, {}, samples=[0.0, 6.0] * 50)
+    hedged = Score(3.0, 0.0, {}, samples=(x for x in [2.5, 3.5] * 50))
+    scalar = Score(3.0, 0.9, {})
+    penalties = risk_penalties([battle, hedged, scalar], profile)
+    assert penalties[0] == pytest.approx(penalty_from_scalar_risk(1.0, profile))
+    assert penalties[1] == pytest.approx(penalty_from_scalar_risk(0.5 / 3, profile))
+    assert penalties[2] == penalty_from_scalar_risk(0.9, profile)
+    assert penalties[2] < penalties[0] and penalties[1] < penalties[2]
+
+
+def test_scores_without_samples_keep_scalar_penalty() -> None:
+    """No samples (or an empty array) means the legacy scalar risk mapping."""
+    profile = RiskProfile("safe")
+    plain = Score(1.0, 0.4, {})
+    empty = Score(1.0, 0.4, {}, samples=[])
+    sampled = Score(1.0, 0.4, {}, samples=[0.0, 2.0])
+    expected = penalty_from_scalar_risk(0.4, profile)
+    assert risk_penalty(plain, profile) == risk_penalty(empty, profile) == expected
+    assert risk_penalties([plain, sampled, empty], profile) == [
+        expected, risk_penalty(sampled, profile), expected]
+
+
+def test_batch_and_compiled_paths_match_scalar_engine() -> None:
+    """Sampled Scores score identically through every valuation entry point."""
+    rng = np.random.default_rng(1)
+    state = make_state(n_hexes=10, n_players=3, round_idx=5, seed=1)
+    actions = make_actions(18, seed=1)
+    scores = make_scores(actions, seed=1)
+    for i, score in enumerate(scores):
+        if i % 2:
+            score.samples = rng.normal(score.expected_vp, 1.0 + i, size=10 + 3 * i)
+
+    cfg = ValuationConfig(risk=RiskProfile("safe"))
+    with explain_disabled():
+        scalar = [apply_phase_valuation(state, a, copy.deepcopy(s), cfg).expected_vp
+                  for a, s in zip(actions, scores)]
+        batch = apply_phase_valuation_batch(state, actions, copy.deepcopy(scores), cfg)
+        compiled = [cfg.compile()(state, a, copy.deepcopy(s)).expected_vp for a, s in zip(actions, scores)]
+    assert [s.expected_vp for s in batch] == scalar
+    assert compiled == scalar
+
+    plain = [copy.deepcopy(s) for s in scores]
+    for s in plain:
+        s.samples = None
+    with explain_disabled():
+        riskless = [apply_phase_valuation(state, a, s, cfg).expected_vp for a, s in zip(actions, plain)]
+    assert riskless[0::2] == scalar[0::2]
+    assert riskless[1::2] != scalar[1::2]
@@ -0,0 +1,65 @@
+"""Tests for the incremental hex occupancy index behind opponent pressure."""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from benchmarks.synthetic import make_actions, make_state
+from eclipse_ai.valuation import HexOccupancyIndex
+from eclipse_ai.valuation.opponent import opponent_pressure_proxy
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_index_matches_full_map_scan(seed: int) -> None:
+    """The O(1) indexed pressure equals the map scan, also after incremental updates."""
+    state = make_state(n_hexes=40, n_players=4, seed=seed, indexed=True)
+    scanned = make_state(n_hexes=40, n_players=4, seed=seed)
+    assert opponent_pressure_proxy(state, None) == opponent_pressure_proxy(scanned, None)
+
+    for action in make_actions(12, seed=seed):
+        state.apply_action(action)
+        scanned.apply_action(action)
+    assert opponent_pressure_proxy(state, None) == opponent_pressure_proxy(scanned, None)
+
+
+def test_contested_hexes_track_moves_and_builds() -> None:
+    """Moving into an enemy hex contests it; moving out clears it."""
+    index = HexOccupancyIndex()
+    index.set_presence("home", "you", ships=2)
+    index.set_presence("rift", "rival", ships=0, starbase=1)
+    assert index.pressure("you") == pytest.approx(0.2)
+
+    index.move_ships("home", "rift", "you", 1)
+    assert index.contested("you") == {"rift"}
+    assert index.pressure("you") == pytest.approx(0.5)
+
+    index.move_ships("rift", "home", "you", 1)
+    assert index.occupied("you") == {"home"}
+    assert index.contested("you") == set()
+
+
+def test_pressure_within_rings_on_axial_map() -> None:
+    """Hostile ships two rings away only count once k reaches two."""
+    index = HexOccupancyIndex()
+    index.set_presence((0, 0), "you", ships=1)
+    index.set_presence((2, 0), "rival", ships=3)
+
+    assert index.pressure_within("you", 0) == index.pressure("you") == pytest.approx(0.2)
+    assert index.pressure_within("you", 1) == pytest.approx(0.2)
+    assert index.pressure_within("you", 2) == pytest.approx(0.8)
+
+
+def test_move_ships_never_creates_ships() -> None:
+    """Moving more ships than present only moves what is there."""
+    index = HexOccupancyIndex()
+    index.set_presence("home", "you", ships=2)
+
+    assert index.move_ships("home", "rift", "you", 5) == 2
+    assert (index.ships("home", "you"), index.ships("rift", "you")) == (0, 2)
+    assert index.occupied("you") == {"rift"}
+    assert index.move_ships("home", "rift", "you", 1) == 0
+    assert index.ships("rift", "you") == 2
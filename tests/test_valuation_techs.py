@@ -0,0 +1,42 @@
+"""Tests for the precompiled tech classification registry."""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from eclipse_ai.valuation.techs import TECHS, lookup_tech
+
+
+def test_ion_only_matches_whole_words() -> None:
+    """'ion' no longer classifies Fusion Source as a combat tech."""
+    assert lookup_tech("Fusion Source").combat == 0.0
+    assert lookup_tech("Ion Turret").combat == 1.0
+    assert lookup_tech("Plasma Cannon") == TECHS["plasma cannon"]
+
+
+def test_name_variants_share_one_profile() -> None:
+    """Display names, ids and spacing variants resolve to the canonical entry."""
+    profile = lookup_tech("Advanced Mining")
+
+    assert profile.tech_id == "advanced_mining"
+    assert (profile.econ, profile.combat, profile.tier) == (1.0, 0.0, 2)
+    assert lookup_tech("advanced_mining") is profile
+    assert lookup_tech("  ADVANCED-mining ") is profile
+
+
+def test_unknown_names_fall_back_to_keyword_rules() -> None:
+    """Techs outside the registry are classified once with the same rules."""
+    profile = lookup_tech("Experimental Shield Matrix")
+
+    assert (profile.combat, profile.tier) == (1.0, 0)
+    assert lookup_tech("").tech_id == ""
+
+
+
+def test_weapons_and_computers_are_combat_techs() -> None:
+    """Cannons, computers and bombs count as combat, not only the named materials."""
+    for name in ("antimatter_cannon", "gluon_computer", "neutron_bombs", "Positron Computer"):
+        assert lookup_tech(name).combat == 1.0, name
+    assert lookup_tech("Quantum Grid").combat == 0.0
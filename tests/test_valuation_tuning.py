@@ -0,0 +1,87 @@
+"""Tests for the vectorized phase-weight sweep and tuning harness."""
+from __future__ import annotations
+
+import copy
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from benchmarks.synthetic import make_actions, make_scores, make_state
+from eclipse_ai.valuation import PhaseConfig, ValuationConfig, apply_phase_valuation, explain_disabled
+from eclipse_ai.valuation.phase import EARLY, LATE, weights_for_round
+from eclipse_ai.valuation.tuning import (
+    extract_features,
+    fit_weights,
+    grid_search,
+    random_grid,
+    sweep,
+    to_theta,
+)
+
+
+TARGET_EARLY = EARLY._replace(econ_growth=0.5, tech_power=0.9)
+TARGET_LATE = LATE._replace(convertible_vp=0.6, fleet_power=0.2)
+
+
+def _records(cfg: ValuationConfig, n_states: int = 9):
+    """(state, action, base_score, outcome) records labelled by `cfg`'s weights."""
+
+    records = []
+    with explain_disabled():
+        for round_idx in range(1, n_states + 1):
+            state = make_state(n_hexes=8, n_players=3, round_idx=round_idx, seed=round_idx)
+            actions = make_actions(12, seed=round_idx)
+            for action, base in zip(actions, make_scores(actions, seed=round_idx)):
+                outcome = apply_phase_valuation(state, action, copy.copy(base), cfg).expected_vp
+                records.append((state, action, base, outcome))
+    return records
+
+
+def test_phase_config_weight_override() -> None:
+    """PhaseConfig.early/late replace the module weights for every round."""
+
+    cfg = PhaseConfig(early=TARGET_EARLY, late=TARGET_LATE)
+    assert weights_for_round(1, cfg) == TARGET_EARLY
+    assert weights_for_round(9, cfg) == TARGET_LATE
+    assert weights_for_round(1, PhaseConfig()) == EARLY
+
+
+def test_sweep_matches_engine_predictions() -> None:
+    """The weights that generated the outcomes have (numerically) zero loss."""
+
+    cfg = ValuationConfig(phase=PhaseConfig(early=TARGET_EARLY, late=TARGET_LATE))
+    data = extract_features(_records(cfg))
+    losses = sweep(data, np.vstack([to_theta(TARGET_EARLY, TARGET_LATE), to_theta()]))
+    assert losses[0] < 1e-20
+    assert losses[1] > 1e-6
+
+
+def test_fit_weights_reduces_loss() -> None:
+    """Coordinate descent and grid search both improve on the default weights."""
+
+    cfg = ValuationConfig(phase=PhaseConfig(early=TARGET_EARLY, late=TARGET_LATE))
+    data = extract_features(_records(cfg))
+
+    fitted = fit_weights(data)
+    assert fitted.loss < 0.05 * fitted.baseline_loss
+    assert fitted.phase_config().early == fitted.early
+
+    searched = grid_search(data, random_grid(count=2000, seed=1))
+    assert searched.loss <= searched.baseline_loss
+
+
+def test_feature_cache_roundtrip(tmp_path: Path) -> None:
+    """Extraction is cached to disk and reused only while the key matches."""
+
+    cache = str(tmp_path / "features.npz")
+    records = _records(ValuationConfig(), n_states=3)
+    first = extract_features(records, cache_path=cache, cache_key="v1")
+    cached = extract_features([], cache_path=cache, cache_key="v1")
+    for a, b in zip(first, cached):
+        np.testing.assert_array_equal(a, b)
+
+    stale = extract_features([], cache_path=cache, cache_key="v2")
+    assert stale.outcome.size == 0